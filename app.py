@@ -7,6 +7,7 @@ from configurations.app_config import AppConfig
 from controllers.main_controller import MainController
 from views.main_view import MainView
 from utils.threads import safe_thread_queue
+from utils.observer_publisher import notification_dispatcher
 
 
 class AppView(ctk.CTk):
@@ -60,6 +61,8 @@ class AppController:
         self.view: AppView = AppView()
 
         self.view.protocol("WM_DELETE_WINDOW", self.close_application)
+        # Deliver the notifications of the worker threads on the main loop
+        notification_dispatcher.bind(self.view)
         self.initialize_controller()
 
     def initialize_controller(self) -> None:
@@ -74,6 +77,7 @@ class AppController:
         """
         # TODO: if messagebox.askokcancel(title="Warning", message="Close application?"):
         safe_thread_queue.stop_worker()
+        notification_dispatcher.unbind()
         self.view.destroy()
         sys.exit(0)
 
@@ -0,0 +1,104 @@
+""" Benchmark of the column classification of the CSVDataManager against the
+    previous implementation, which determined the unique values of every column. """
+
+import argparse
+import timeit
+from typing import Literal
+import numpy as np
+import pandas as pd
+from models.csv_data_manager import is_constant_column
+
+
+def classify_with_unique(data_frame: pd.DataFrame) -> list[Literal[0, 1, 2]]:
+    """
+    Classify the columns like the previous implementation of get_classified_headers.
+
+    Args:
+        data_frame (pd.DataFrame): The data to classify.
+
+    Returns:
+        list[Literal[0, 1, 2]]: The classification of each column.
+    """
+    data_frame_copy: pd.DataFrame = data_frame.copy()
+
+    classification: list[Literal[0, 1, 2]] = []
+    for column in data_frame_copy.columns:
+        unique_values = data_frame_copy[column].unique()
+        classification.append(
+            0 if len(unique_values) > 1 else 1 if unique_values[0] == 0 else 2
+        )
+
+    return classification
+
+
+def classify_with_early_exit(data_frame: pd.DataFrame) -> list[Literal[0, 1, 2]]:
+    """
+    Classify the columns like the current implementation of the CSVDataManager.
+
+    Args:
+        data_frame (pd.DataFrame): The data to classify.
+
+    Returns:
+        list[Literal[0, 1, 2]]: The classification of each column.
+    """
+    classification: list[Literal[0, 1, 2]] = []
+    for column in data_frame.columns:
+        values: np.ndarray = data_frame[column].to_numpy()
+        if is_constant_column(values, values[0]):
+            classification.append(1 if values[0] == 0 else 2)
+        else:
+            classification.append(0)
+
+    return classification
+
+
+def create_data_frame(nr_of_rows: int, nr_of_columns: int) -> pd.DataFrame:
+    """
+    Create a data frame with a mix of not constant, constant zero and constant columns.
+
+    Args:
+        nr_of_rows (int): The number of rows.
+        nr_of_columns (int): The number of columns.
+
+    Returns:
+        pd.DataFrame: The created data frame.
+    """
+    rng: np.random.Generator = np.random.default_rng(0)
+    columns: dict[str, np.ndarray] = {}
+    for index in range(nr_of_columns):
+        if index % 3 == 0:
+            columns[f"signal_{index}"] = rng.random(nr_of_rows)
+        elif index % 3 == 1:
+            columns[f"signal_{index}"] = np.zeros(nr_of_rows)
+        else:
+            columns[f"signal_{index}"] = np.full(nr_of_rows, float(index))
+
+    return pd.DataFrame(columns)
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data_frame: pd.DataFrame = create_data_frame(args.rows, args.columns)
+
+    assert classify_with_unique(data_frame) == classify_with_early_exit(data_frame)
+
+    for name, function in (
+        ("unique", classify_with_unique),
+        ("early exit", classify_with_early_exit),
+    ):
+        seconds: float = min(
+            timeit.repeat(lambda: function(data_frame), number=1, repeat=args.repeat)
+        )
+        print(f"{name:>10}: {seconds:.3f} s ({args.rows} rows x {args.columns} columns)")
+
+
+if __name__ == "__main__":
+    main()
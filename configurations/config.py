@@ -17,6 +17,14 @@ class Config:
         NR_OF_FILES_TO_SAVE: int = 10
         FILE_PATHS_FILE_TYPES: list[tuple[str, str]] = [("CSV", "*.csv*")]
         FILE_PATHS_INITIAL_DIR: str = "/"
+        READ_CHUNK_SIZE: int = 10_000
+        OPTIMIZE_DTYPES: bool = True
+        DTYPE_SAMPLE_SIZE: int = 1_000
+        PYARROW_MIN_FILE_SIZE: int = 50 * 1024**2  # In bytes
+
+        CACHE_DIR: str = "resources/cache"
+        CACHE_MAX_SIZE: int = 10 * 1024**3  # In bytes
+        CACHE_MAX_AGE: float = 30 * 24 * 60 * 60  # In seconds
 
         USER_SETTINGS: str = "resources/yaml-files/user_settings.yaml"
 
@@ -23,6 +23,15 @@ class FileHandlerConfig:
             Config.General.FILE_PATHS_FILE_TYPES
         )
         FILE_PATHS_INITIAL_DIR: str = Config.General.FILE_PATHS_INITIAL_DIR
+        READ_CHUNK_SIZE: int = Config.General.READ_CHUNK_SIZE
+        OPTIMIZE_DTYPES: bool = Config.General.OPTIMIZE_DTYPES
+        DTYPE_SAMPLE_SIZE: int = Config.General.DTYPE_SAMPLE_SIZE
+        PYARROW_MIN_FILE_SIZE: int = Config.General.PYARROW_MIN_FILE_SIZE
+        USER_SETTINGS: str = Config.General.USER_SETTINGS
+
+        CACHE_DIR: str = Config.General.CACHE_DIR
+        CACHE_MAX_SIZE: int = Config.General.CACHE_MAX_SIZE
+        CACHE_MAX_AGE: float = Config.General.CACHE_MAX_AGE
 
     class Layout:
         """
@@ -20,11 +20,6 @@ class HeaderListConfig:
 
         USER_SETTINGS: str = Config.General.USER_SETTINGS
 
-        # TODO: Add this to the settings
-        INITIAL_NR_OF_GROUPS: int = 20
-        INITIAL_NR_OF_BUTTONS_PER_GROUP: int = 10
-        MAX_BUTTONS_PER_GROUP: int = 20
-
     class Layout:
         """
         Layout.
@@ -44,16 +39,6 @@ class HeaderListConfig:
             "expand": True,
             "padx": (7, 7),
             "pady": (1, 1),
-            "column": 0,
-            "column_weight": 1,
-        }
-
-        HEADER_SCROLLABLEFRAME_WIDGETS: dict[str, str | tuple[int, int]] = {
-            "sticky": "nsew",
-            "label_padx": (7, 7),
-            "label_pady": (1, 1),
-            "button_padx": (2, 2),
-            "button_pady": (0, 3),
         }
 
     class Texts:
@@ -84,6 +69,11 @@ class HeaderListConfig:
             "size": Config.Typography.NORMAL_SIZE,
             "weight": "bold",
             "label_anchor": "w",
+            # A button of 25 pixels and 3 pixels space to the next row
+            "row_height": 28,
+            "row_padx": 2,
+            # Rows above and below the visible ones, which get a widget in advance
+            "overscan": 2,
         }
 
         HEADER_SCROLLABLEFRAME_WIDGETS: dict[str, str | int] = {
@@ -93,6 +83,4 @@ class HeaderListConfig:
             "label_anchor": "w",
             "button_height": 25,
             "button_corner_radius": 7,
-            "initial_nr_of_groups": 20,
-            "initial_nr_of_buttons_per_group": 10,
         }
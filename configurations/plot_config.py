@@ -0,0 +1,59 @@
+"""Plot configuration file."""
+
+
+class PlotConfig:
+    """
+    Contains classes that define the specific configurations of the plot.
+    """
+
+    class General:
+        """
+        General configurations.
+        """
+
+        # Every bin keeps its minimum and maximum, so at most two points per pixel are plotted
+        BINS_PER_PIXEL: float = 1.0
+        # Copies of the plot below the topmost traces, so removing one of them only draws the traces above it
+        MAX_BLIT_SNAPSHOTS: int = 16
+        # The memory of the points of the hidden traces, which are kept to be shown again
+        MAX_POOLED_TRACES_SIZE: int = 32 * 1024 * 1024
+
+    class Widgets:
+        """
+        Arguments with values of each single widget.
+        """
+
+        LINE: dict[str, float] = {
+            "linewidth": 1.0,
+        }
+
+        # The line properties of each plot type, every type sets all of them,
+        # so a trace can change its type. The points of "Stem" are drawn as stems.
+        PLOT_TYPES: dict[str, dict[str, str | float]] = {
+            "Plot": {
+                "linestyle": "-",
+                "drawstyle": "default",
+                "marker": "None",
+            },
+            "Scatter": {
+                "linestyle": "None",
+                "drawstyle": "default",
+                "marker": ".",
+            },
+            "Bar": {
+                "linestyle": "-",
+                "drawstyle": "steps-mid",
+                "marker": "None",
+            },
+            "Stem": {
+                "linestyle": "-",
+                "drawstyle": "default",
+                "marker": "None",
+            },
+        }
+
+        CROSSHAIR: dict[str, str | float] = {
+            "color": "#6C6C6C",
+            "linewidth": 0.8,
+            "linestyle": "--",
+        }
@@ -30,6 +30,12 @@ class StatusbarConfig:
             "pady": (1, 1),
         }
 
+        MEMORY_SAVED_LABEL: dict[str, str | tuple[int, int]] = {
+            "side": "left",
+            "padx": (20, 0),
+            "pady": (1, 1),
+        }
+
         PROGRESSBAR: dict[str, str | tuple[int, int]] = {
             "side": "right",
             "padx": (20, 40),
@@ -53,6 +59,12 @@ class StatusbarConfig:
             "size": Config.Typography.NORMAL_SIZE,
         }
 
+        MEMORY_SAVED_LABEL: dict[str, str | int] = {
+            "text": "",
+            "family": Config.Typography.DEFAULT_FAMILY,
+            "size": Config.Typography.NORMAL_SIZE,
+        }
+
         PROGRESSBAR: dict[str, int] = {
             "width": 310,
         }
@@ -66,16 +66,10 @@ class MainController(SimpleObserver):
             else:
                 self.view.hide_sidebar()
         if simple_publisher == progress_state_publisher:
-            if (
-                progress_state_publisher.value
-                == ProgressStatePublisher.START_PROGRESSBAR
-            ):
+            if simple_publisher.value == ProgressStatePublisher.START_PROGRESSBAR:
                 # TODO: Disable / hide / overlay / ... user input widgets
                 pass
-            elif (
-                progress_state_publisher.value
-                == ProgressStatePublisher.STOP_PROGRESSBAR
-            ):
+            elif simple_publisher.value == ProgressStatePublisher.STOP_PROGRESSBAR:
                 # TODO: Enable / show / remove overlay / ... user input widgets
                 pass
 
@@ -1,12 +1,461 @@
-"""Defines the PlotFrameController class with the plot frame functionality."""
+"""Defines the PlotController class with the plot frame functionality."""
 
-import customtkinter as ctk
+import tkinter as tk
+from pathlib import Path
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import LocationEvent, MouseEvent
+from matplotlib.legend import Legend
+from matplotlib.lines import Line2D
+from configurations.plot_config import PlotConfig
+from models.csv_data_manager import CSVDataManager, csv_data_manager
+from models.csv_dataset_manager import csv_dataset_manager
+from utils.blit_manager import BlitManager
+from utils.level_of_detail import DecimatedSignal
+from utils.observer_publisher import (
+    SimpleObserver,
+    SimplePublisher,
+    header_selection_publisher,
+    header_state_publisher,
+)
+from utils.redraw_scheduler import RedrawScheduler
+from utils.trace_pool import Trace, TracePool
+from views.plot_frame_view import PlotView
 
+# A trace of the plot, (file path, column)
+TraceKey = tuple[str, str]
+# A trace of the pool, (file path, column, plot type)
+PoolKey = tuple[str, str, str]
 
-class PlotController:
+
+class PlotController(SimpleObserver):
     """
     Functionality of the plot frame.
+
+    Every selected column is plotted as a trace of each file containing it. A trace shows at most
+    two points per pixel of the axes, which are decimated from the full resolution column again
+    whenever the x-range or the size of the axes changes, e.g. by zooming and panning. Long columns
+    are decimated from their min/max pyramid, so this does not depend on the number of samples.
+
+    Removed traces are hidden and kept in a pool per plot type, see `TracePool`, so showing them
+    again reuses their lines and points.
+
+    The traces, the crosshair and the legend are blitted on top of the cached axes, see `BlitManager`,
+    so toggling a trace or moving the crosshair does not draw the whole figure again. All redraws
+    are coalesced to at most one per frame, see `RedrawScheduler`.
     """
 
-    def __init__(self, view: ctk.CTkFrame) -> None:
-        self.__view: ctk.CTkFrame = view
+    __slots__ = (
+        "view",
+        "axes",
+        "traces",
+        "trace_pool",
+        "blit_manager",
+        "crosshair",
+        "legend",
+        "legend_visible",
+        "plot_type",
+        "redraw_scheduler",
+        "resize_event",
+    )
+
+    def __init__(self, view: PlotView) -> None:
+        self.view: PlotView = view
+
+        self.axes: Axes = self.view.figure.add_subplot()
+        # The shown traces of the current plot type
+        self.traces: dict[TraceKey, Trace] = {}
+        self.trace_pool: TracePool = TracePool(
+            PlotConfig.General.MAX_POOLED_TRACES_SIZE
+        )
+
+        # The traces and overlays are redrawn on top of the cached axes, grid and labels
+        self.blit_manager: BlitManager = BlitManager(
+            self.view.canvas,
+            self.axes.bbox,
+            PlotConfig.General.MAX_BLIT_SNAPSHOTS,
+        )
+
+        # Added to the figure, so they do not count for the limits of the axes
+        self.crosshair: tuple[Line2D, Line2D] = (
+            Line2D(
+                [0, 0],
+                [0, 1],
+                transform=self.axes.get_xaxis_transform(),
+                visible=False,
+                **PlotConfig.Widgets.CROSSHAIR,
+            ),
+            Line2D(
+                [0, 1],
+                [0, 0],
+                transform=self.axes.get_yaxis_transform(),
+                visible=False,
+                **PlotConfig.Widgets.CROSSHAIR,
+            ),
+        )
+        for line in self.crosshair:
+            self.view.figure.add_artist(line)
+            self.blit_manager.add_overlay(line)
+
+        self.legend: Legend | None = None
+        self.legend_visible: bool = True
+
+        self.plot_type: str = self.view.plot_types_segmented_button.get()
+        # The updates of the traces and the overlays are rendered once per frame
+        self.redraw_scheduler: RedrawScheduler = RedrawScheduler(
+            self.view, self.blit_manager.update
+        )
+        # The last resize of the canvas within the current frame
+        self.resize_event: tk.Event | None = None
+
+        self.setup_bindings()
+
+        header_selection_publisher.attach(self)
+        header_state_publisher.attach(self)
+
+    def setup_bindings(self) -> None:
+        """
+        Binding the nav toolbar buttons and the plot events to callback functions.
+        """
+        self.view.reset_button.configure(command=self.view.nav_toolbar.home)
+        self.view.back_button.configure(command=self.view.nav_toolbar.back)
+        self.view.forward_button.configure(command=self.view.nav_toolbar.forward)
+        self.view.pan_button.configure(command=self.view.nav_toolbar.pan)
+        self.view.zoom_button.configure(command=self.view.nav_toolbar.zoom)
+        self.view.save_button.configure(command=self.save_figure)
+        self.view.legend_button.configure(command=self.toggle_legend)
+        self.view.plot_types_segmented_button.configure(command=self.set_plot_type)
+
+        # Replaces the binding of the canvas, so a storm of resize events resizes the figure once per frame
+        self.view.canvas.get_tk_widget().bind("<Configure>", self.request_resize)
+
+        # Zooming, panning and the history of the nav toolbar all change the x-range
+        self.axes.callbacks.connect("xlim_changed", self.on_axes_changed)
+        self.view.canvas.mpl_connect("resize_event", self.on_axes_changed)
+        self.view.canvas.mpl_connect("motion_notify_event", self.move_crosshair)
+        self.view.canvas.mpl_connect("axes_leave_event", self.move_crosshair)
+
+    def update(self, simple_publisher: SimplePublisher) -> None:
+        if simple_publisher == header_state_publisher:
+            # The data of the traces is replaced by the data of the next files
+            self.redraw_scheduler.request(self.reset_traces)
+
+        self.redraw_scheduler.request(self.update_traces)
+
+    def reset_traces(self) -> None:
+        """
+        Remove all traces and the history of the nav toolbar.
+        """
+        self.set_traces(())
+        self.trace_pool.clear()
+        self.view.nav_toolbar.update()
+
+    def update_traces(self) -> None:
+        """
+        Plot the traces of the selected columns, once the data was read.
+        """
+        if header_state_publisher.is_classified is True:
+            self.set_traces(header_selection_publisher.selected_columns)
+
+    def set_traces(self, columns: tuple[str, ...]) -> None:
+        """
+        Show the traces of the columns and hide all other traces.
+
+        Args:
+            columns (tuple[str, ...]): The columns to plot.
+        """
+        trace_keys: list[TraceKey] = [
+            (file_path, column)
+            for column in columns
+            for file_path in self.get_data_managers(column)
+        ]
+
+        self.change_traces(
+            [key for key in self.traces if key not in trace_keys],
+            [key for key in trace_keys if key not in self.traces],
+        )
+
+    def change_traces(
+        self, hidden_keys: list[TraceKey], shown_keys: list[TraceKey]
+    ) -> None:
+        """
+        Hide and show traces.
+
+        The limits of the axes are adapted to the shown traces unless they were set by zooming or panning.
+        If they stay the same, only the shown traces and the traces above the hidden ones
+        are drawn, otherwise the whole figure is drawn with the next render.
+
+        Args:
+            hidden_keys (list[TraceKey]): The file paths and columns of the traces to hide.
+            shown_keys (list[TraceKey]): The file paths and columns of the traces to show.
+        """
+        limits: tuple = (self.axes.get_xlim(), self.axes.get_ylim())
+
+        hidden_lines: list[Line2D] = self.hide_traces(hidden_keys)
+        shown_keys = self.show_traces(shown_keys)
+        if not hidden_lines and not shown_keys:
+            return
+
+        self.axes.relim(visible_only=True)
+        # The decimated points might not include the first and last sample of a signal
+        for trace in self.traces.values():
+            self.axes.dataLim.update_from_data_x(
+                np.array(trace.signal.x_range), ignore=False
+            )
+        self.axes.autoscale_view()
+
+        if (self.axes.get_xlim(), self.axes.get_ylim()) != limits:
+            self.blit_manager.invalidate()
+        # A changed x-range decimated all traces already
+        self.decimate_traces(shown_keys)
+
+        self.blit_manager.remove_layers(hidden_lines)
+        self.blit_manager.add_layers([self.traces[key].line for key in shown_keys])
+
+        self.update_legend()
+
+    def show_traces(self, trace_keys: list[TraceKey]) -> list[TraceKey]:
+        """
+        Show the traces of the current plot type, from the pool or plotted with a new line.
+        While the limits of the axes are adapted to the traces, they show at least the points of the whole signal.
+
+        Args:
+            trace_keys (list[TraceKey]): The file paths and columns of the traces.
+
+        Returns:
+            list[TraceKey]: The shown traces, without the ones of non-numeric columns.
+        """
+        nr_of_bins: int = self.get_nr_of_bins()
+        shown_keys: list[TraceKey] = []
+
+        for file_path, column in trace_keys:
+            pool_key: PoolKey = (file_path, column, self.plot_type)
+            trace: Trace | None = self.trace_pool.get(pool_key)
+
+            if trace is None:
+                trace = self.create_trace(file_path, column)
+                if trace is None:
+                    continue
+                self.trace_pool.add(pool_key, trace)
+            else:
+                trace.line.set_visible(True)
+
+            if self.axes.get_autoscalex_on() and not trace.covers(
+                *trace.signal.x_range
+            ):
+                trace.decimate(*trace.signal.x_range, nr_of_bins)
+
+            self.traces[(file_path, column)] = trace
+            shown_keys.append((file_path, column))
+
+        return shown_keys
+
+    def hide_traces(self, trace_keys: list[TraceKey]) -> list[Line2D]:
+        """
+        Hide traces, they are kept in the pool until it exceeds its memory.
+
+        Args:
+            trace_keys (list[TraceKey]): The file paths and columns of the traces.
+
+        Returns:
+            list[Line2D]: The hidden lines.
+        """
+        hidden_lines: list[Line2D] = []
+
+        for trace_key in trace_keys:
+            trace: Trace = self.traces.pop(trace_key)
+            trace.line.set_visible(False)
+            hidden_lines.append(trace.line)
+
+        self.trace_pool.evict()
+
+        return hidden_lines
+
+    def create_trace(self, file_path: str, column: str) -> Trace | None:
+        """
+        Plot a trace of the current plot type with a new line, which has no points yet.
+
+        Args:
+            file_path (str): The CSV file path.
+            column (str): The column.
+
+        Returns:
+            Trace | None: The trace or None if the column is not numeric.
+        """
+        data_manager: CSVDataManager = self.get_data_managers(column)[file_path]
+        y: np.ndarray = data_manager.get_column(column)
+        if not (np.issubdtype(y.dtype, np.number) or y.dtype == np.bool_):
+            return None
+
+        signal: DecimatedSignal = DecimatedSignal(
+            data_manager.get_column(data_manager.columns[0]),
+            y,
+            data_manager.get_pyramid(column),
+        )
+        (line,) = self.axes.plot(
+            [],
+            [],
+            label=(
+                f"{column} ({Path(file_path).name})"
+                if csv_dataset_manager.datasets
+                else column
+            ),
+            **PlotConfig.Widgets.LINE,
+            **PlotConfig.Widgets.PLOT_TYPES[self.plot_type],
+        )
+
+        return Trace(signal, line, self.plot_type)
+
+    def update_legend(self) -> None:
+        """
+        Create the legend of the current traces.
+        """
+        if self.legend is not None:
+            self.blit_manager.remove_overlay(self.legend)
+            self.legend.remove()
+            self.legend = None
+
+        if self.traces:
+            self.legend = self.axes.legend(
+                handles=[trace.line for trace in self.traces.values()]
+            )
+            self.legend.set_visible(self.legend_visible)
+            self.blit_manager.add_overlay(self.legend)
+
+    def toggle_legend(self) -> None:
+        """
+        Show or hide the legend, only the traces and overlays are drawn again.
+        """
+        self.legend_visible = not self.legend_visible
+
+        if self.legend is not None:
+            self.legend.set_visible(self.legend_visible)
+            self.redraw_scheduler.request()
+
+    def set_plot_type(self, plot_type: str) -> None:
+        """
+        Set the plot type of the traces, they are changed with the next render.
+
+        Args:
+            plot_type (str): The plot type, see `PlotConfig.Widgets.PLOT_TYPES`.
+        """
+        self.plot_type = plot_type
+        self.redraw_scheduler.request(self.update_plot_type)
+
+    def update_plot_type(self) -> None:
+        """
+        Show the traces of the current plot type instead of the traces of the previous one.
+        """
+        trace_keys: list[TraceKey] = [
+            key
+            for key, trace in self.traces.items()
+            if trace.plot_type != self.plot_type
+        ]
+        self.change_traces(trace_keys, trace_keys)
+
+    def move_crosshair(self, event: MouseEvent | LocationEvent) -> None:
+        """
+        Show the crosshair at the mouse position within the axes, only the traces and overlays
+        are drawn again.
+
+        Args:
+            event (MouseEvent | LocationEvent): The mouse motion or the leave event of the axes.
+        """
+        vertical_line, horizontal_line = self.crosshair
+        is_inside: bool = (
+            event.name == "motion_notify_event" and event.inaxes is self.axes
+        )
+
+        if not is_inside and not vertical_line.get_visible():
+            return
+
+        if is_inside:
+            vertical_line.set_xdata([event.xdata, event.xdata])
+            horizontal_line.set_ydata([event.ydata, event.ydata])
+
+        vertical_line.set_visible(is_inside)
+        horizontal_line.set_visible(is_inside)
+        self.redraw_scheduler.request()
+
+    def request_resize(self, event: tk.Event) -> None:
+        """
+        Resize the figure to the size of the canvas with the next render.
+
+        Args:
+            event (tk.Event): The configure event of the canvas.
+        """
+        self.resize_event = event
+        self.redraw_scheduler.request(self.resize_canvas)
+
+    def resize_canvas(self) -> None:
+        """
+        Resize the figure to the last size of the canvas.
+        """
+        if self.resize_event is not None:
+            self.view.canvas.resize(self.resize_event)
+            self.resize_event = None
+
+    def on_axes_changed(self, _=None) -> None:
+        """
+        Decimate the traces for the changed x-range or size of the axes, the whole figure is drawn
+        with the next draw of the nav toolbar or render.
+        """
+        self.blit_manager.invalidate()
+        self.decimate_traces()
+
+    def save_figure(self) -> None:
+        """
+        Save the figure with the nav toolbar, including the traces and overlays.
+        """
+        with self.blit_manager.static():
+            self.view.nav_toolbar.save_figure()
+
+    def decimate_traces(self, trace_keys: list[TraceKey] | None = None) -> None:
+        """
+        Show the points of the traces within the x-range at the resolution of the axes,
+        if they do not show them yet.
+
+        Args:
+            trace_keys (list[TraceKey] | None, optional): The traces to decimate, None for all traces.
+                                                            Defaults to None.
+        """
+        x_min, x_max = self.axes.get_xlim()
+        nr_of_bins: int = self.get_nr_of_bins()
+
+        for trace_key in self.traces if trace_keys is None else trace_keys:
+            self.traces[trace_key].decimate(x_min, x_max, nr_of_bins)
+
+    def get_nr_of_bins(self) -> int:
+        """
+        Get the number of bins of a decimated trace from the width of the axes.
+
+        Returns:
+            int: The number of bins.
+        """
+        return max(int(self.axes.bbox.width * PlotConfig.General.BINS_PER_PIXEL), 1)
+
+    @staticmethod
+    def get_data_managers(column: str) -> dict[str, CSVDataManager]:
+        """
+        Get the data of the files containing a column.
+
+        Args:
+            column (str): The column.
+
+        Returns:
+            dict[str, CSVDataManager]: The read data of each CSV file path containing the column.
+        """
+        if csv_dataset_manager.datasets:
+            return {
+                file_path: csv_dataset_manager.datasets[file_path]
+                for file_path in csv_dataset_manager.header_index.get(column, [])
+            }
+
+        if column in csv_data_manager.columns:
+            return {csv_data_manager.file_path: csv_data_manager}
+
+        return {}
+
+    def __del__(self) -> None:
+        header_selection_publisher.detach(self)
+        header_state_publisher.detach(self)
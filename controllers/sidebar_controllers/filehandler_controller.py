@@ -1,15 +1,20 @@
 """Defines the FileHandlerController class with the filehandler functionality."""
 
 import os
+from collections.abc import Iterator
+from concurrent.futures import Future
 from tkinter import filedialog, messagebox
 import pandas as pd
 from models.yaml_manager import YAMLManager
-from models.csv_data_manager import csv_data_manager
+from models.csv_cache_manager import CSVCacheManager
+from models.csv_data_manager import csv_data_manager, ParserBackend
+from models.csv_dataset_manager import csv_dataset_manager
 from configurations.filehandler_config import FileHandlerConfig
 from views.sidebar_views.filehandler_view import FileHandlerView
-from utils.threads import safe_thread_queue
+from utils.threads import CancellationToken, TaskType, safe_thread_queue
 from utils.observer_publisher import (
     file_state_publisher,
+    header_state_publisher,
     ProgressStatePublisher,
     progress_state_publisher,
 )
@@ -20,7 +25,13 @@ class FileHandlerController:
     Functionality of the filehandler.
     """
 
-    __slots__ = ("view", "file_manager")
+    __slots__ = (
+        "view",
+        "file_manager",
+        "settings_manager",
+        "cache_manager",
+        "read_file_task",
+    )
 
     def __init__(self, view: FileHandlerView) -> None:
         self.view: FileHandlerView = view
@@ -34,6 +45,20 @@ class FileHandlerController:
             FileHandlerConfig.OwnArgs.FILE_PATHS,
             FileHandlerConfig.OwnArgs.NR_OF_FILES_TO_SAVE,
         )
+        self.settings_manager: YAMLManager = YAMLManager(
+            FileHandlerConfig.OwnArgs.USER_SETTINGS
+        )
+
+        # The cache keeps at most the files of the recent-files history
+        self.cache_manager: CSVCacheManager = CSVCacheManager(
+            FileHandlerConfig.OwnArgs.CACHE_DIR,
+            FileHandlerConfig.OwnArgs.NR_OF_FILES_TO_SAVE,
+            FileHandlerConfig.OwnArgs.CACHE_MAX_SIZE,
+            FileHandlerConfig.OwnArgs.CACHE_MAX_AGE,
+        )
+
+        # The latest task reading the data, which an export has to wait for
+        self.read_file_task: Future | None = None
 
         self.setup_tracings()
 
@@ -46,35 +71,91 @@ class FileHandlerController:
     def enter_file(self) -> None:
         """
         Open a filedialog and show the selected file path in the entry.
+        Several selected files are opened together to compare them.
         """
-        filepath = filedialog.askopenfilename(
+        filepaths = filedialog.askopenfilenames(
             initialdir=FileHandlerConfig.OwnArgs.FILE_PATHS_INITIAL_DIR,
             filetypes=FileHandlerConfig.OwnArgs.FILE_PATHS_FILE_TYPE,
         )
 
-        if filepath:
-            self.view.file_entry.enter_file(filepath)
+        if len(filepaths) == 1:
+            self.view.file_entry.enter_file(filepaths[0])
+        elif filepaths:
+            self.start_open_files_thread(list(filepaths))
 
     def start_open_file_thread(self, *_) -> None:
         """
-        Start open file thread.
+        Start open file thread and the thread reading its data afterwards.
+        The latest opened file wins, older file operations which did not finish yet are cancelled.
         """
-        safe_thread_queue.add_task(
+        file_name: str = self.view.selected_file_path.get()
+        open_file_task: Future = safe_thread_queue.add_task(
             self.open_file,
-            args=(self.view.selected_file_path.get(),),
+            args=(file_name,),
             before_thread=self.pre_open_file,
             after_thread=self.post_operation_file,
+            key="open_file",
+        )
+
+        self.start_read_file_thread(file_name, open_file_task)
+
+    def start_open_files_thread(self, file_names: list[str]) -> None:
+        """
+        Start open several files thread.
+
+        Args:
+            file_names (list[str]): The CSV file paths.
+        """
+        cancellation_token: CancellationToken = CancellationToken()
+        self.read_file_task = safe_thread_queue.add_task(
+            self.open_files,
+            args=(file_names, cancellation_token),
+            before_thread=self.pre_open_files,
+            after_thread=self.post_operation_file,
+            key="read_file",
+            cancellation_token=cancellation_token,
         )
 
     def start_export_file_thread(self) -> None:
         """
-        Start exporting data thread.
+        Start exporting data thread. A snapshot of the data is taken on the serial lane after
+        the reading of the file and exported on the IO lane, so the next file can be opened
+        and read while the data is exported.
         """
+        file_name: str = self.view.selected_file_path.get()
+        snapshot_task: Future = safe_thread_queue.add_task(
+            self.get_snapshot,
+            args=(file_name,),
+            depends_on=(
+                (self.read_file_task,) if self.read_file_task is not None else ()
+            ),
+        )
         safe_thread_queue.add_task(
             self.export_file,
-            args=(self.view.selected_file_path.get(),),
+            args=(file_name, snapshot_task),
             before_thread=self.pre_operation_file,
             after_thread=self.post_operation_file,
+            task_type=TaskType.IO,
+            depends_on=(snapshot_task,),
+        )
+
+    def start_read_file_thread(self, file_name: str, open_file_task: Future) -> None:
+        """
+        Start reading the data of the opened file thread.
+
+        Args:
+            file_name (str): The CSV file path.
+            open_file_task (Future): The task opening the file.
+        """
+        cancellation_token: CancellationToken = CancellationToken()
+        self.read_file_task = safe_thread_queue.add_task(
+            self.read_file,
+            args=(file_name, open_file_task, cancellation_token),
+            before_thread=self.pre_read_file,
+            after_thread=self.post_operation_file,
+            depends_on=(open_file_task,),
+            key="read_file",
+            cancellation_token=cancellation_token,
         )
 
     def pre_open_file(self) -> None:
@@ -82,8 +163,25 @@ class FileHandlerController:
         Before doing an open file operation.
         """
         file_state_publisher.set_is_open(False)
+        header_state_publisher.set_is_classified(False)
+        csv_dataset_manager.clear()
         self.pre_operation_file()
 
+    def pre_open_files(self) -> None:
+        """
+        Before opening several files start the progressbar in determinate mode.
+        """
+        file_state_publisher.set_is_open(False)
+        header_state_publisher.set_is_classified(False)
+        self.pre_read_file()
+
+    def pre_read_file(self) -> None:
+        """
+        Before reading the data of the opened file start the progressbar in determinate mode.
+        """
+        progress_state_publisher.mode = "determinate"
+        progress_state_publisher.set_value(ProgressStatePublisher.START_PROGRESSBAR)
+
     def pre_operation_file(self) -> None:
         """
         Before doing an operation to the csv file start the progressbar.
@@ -97,15 +195,21 @@ class FileHandlerController:
         """
         progress_state_publisher.set_value(ProgressStatePublisher.STOP_PROGRESSBAR)
 
-    def open_file(self, file_name: str) -> None:
+    def open_file(self, file_name: str) -> bool:
         """
-        Open a CSV file and read the data.
+        Open a CSV file and read only its header row, so the header list can be shown at once.
+        The data is read afterwards in a separate task.
 
         Args:
             file_name (str): The CSV file path.
+
+        Returns:
+            bool: True if the file was opened, False otherwise.
         """
         try:
-            csv_data_manager.read_file(file_name)
+            csv_data_manager.read_header(
+                file_name, self.file_manager.get_file_dialect(file_name)
+            )
         except FileNotFoundError as exc:
             file_state_publisher.set_is_open(False)
             messagebox.showerror("Error", str(exc))
@@ -113,21 +217,185 @@ class FileHandlerController:
             file_state_publisher.set_is_open(False)
             messagebox.showerror("Error", str(exc))
         else:
-            self.file_manager.dump_yaml_file(file_name)
+            self.file_manager.dump_yaml_file(file_name, csv_data_manager.dialect)
             file_state_publisher.file_size = str(
                 round(os.path.getsize(file_name) / 1024)
             )
             file_state_publisher.set_is_open(True)
 
-    def export_file(self, file_name: str) -> None:
+            return True
+
+        return False
+
+    def read_file(
+        self,
+        file_name: str,
+        open_file_task: Future,
+        cancellation_token: CancellationToken,
+    ) -> None:
+        """
+        Read the data of the opened CSV file and classify its headers.
+        The reading stops at the next chunk if a newer file got opened.
+
+        Args:
+            file_name (str): The CSV file path.
+            open_file_task (Future): The finished task opening the file.
+            cancellation_token (CancellationToken): The token to stop reading the file.
+        """
+        if not open_file_task.result():  # The file could not be opened
+            return
+
+        try:
+            progress_iterator: Iterator[float] = csv_data_manager.read_file_in_chunks(
+                file_name,
+                FileHandlerConfig.OwnArgs.READ_CHUNK_SIZE,
+                self.cache_manager,
+                FileHandlerConfig.OwnArgs.OPTIMIZE_DTYPES,
+                FileHandlerConfig.OwnArgs.DTYPE_SAMPLE_SIZE,
+                self.get_parser_backend(),
+                FileHandlerConfig.OwnArgs.PYARROW_MIN_FILE_SIZE,
+            )
+            for progress in progress_iterator:
+                if cancellation_token.is_cancelled:
+                    progress_iterator.close()
+                    return
+
+                # The start and the stop of the progressbar are handled before and after the thread
+                if (
+                    ProgressStatePublisher.START_PROGRESSBAR
+                    < progress
+                    < ProgressStatePublisher.STOP_PROGRESSBAR
+                ):
+                    progress_state_publisher.set_value(progress)
+        except FileNotFoundError as exc:
+            messagebox.showerror("Error", str(exc))
+        except pd.errors.EmptyDataError as exc:
+            messagebox.showerror("Error", str(exc))
+        except ValueError as exc:
+            messagebox.showerror("Error", str(exc))
+        else:
+            # Without shrinking the dtypes no saved memory is shown
+            file_state_publisher.memory_saved = (
+                str(round(csv_data_manager.memory_saved / 1024))
+                if FileHandlerConfig.OwnArgs.OPTIMIZE_DTYPES
+                else ""
+            )
+            header_state_publisher.set_is_classified(True)
+
+    def get_parser_backend(self) -> str:
+        """
+        Get the parser backend forced by the user settings.
+
+        Returns:
+            str: The parser backend of the user settings or ParserBackend.AUTO if none is set.
+        """
+        try:
+            parser_settings: dict = self.settings_manager.open_file().get("Parser") or {}
+        except FileNotFoundError:
+            return ParserBackend.AUTO
+
+        return str(parser_settings.get("backend", ParserBackend.AUTO)).lower()
+
+    def open_files(
+        self, file_names: list[str], cancellation_token: CancellationToken
+    ) -> None:
+        """
+        Open and read several CSV files concurrently and classify the union of their headers.
+        The reading stops after the next file if a newer file got opened.
+
+        Args:
+            file_names (list[str]): The CSV file paths.
+            cancellation_token (CancellationToken): The token to stop reading the files.
+        """
+        # The cache would evict the files of the same loading if it can not hold all of them
+        cache_manager: CSVCacheManager | None = (
+            self.cache_manager
+            if len(file_names) <= FileHandlerConfig.OwnArgs.NR_OF_FILES_TO_SAVE
+            else None
+        )
+
+        progress_iterator: Iterator[float] = csv_dataset_manager.load_files(
+            file_names,
+            FileHandlerConfig.OwnArgs.READ_CHUNK_SIZE,
+            cache_manager,
+            FileHandlerConfig.OwnArgs.OPTIMIZE_DTYPES,
+            FileHandlerConfig.OwnArgs.DTYPE_SAMPLE_SIZE,
+            self.get_parser_backend(),
+            FileHandlerConfig.OwnArgs.PYARROW_MIN_FILE_SIZE,
+        )
+        for progress in progress_iterator:
+            if cancellation_token.is_cancelled:
+                progress_iterator.close()
+                return
+
+            if (
+                ProgressStatePublisher.START_PROGRESSBAR
+                < progress
+                < ProgressStatePublisher.STOP_PROGRESSBAR
+            ):
+                progress_state_publisher.set_value(progress)
+
+        if csv_dataset_manager.errors:
+            messagebox.showerror(
+                "Error", "\n".join(csv_dataset_manager.errors.values())
+            )
+
+        # The opened files are added to the recent files like a single opened file
+        for file_name, data_manager in csv_dataset_manager.datasets.items():
+            self.file_manager.dump_yaml_file(file_name, data_manager.dialect)
+
+        if csv_dataset_manager.datasets:
+            file_size: int = sum(
+                os.path.getsize(file_name) for file_name in csv_dataset_manager.datasets
+            )
+            file_state_publisher.file_size = str(round(file_size / 1024))
+            file_state_publisher.set_is_open(True)
+            file_state_publisher.memory_saved = (
+                str(
+                    round(
+                        sum(
+                            data_manager.memory_saved
+                            for data_manager in csv_dataset_manager.datasets.values()
+                        )
+                        / 1024
+                    )
+                )
+                if FileHandlerConfig.OwnArgs.OPTIMIZE_DTYPES
+                else ""
+            )
+            header_state_publisher.set_is_classified(True)
+
+    def get_snapshot(self, file_name: str) -> pd.DataFrame | None:
+        """
+        Get a snapshot of the read data of a CSV file to export.
+
+        Args:
+            file_name (str): The CSV file path.
+
+        Returns:
+            pd.DataFrame | None: The read data, None if the file is not read.
+        """
+        try:
+            return csv_data_manager.get_snapshot(file_name)
+        except pd.errors.EmptyDataError as exc:
+            messagebox.showerror("Error", str(exc))
+
+        return None
+
+    def export_file(self, file_name: str, snapshot_task: Future) -> None:
         """
         Export a CSV file.
 
         Args:
             file_name (str): The CSV file path.
+            snapshot_task (Future): The finished task taking the snapshot of the data to export.
         """
+        data_frame: pd.DataFrame | None = snapshot_task.result()
+        if data_frame is None:  # The file is not read
+            return
+
         try:
-            csv_data_manager.export_to_excel(file_name)
+            csv_data_manager.export_to_excel(file_name, data_frame)
         except AttributeError as exc:
             messagebox.showerror("Error", str(exc))
         except pd.errors.EmptyDataError as exc:
@@ -1,24 +1,27 @@
 """Defines the HeaderListController class with the header list functionality."""
 
 from collections import defaultdict
-import customtkinter as ctk
+from functools import partial
 from configurations.header_list_config import HeaderListConfig
 from views.sidebar_views.header_list_view import HeaderListView
 from views.configurations_view import HeaderListFrameConfig
 from models.yaml_manager import YAMLManager
-from models.csv_data_manager import csv_data_manager
+from models.csv_data_manager import csv_data_manager, split_header
+from models.csv_dataset_manager import csv_dataset_manager
 from utils.observer_publisher import (
     SimpleObserver,
     SimplePublisher,
     file_state_publisher,
+    header_selection_publisher,
+    header_state_publisher,
     new_settings_publisher,
-    ProgressStatePublisher,
-    progress_state_publisher,
 )
 
 # from utils.scrollable_frame_manager import ScrollableFrameManager
 from utils.select_button import SelectButton
-from utils.threads import safe_thread_queue
+
+# A row of the header_scrollableframe, ("label", text) or ("button", (text, key of the header))
+HeaderRow = tuple[str, str | tuple[str, str | tuple[str, str]]]
 
 
 class HeaderListController(SimpleObserver):
@@ -33,24 +36,37 @@ class HeaderListController(SimpleObserver):
         # "scrollable_frame_manager",
         "header_list",
         "header_separator",
+        "header_columns",
+        "selected_headers",
     )
 
     def __init__(self, view: HeaderListView) -> None:
         self.view: HeaderListView = view
 
-        self.label_widgets: dict[str, ctk.CTkLabel] = {}
-        self.button_widgets: defaultdict[str, list[SelectButton]] = defaultdict(list)
-
         self.header_list: defaultdict[str, list[int] | list[tuple[str, int]]] = (
             defaultdict(list)
         )
         self.header_separator: str = ""
+        # The column of each header, or header and sub-header, in the order of the header list
+        self.header_columns: dict[str | tuple[str, str], str] = {}
+        # The selected headers, or headers and sub-headers, which are not bound to a button
+        self.selected_headers: set[str | tuple[str, str]] = set()
 
         self.settings_manager = YAMLManager(HeaderListConfig.OwnArgs.USER_SETTINGS)
 
-        self.create_initial_widget_pool()
+        self.view.header_scrollableframe.register_row_type(
+            "label",
+            self.view.add_label_to_header_scrollableframe,
+            self.view.manage_label,
+        )
+        self.view.header_scrollableframe.register_row_type(
+            "button",
+            self.view.add_button_to_header_scrollableframe,
+            self.bind_header_button,
+        )
 
         file_state_publisher.attach(self)
+        header_state_publisher.attach(self)
         new_settings_publisher.attach(self)
 
         # self.scrollable_frame_filled: bool = False
@@ -59,34 +75,21 @@ class HeaderListController(SimpleObserver):
         #     self.view.header_scrollableframe, 20, 10
         # )
 
-    def create_initial_widget_pool(self) -> None:
-        """
-        Creates an initial pool of labels and buttons to be reused in the header_scrollableframe.
-        """
-        for group_nr in range(HeaderListConfig.OwnArgs.INITIAL_NR_OF_GROUPS):
-            group_key: str = f"group_{group_nr}"
-
-            self.label_widgets[group_key] = (
-                self.view.add_label_to_header_scrollableframe()
-            )
-
-            self.button_widgets[group_key] = [
-                self.view.add_button_to_header_scrollableframe()
-                for _ in range(HeaderListConfig.OwnArgs.INITIAL_NR_OF_BUTTONS_PER_GROUP)
-            ]
-
     def update(self, simple_publisher: SimplePublisher) -> None:
         if (
             simple_publisher == file_state_publisher
-            and file_state_publisher.is_open is True
-        ):  # A CSV file got successfully opened
+            and simple_publisher.is_open is True
+        ) or (
+            simple_publisher == header_state_publisher
+            and simple_publisher.is_classified is True
+        ):  # The header of a CSV file got read or its data got classified
             header_list: defaultdict[str, list[int] | list[tuple[str, int]]] = (
                 self.get_header_list()
             )
 
             if header_list != self.header_list:  # The file has new values
                 self.header_list = header_list
-                self.start_update_header_scrollableframe_thread()
+                self.update_header_scrollableframe()
 
         # if (
         #     simple_publisher == file_size_publisher
@@ -114,6 +117,7 @@ class HeaderListController(SimpleObserver):
     def get_header_list(self) -> defaultdict[str, list[int] | list[tuple[str, int]]]:
         """
         Get the classified headers from a CSV file based on the user selected header structure from a csv file.
+        If several files are opened, the union of their headers is classified per file.
 
         Returns:
             defaultdict[str, list[int] | list[tuple[str, int]]]: The classified header list.
@@ -167,8 +171,40 @@ class HeaderListController(SimpleObserver):
         else:
             header_prefix = second_header_prefix
 
+        # Several opened files show the union of their headers
+        data_manager = (
+            csv_dataset_manager if csv_dataset_manager.datasets else csv_data_manager
+        )
+
+        if data_manager is csv_dataset_manager:
+            time_columns: set[str] = {
+                dataset.columns[0]
+                for dataset in csv_dataset_manager.datasets.values()
+                if dataset.columns
+            }
+            columns: list[str] = [
+                column
+                for column in csv_dataset_manager.header_index
+                if column not in time_columns
+            ]
+        else:
+            columns = csv_data_manager.columns[1:]
+
+        self.header_columns = {}
+        for column in columns:
+            header, sub_header = split_header(
+                column,
+                header_prefix,
+                header_postfix,
+                self.header_separator,
+                header_structure_order,
+            )
+            self.header_columns[
+                (header, sub_header) if self.header_separator else header
+            ] = column
+
         # Get the list of headers and sub-headers without the time column, pre-, postfix and the separator
-        return csv_data_manager.get_classified_headers(
+        return data_manager.get_classified_headers(
             0,
             header_prefix,
             header_postfix,
@@ -176,154 +212,87 @@ class HeaderListController(SimpleObserver):
             header_structure_order,
         )
 
-    def start_update_header_scrollableframe_thread(self) -> None:
+    def update_header_scrollableframe(self) -> None:
         """
-        Start the thread to update the widgets in the header_scrollableframe.
+        Show the header list in the header_scrollableframe from its first row.
+        Only the visible rows get a widget, so this does not depend on the number of headers.
         """
-        # Reset the parent canvas view to the top
-        # pylint: disable=W0212
-        self.view.header_scrollableframe._parent_canvas.yview_moveto(0)
-        safe_thread_queue.add_task(
-            self.manage_widgets_in_header_scrollableframe,
-            before_thread=self.pre_update_header_scrollableframe,
-            after_thread=self.post_update_header_scrollableframe,
-        )
+        rows: list[HeaderRow] = self.get_header_rows()
 
-    def pre_update_header_scrollableframe(self) -> None:
-        """
-        Before doing an operation to the csv file start the progressbar.
-        """
-        progress_state_publisher.mode = "determinate"
-        progress_state_publisher.set_value(ProgressStatePublisher.START_PROGRESSBAR)
+        # Keep the selection of the headers which are still in the list
+        self.selected_headers &= {
+            data[1] for row_type, data in rows if row_type == "button"  # type: ignore
+        }
 
-    def post_update_header_scrollableframe(self) -> None:
-        """
-        After doing an operation to the csv file stop the progressbar.
+        self.view.header_scrollableframe.set_rows(rows)
+        self.publish_selected_headers()
+
+    def get_header_rows(self) -> list[HeaderRow]:
         """
-        progress_state_publisher.set_value(ProgressStatePublisher.STOP_PROGRESSBAR)
+        Get the rows of the header_scrollableframe from the header list.
 
-    def manage_widgets_in_header_scrollableframe(self) -> None:
-        if self.header_separator == "":
-            self.manage_widgets_for_headers_only()
-        else:
-            self.manage_widgets_for_headers_and_sub_headers()
+        Without a separator every header is a button, otherwise every header is a group label
+        followed by a button for each of its sub-headers.
 
-    def manage_widgets_for_headers_only(self) -> None:
+        Returns:
+            list[HeaderRow]: The rows as ("label", text) or ("button", (text, key of the header)).
         """
-        Distributes the headers across the button groups to ensure an even and balanced layout.
+        if self.header_separator == "":
+            return [("button", (header, header)) for header in self.header_list]
+
+        rows: list[HeaderRow] = []
+        for header, sub_headers in self.header_list.items():
+            rows.append(("label", header.upper()))
+            rows.extend(
+                ("button", (sub_header, (header, sub_header)))
+                for sub_header, _ in sub_headers  # type: ignore
+            )
 
-        This function dynamically adjusts the number of button groups and the number of buttons
-        within each group based on the total number of headers. If there are more headers than
-        the current button groups can accommodate, additional groups or buttons are added as needed.
-        Unused buttons in each group are hidden.
-        """
-        # 1. Hide all labels
-        for label in self.label_widgets.values():
-            label.grid_forget()
-
-        headers = list(self.header_list.keys())
-
-        # 2. Calculate the required number of groups based on the total number of headers
-        total_nr_header: int = len(headers)
-        required_groups: int = (
-            total_nr_header + HeaderListConfig.OwnArgs.MAX_BUTTONS_PER_GROUP - 1
-        ) // HeaderListConfig.OwnArgs.MAX_BUTTONS_PER_GROUP
-
-        # 3. Dynamically add extra groups if the existing ones are insufficient
-        total_nr_of_groups: int = len(self.button_widgets)
-        for extra_group_index in range(total_nr_of_groups, required_groups):
-            self.button_widgets[f"group_{extra_group_index}"] = [
-                self.view.add_button_to_header_scrollableframe()
-                for _ in range(HeaderListConfig.OwnArgs.INITIAL_NR_OF_BUTTONS_PER_GROUP)
-            ]  # Add a group of buttons
-
-        # 4. Calculate buttons per group after adjustments
-        button_groups = list(self.button_widgets.values())
-        total_nr_of_groups = len(button_groups)
-        buttons_per_group: int = (
-            total_nr_header + total_nr_of_groups - 1
-        ) // total_nr_of_groups
-
-        # 5. Adjust each button group with headers
-        header_count: int = 0  # Track string index
-        for button_group in button_groups:
-
-            # Determine the number of buttons needed or already are in this group
-            nr_of_buttons: int = max(buttons_per_group, len(button_group))
-
-            for button_index in range(nr_of_buttons):
-                # Only set the button if there are still buttons in the group and headers left
-                if button_index < buttons_per_group and header_count < total_nr_header:
-                    header: str = headers[header_count]
-                    self.manage_buttons_in_header_scrollableframe(
-                        button_group,
-                        len(button_group),
-                        button_index,
-                        header_count,
-                        header,
-                    )
-                    progress_state_publisher.set_value(
-                        (header_count / total_nr_header) * 100
-                    )
-                    header_count += 1
-                else:  # Hide any extra buttons that are not needed
-                    try:
-                        button_group[button_index].grid_forget()
-                    except IndexError:
-                        button_group.append(
-                            self.view.add_button_to_header_scrollableframe()
-                        )
-
-    def manage_buttons_in_header_scrollableframe(
-        self,
-        group_of_buttons: list[SelectButton],
-        len_group_of_buttons: int,
-        button_index: int,
-        row_index: int,
-        text: str,
+        return rows
+
+    def bind_header_button(
+        self, button: SelectButton, data: tuple[str, str | tuple[str, str]]
     ) -> None:
         """
-        Updates the text and position of an existing button or creates a new one
-        if it doesn't exist and positions it.
+        Show a header in a button of the header_scrollableframe.
 
         Args:
-            group_of_buttons (list[SelectButton]): The group of buttons.
-            len_group_of_buttons (int): Number of groups of buttons.
-            button_index (int): The index of the button in group.
-            row_index (int): The index of the button in the scrollable frame.
-            text (str): The text of the button.
+            button (SelectButton): The button to reuse for the header.
+            data (tuple[str, str | tuple[str, str]]): The text and the key of the header.
         """
-        if button_index < len_group_of_buttons:
-            button: SelectButton = group_of_buttons[button_index]
-        else:
-            button = self.view.add_button_to_header_scrollableframe()
-            group_of_buttons.append(button)
+        text, key = data
+        self.view.manage_button(button, text, key in self.selected_headers)
+        button.toggle_command = partial(self.toggle_header, key)
 
-        self.view.manage_button(button, text, row_index)
-
-    def manage_widgets_for_headers_and_sub_headers(self):
-        pass
-
-    def manage_label_in_header_scrollableframe(
-        self, group_index: int, label_index: int, text: str
-    ) -> None:
+    def toggle_header(self, key: str | tuple[str, str], selected: bool) -> None:
         """
-        Updates the text and position of an existing label or creates a new one
-        if it doesn't exist and positions it.
+        Keep the selection of a header, independently of the button showing it.
 
         Args:
-            group_index (int): The index of the group.
-            label_index (int): The index of the label in the scrollable frame.
-            text (str): The text of the group label.
+            key (str | tuple[str, str]): The header or the header and its sub-header.
+            selected (bool): The new selection of the header.
         """
-        group_key: str = f"group_{group_index}"
-        if group_key not in self.label_widgets:
-            self.label_widgets[group_key] = (
-                self.view.add_label_to_header_scrollableframe()
-            )
+        if selected:
+            self.selected_headers.add(key)
+        else:
+            self.selected_headers.discard(key)
 
-        self.view.manage_label(self.label_widgets[group_key], text.upper(), label_index)
+        self.publish_selected_headers()
+
+    def publish_selected_headers(self) -> None:
+        """
+        Publish the columns of the selected headers, e.g. to plot them.
+        """
+        header_selection_publisher.set_selected_columns(
+            tuple(
+                column
+                for key, column in self.header_columns.items()
+                if key in self.selected_headers
+            ),
+            self,
+        )
 
     def __del__(self) -> None:
         file_state_publisher.detach(self)
+        header_state_publisher.detach(self)
         new_settings_publisher.detach(self)
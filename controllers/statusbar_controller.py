@@ -7,6 +7,7 @@ from utils.observer_publisher import (
     SimplePublisher,
     SimpleObserver,
     file_state_publisher,
+    header_state_publisher,
     ProgressStatePublisher,
     progress_state_publisher,
 )
@@ -27,6 +28,7 @@ class StatusbarController(SimpleObserver):
         self._value: float = 0.0
 
         file_state_publisher.attach(self)
+        header_state_publisher.attach(self)
         progress_state_publisher.attach(self)
 
     def start_progressbar(self) -> None:
@@ -70,28 +72,42 @@ class StatusbarController(SimpleObserver):
         self.view.progressbar.stop()
 
     def update(self, simple_publisher: SimplePublisher) -> None:
+        # The notifications are delivered on the main loop with the state of the publisher
+        # at the time of the notification
         if simple_publisher == progress_state_publisher:
-            self._mode = progress_state_publisher.mode
-            self._value = progress_state_publisher.value
+            self._mode = simple_publisher.mode
+            self._value = simple_publisher.value
 
             if self._value == ProgressStatePublisher.START_PROGRESSBAR:
                 self.start_progressbar()
             elif self._value == ProgressStatePublisher.STOP_PROGRESSBAR:
                 self.stop_progressbar()
             else:
-                self.view.root.after(
-                    0,
-                    self.determinate_progress,
-                )
+                self.determinate_progress()
         elif simple_publisher == file_state_publisher:
             self.view.filesize_label.configure(text="--")
-            if file_state_publisher.is_open is True:
+            self.view.memory_saved_label.configure(text="")
+            if simple_publisher.is_open is True:
                 filesize_label_text: str = (
-                    f"{float(file_state_publisher.file_size):,.0f} kB".replace(",", ".")
+                    f"{float(simple_publisher.file_size):,.0f} kB".replace(",", ".")
                 )
                 file_state_publisher.set_is_open(False, self)
                 self.view.filesize_label.configure(text=filesize_label_text)
+        elif (
+            simple_publisher == header_state_publisher
+            and simple_publisher.is_classified is True
+        ):  # The data of the file got read
+            # The saved memory is empty if the dtypes are not shrunk
+            memory_saved_label_text: str = (
+                f"{float(file_state_publisher.memory_saved):,.0f} kB saved".replace(
+                    ",", "."
+                )
+                if file_state_publisher.memory_saved
+                else ""
+            )
+            self.view.memory_saved_label.configure(text=memory_saved_label_text)
 
     def __del__(self) -> None:
         file_state_publisher.detach(self)
+        header_state_publisher.detach(self)
         progress_state_publisher.detach(self)
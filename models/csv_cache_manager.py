@@ -0,0 +1,315 @@
+""" Defines the CSVCacheManager class which stores parsed CSV files as a directory of NumPy
+    column files, so reopening a file loads the columns memory-mapped instead of parsing it again. """
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+import numpy as np
+import pandas as pd
+import yaml
+from utils.level_of_detail import MinMaxPyramid
+
+
+class CSVCacheManager:
+    """
+    Class for caching parsed CSV files on disk.
+
+    Every cached file is a directory named by a hash of the file path, size and modification
+    time and the settings the file was parsed with, containing one ".npy" file per column and a "meta.yaml" file, which also keeps the
+    `attrs` of the data frame. Long numeric columns get a ".pyramid.npy" file with their min/max
+    pyramid next to them, see `MinMaxPyramid`. Entries are evicted
+    by their age, by the number of entries and by the total cache size, least recently used first.
+    """
+
+    META_FILE: str = "meta.yaml"
+    # Shorter columns are decimated from their values fast enough
+    PYRAMID_MIN_ROWS: int = 1 << 16
+
+    __slots__ = "__cache_dir", "__max_entries", "__max_size", "__max_age"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_entries: int = 0,
+        max_size: int = 0,
+        max_age: float = 0.0,
+    ) -> None:
+        """
+        Initializes the CSVCacheManager.
+
+        Args:
+            cache_dir (str): The directory of the cache.
+            max_entries (int, optional): The maximum number of cached files, 0 for no limit. Defaults to 0.
+            max_size (int, optional): The maximum total size of the cache in bytes, 0 for no limit. Defaults to 0.
+            max_age (float, optional): The maximum time in seconds since the last access of a cached file,
+                                        0 for no limit. Defaults to 0.0.
+        """
+        self.__cache_dir: Path = Path(cache_dir)
+        self.__max_entries: int = max_entries
+        self.__max_size: int = max_size
+        self.__max_age: float = max_age
+
+    @property
+    def cache_dir(self) -> Path:
+        """
+        Get the cache directory.
+
+        Returns:
+            Path: The directory of the cache.
+        """
+        return self.__cache_dir
+
+    def get_entry_dir(
+        self, file_path: str, settings: dict[str, Any] | None = None
+    ) -> Path | None:
+        """
+        Get the cache directory of a CSV file in its current version parsed with some settings.
+
+        Args:
+            file_path (str): The CSV file path.
+            settings (dict[str, Any] | None, optional): The YAML serializable settings the file is parsed with,
+                                                        e.g. its dialect. Defaults to None.
+
+        Returns:
+            Path | None: The cache directory of the file or None if the file does not exist.
+        """
+        try:
+            file_stat: os.stat_result = os.stat(file_path)
+        except OSError:
+            return None
+
+        key: str = (
+            f"{os.path.abspath(file_path)}|{file_stat.st_size}|{file_stat.st_mtime_ns}"
+        )
+        if settings:
+            # Data parsed with other settings, e.g. without shrinking the dtypes, is another entry
+            key += f"|{yaml.safe_dump(settings, sort_keys=True)}"
+        key = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+        return self.__cache_dir / key
+
+    def load(
+        self, file_path: str, settings: dict[str, Any] | None = None
+    ) -> pd.DataFrame | None:
+        """
+        Load a cached CSV file. Numeric columns are memory-mapped read-only.
+
+        Args:
+            file_path (str): The CSV file path.
+            settings (dict[str, Any] | None, optional): The settings the file is parsed with,
+                                                        see `get_entry_dir`. Defaults to None.
+
+        Returns:
+            pd.DataFrame | None: The cached data or None if the file is not cached with the settings.
+        """
+        entry_dir: Path | None = self.get_entry_dir(file_path, settings)
+        if entry_dir is None or not (entry_dir / self.META_FILE).is_file():
+            return None
+
+        try:
+            with open(entry_dir / self.META_FILE, "r", encoding="utf-8") as file_open:
+                meta: dict = yaml.safe_load(file_open)
+
+            columns: dict[str, pd.Series] = {
+                column: self.__load_column(entry_dir, index, dtype)
+                for index, (column, dtype) in enumerate(
+                    zip(meta["columns"], meta["dtypes"])
+                )
+            }
+        except (OSError, ValueError, KeyError, yaml.YAMLError):
+            # A broken entry is removed and the file is parsed again
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        # The modification time of the directory marks the last access
+        os.utime(entry_dir)
+
+        data_frame: pd.DataFrame = pd.DataFrame(columns, copy=False)
+        data_frame.attrs.update(meta.get("attrs", {}))
+
+        return data_frame
+
+    def store(
+        self,
+        file_path: str,
+        data_frame: pd.DataFrame,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Store a parsed CSV file in the cache and evict old entries afterwards.
+        The `attrs` of the data frame must contain only YAML serializable values.
+
+        Args:
+            file_path (str): The CSV file path.
+            data_frame (pd.DataFrame): The parsed CSV data.
+            settings (dict[str, Any] | None, optional): The settings the file was parsed with,
+                                                        see `get_entry_dir`. Defaults to None.
+        """
+        entry_dir: Path | None = self.get_entry_dir(file_path, settings)
+        if entry_dir is None:
+            return
+
+        # Write into a temporary directory first, so no incomplete entry can be loaded
+        temp_dir: Path = entry_dir.with_name(f"{entry_dir.name}.tmp")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        temp_dir.mkdir(parents=True)
+
+        try:
+            for index, column in enumerate(data_frame.columns):
+                self.__store_column(temp_dir, index, data_frame[column])
+
+            with open(temp_dir / self.META_FILE, "w", encoding="utf-8") as file_dump:
+                yaml.safe_dump(
+                    {
+                        "file_path": os.path.abspath(file_path),
+                        "columns": [str(column) for column in data_frame.columns],
+                        "dtypes": [str(dtype) for dtype in data_frame.dtypes],
+                        "nr_of_rows": len(data_frame),
+                        "attrs": dict(data_frame.attrs),
+                    },
+                    file_dump,
+                    sort_keys=False,
+                )
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            temp_dir.rename(entry_dir)
+        except (OSError, yaml.YAMLError):
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def load_pyramids(
+        self, file_path: str, settings: dict[str, Any] | None = None
+    ) -> dict[str, MinMaxPyramid]:
+        """
+        Load the min/max pyramids of the columns of a cached CSV file memory-mapped.
+
+        Args:
+            file_path (str): The CSV file path.
+            settings (dict[str, Any] | None, optional): The settings the file is parsed with,
+                                                        see `get_entry_dir`. Defaults to None.
+
+        Returns:
+            dict[str, MinMaxPyramid]: The pyramid of each column which has one,
+                                        empty if the file is not cached.
+        """
+        entry_dir: Path | None = self.get_entry_dir(file_path, settings)
+        if entry_dir is None or not (entry_dir / self.META_FILE).is_file():
+            return {}
+
+        try:
+            with open(entry_dir / self.META_FILE, "r", encoding="utf-8") as file_open:
+                meta: dict = yaml.safe_load(file_open)
+
+            return {
+                column: MinMaxPyramid(
+                    np.load(entry_dir / f"{index}.pyramid.npy", mmap_mode="r").view(
+                        np.ndarray
+                    ),
+                    meta["nr_of_rows"],
+                )
+                for index, column in enumerate(meta["columns"])
+                if (entry_dir / f"{index}.pyramid.npy").is_file()
+            }
+        except (OSError, ValueError, KeyError, yaml.YAMLError):
+            return {}
+
+    def evict(self) -> None:
+        """
+        Remove entries that were not accessed within the maximum age and then the least recently
+        used entries until the maximum number of entries and the maximum size are kept.
+        """
+        if not self.__cache_dir.is_dir():
+            return
+
+        # (last access, size, directory) of every entry, least recently used first
+        entries: list[tuple[float, int, Path]] = []
+        for entry_dir in self.__cache_dir.iterdir():
+            if entry_dir.name.endswith(".tmp"):
+                continue
+
+            try:
+                if not entry_dir.is_dir():
+                    continue
+                entries.append(
+                    (
+                        entry_dir.stat().st_mtime,
+                        sum(file.stat().st_size for file in entry_dir.iterdir()),
+                        entry_dir,
+                    )
+                )
+            except OSError:  # The entry got removed meanwhile, e.g. by another process
+                continue
+        entries.sort()
+
+        now: float = time.time()
+        total_size: int = sum(size for _, size, _ in entries)
+        nr_of_entries: int = len(entries)
+
+        for last_access, size, entry_dir in entries:
+            if (
+                (self.__max_age and now - last_access > self.__max_age)
+                or (self.__max_entries and nr_of_entries > self.__max_entries)
+                or (self.__max_size and total_size > self.__max_size)
+            ):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total_size -= size
+                nr_of_entries -= 1
+
+    @classmethod
+    def __store_column(cls, entry_dir: Path, index: int, column: pd.Series) -> None:
+        """
+        Store a column as a ".npy" file. Columns without a NumPy dtype are stored as
+        unicode strings with an additional mask of the missing values. Long numeric columns
+        are stored with their min/max pyramid.
+
+        Args:
+            entry_dir (Path): The cache directory of the file.
+            index (int): The index of the column.
+            column (pd.Series): The column to store.
+        """
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufcmM":
+            values: np.ndarray = column.to_numpy()
+            np.save(entry_dir / f"{index}.npy", values)
+
+            if column.dtype.kind in "biuf" and len(values) >= cls.PYRAMID_MIN_ROWS:
+                np.save(
+                    entry_dir / f"{index}.pyramid.npy",
+                    MinMaxPyramid.build(values).indices,
+                )
+        else:
+            missing_values: np.ndarray = column.isna().to_numpy()
+            np.save(
+                entry_dir / f"{index}.npy",
+                column.astype(str).to_numpy(dtype=str),
+            )
+            np.save(entry_dir / f"{index}.mask.npy", missing_values)
+
+    @staticmethod
+    def __load_column(entry_dir: Path, index: int, dtype: str) -> pd.Series:
+        """
+        Load a column from its ".npy" file.
+
+        Args:
+            entry_dir (Path): The cache directory of the file.
+            index (int): The index of the column.
+            dtype (str): The dtype of the column when it was stored.
+
+        Returns:
+            pd.Series: The loaded column.
+        """
+        # A plain array view on the memory map, so pandas treats it like any other array
+        values: np.ndarray = np.load(entry_dir / f"{index}.npy", mmap_mode="r").view(
+            np.ndarray
+        )
+
+        mask_path: Path = entry_dir / f"{index}.mask.npy"
+        if not mask_path.is_file():
+            return pd.Series(values, copy=False)
+
+        missing_values: np.ndarray = np.load(mask_path)
+        return pd.Series(values, dtype=object).mask(missing_values).astype(dtype)
@@ -2,11 +2,212 @@
 to reading and parsing CSV files. This includes loading data from a file, managing data frames, and providing
 access to the data for visualization purposes. """
 
+import os
+from importlib.util import find_spec
 from pathlib import Path
 from collections import defaultdict
-from typing import Literal
+from collections.abc import Iterator
+from typing import Any, BinaryIO, Literal
+import numpy as np
 import pandas as pd
 from utils.helper_functions import search_substring
+from utils.level_of_detail import MinMaxPyramid
+from models.csv_cache_manager import CSVCacheManager
+from models.csv_dialect import sniff_dialect
+
+
+def is_constant_column(
+    values: np.ndarray, value: Any, initial_block_size: int = 1024
+) -> bool:
+    """
+    Check if all values of a column are equal to a given value. NaN values are treated as equal.
+
+    The values are compared block by block with a growing block size, so the check exits early
+    as soon as a different value was found without comparing the whole column.
+
+    Args:
+        values (np.ndarray): The values of the column.
+        value (Any): The value to compare against.
+        initial_block_size (int, optional): The number of values of the first block. Defaults to 1024.
+
+    Returns:
+        bool: True if all values are equal to the given value, False otherwise.
+    """
+    value_is_na: bool = bool(pd.isna(value))
+    block_size: int = initial_block_size
+    start: int = 0
+
+    while start < len(values):
+        block: np.ndarray = values[start : start + block_size]
+
+        if value_is_na:
+            if not pd.isna(block).all():
+                return False
+        elif (block != value).any():
+            return False
+
+        start += block_size
+        block_size *= 2
+
+    return True
+
+
+def infer_dtypes(
+    sample: pd.DataFrame, max_category_ratio: float = 0.5
+) -> dict[str, Literal["float32", "integer", "bool", "category"]]:
+    """
+    Infer the narrowest safe dtypes of the columns from a sample of the rows.
+
+    Float columns whose values have at most as many significant digits as float32 preserves
+    become float32. Integer columns that only contain 0 and 1 become booleans, all other integer
+    columns are downcast to the smallest integer type of their values. Text columns with
+    repeated values become categoricals.
+
+    Args:
+        sample (pd.DataFrame): A sample of the rows of the CSV data.
+        max_category_ratio (float, optional): The maximum ratio of unique values to rows of
+                                                a text column to become a categorical. Defaults to 0.5.
+
+    Returns:
+        dict[str, Literal["float32", "integer", "bool", "category"]]: The inferred dtype of each
+                                                                        column that can be shrunk.
+    """
+    dtypes: dict[str, Literal["float32", "integer", "bool", "category"]] = {}
+
+    for column in sample.columns:
+        values: pd.Series = sample[column]
+
+        if pd.api.types.is_bool_dtype(values):
+            continue
+        elif pd.api.types.is_integer_dtype(values):
+            dtypes[column] = "bool" if values.isin([0, 1]).all() else "integer"
+        elif pd.api.types.is_float_dtype(values):
+            if is_float32_safe(values.to_numpy(dtype=np.float64)):
+                dtypes[column] = "float32"
+        elif values.nunique() <= max_category_ratio * len(values):
+            dtypes[column] = "category"
+
+    return dtypes
+
+
+def is_float32_safe(values: np.ndarray) -> bool:
+    """
+    Check if float values can be stored as float32 without losing any of their significant digits.
+
+    Args:
+        values (np.ndarray): The float values.
+
+    Returns:
+        bool: True if all values keep their significant digits as float32, False otherwise.
+    """
+    values = values[np.isfinite(values) & (values != 0)]
+    if values.size == 0:
+        return True
+
+    magnitudes: np.ndarray = np.abs(values)
+    if (
+        magnitudes.max() > np.finfo(np.float32).max
+        or magnitudes.min() < np.finfo(np.float32).tiny
+    ):
+        return False
+
+    # Shift every value so its significant digits are in front of the decimal point
+    exponents: np.ndarray = np.floor(np.log10(magnitudes))
+    scaled: np.ndarray = values * 10.0 ** (
+        np.finfo(np.float32).precision - 1 - exponents
+    )
+
+    return bool(np.all(np.abs(scaled - np.round(scaled)) < 1e-3))
+
+
+def split_header(
+    header: str,
+    prefix: str | None = None,
+    postfix: str | None = None,
+    separator: str = "",
+    order: bool = True,
+) -> tuple[str, str]:
+    """
+    Split the header of a column into the header and the sub-header, without the pre- and postfix.
+
+    Args:
+        header (str): The header of the column.
+        prefix (str, optional): The prefix of the header of the column. Defaults to None.
+        postfix (str, optional): The postfix of the header of the column. Defaults to None.
+        separator (str, optional): Separator to divide the header of the column into two substrings.
+                                    Defaults to "".
+        order (bool, optional): Indicator of which of the substrings comes first. If True, then the first
+                                half is the header else the second half. Defaults to True.
+
+    Returns:
+        tuple[str, str]: The header and the sub-header, which is empty without a separator.
+    """
+    header_modified: str = search_substring(header, prefix, postfix)
+
+    if separator == "":
+        return header_modified.strip(), ""
+
+    if order:
+        first_half, second_half = header_modified.split(separator)
+    else:
+        second_half, first_half = header_modified.split(separator)
+
+    return first_half.strip(), second_half.strip()
+
+
+class ParserBackend:
+    """
+    The parser backends of the CSV files.
+
+    AUTO: Select a backend by the file size.
+    PYARROW: Multi-threaded pandas parser of pyarrow, reads the whole file at once.
+    C: Default pandas parser, reads the file chunk by chunk.
+    PYTHON: Slow but most tolerant pandas parser, reads the file chunk by chunk.
+    """
+
+    AUTO: str = "auto"
+    PYARROW: str = "pyarrow"
+    C: str = "c"
+    PYTHON: str = "python"
+
+    BACKENDS: tuple[str, ...] = (AUTO, PYARROW, C, PYTHON)
+
+
+def select_parser_backend(
+    file_size: int, parser_backend: str = ParserBackend.AUTO, pyarrow_min_size: int = 0
+) -> str:
+    """
+    Select the parser backend of a CSV file.
+
+    The automatic selection uses pyarrow for files of at least the minimum size, because its
+    multi-threaded parser outweighs the missing chunk-wise progress only for large files.
+    Pyarrow is never selected if it is not installed.
+
+    Args:
+        file_size (int): The size of the CSV file in bytes.
+        parser_backend (str, optional): The requested parser backend. Defaults to ParserBackend.AUTO.
+        pyarrow_min_size (int, optional): The minimum file size in bytes to select pyarrow automatically.
+                                            Defaults to 0.
+
+    Raises:
+        ValueError: If the parser backend is unknown.
+
+    Returns:
+        str: The selected parser backend, never ParserBackend.AUTO.
+    """
+    if parser_backend not in ParserBackend.BACKENDS:
+        raise ValueError(f"Invalid parser backend: {parser_backend}!")
+
+    pyarrow_installed: bool = find_spec("pyarrow") is not None
+
+    if parser_backend == ParserBackend.AUTO:
+        if pyarrow_installed and file_size >= pyarrow_min_size:
+            return ParserBackend.PYARROW
+        return ParserBackend.C
+    elif parser_backend == ParserBackend.PYARROW and not pyarrow_installed:
+        return ParserBackend.C
+
+    return parser_backend
 
 
 class CSVDataManager:
@@ -14,13 +215,31 @@ class CSVDataManager:
     Class for CSV file operations.
     """
 
-    __slots__ = "__suffixes", "__file_path", "__raw_data_frame"
+    __slots__ = (
+        "__suffixes",
+        "__file_path",
+        "__raw_data_frame",
+        "__columns",
+        "__constant_values",
+        "__memory_saved",
+        "__dialect",
+        "__pyramids",
+    )
 
     def __init__(self) -> None:
         self.__suffixes: tuple[str, ...] = (".csv", ".CSV")
 
         self.__file_path: str
         self.__raw_data_frame: pd.DataFrame = pd.DataFrame()
+        self.__columns: list[str] = []
+        # The value of each column that is constant so far, None as long as no row was read
+        self.__constant_values: dict[str, Any] | None = None
+        # The memory in bytes saved by shrinking the dtypes while reading the file
+        self.__memory_saved: int = 0
+        # The encoding, delimiter, quote character and decimal separator, None until detected
+        self.__dialect: dict[str, str] | None = None
+        # The min/max pyramid of each long numeric column, loaded from the cache or built on demand
+        self.__pyramids: dict[str, MinMaxPyramid] = {}
 
     @property
     def file_path(self) -> str:
@@ -51,6 +270,10 @@ class CSVDataManager:
                 if self.__file_path != file_path:
                     self.__file_path = file_path
                     self.__raw_data_frame = pd.DataFrame()
+                    self.__columns = []
+                    self.__constant_values = None
+                    self.__dialect = None
+                    self.__pyramids = {}
             except AttributeError:
                 self.__file_path = file_path
 
@@ -64,6 +287,43 @@ class CSVDataManager:
         """
         return self.__raw_data_frame
 
+    @property
+    def columns(self) -> list[str]:
+        """
+        Get the column names of the CSV file.
+
+        While a file is read in chunks, the column names are already available
+        after the first chunk was parsed.
+
+        Returns:
+            list[str]: The column names of the CSV file.
+        """
+        return self.__columns
+
+    @property
+    def dialect(self) -> dict[str, str] | None:
+        """
+        Get the dialect of the CSV file.
+
+        The dialect is detected from the first bytes of the file when it is read for the first time
+        and reused by every further read of the same file.
+
+        Returns:
+            dict[str, str] | None: The encoding, delimiter, quote character and decimal separator
+                                    of the CSV file or None if it was not read yet.
+        """
+        return self.__dialect
+
+    @property
+    def memory_saved(self) -> int:
+        """
+        Get the memory saved by shrinking the dtypes of the columns while reading the file.
+
+        Returns:
+            int: The saved memory in bytes.
+        """
+        return self.__memory_saved
+
     def read_file(self, file_path: str) -> None:
         """
         Open a CSV file and read the data.
@@ -78,9 +338,160 @@ class CSVDataManager:
         self.file_path = file_path
 
         try:
-            self.__raw_data_frame = pd.read_csv(
-                self.file_path, delimiter=";", quotechar="|"
+            self.__raw_data_frame = self.__read_csv(self.file_path)
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(
+                f"The file {self.file_path} was not found!"
+            ) from exc
+        except pd.errors.EmptyDataError as exc:
+            raise pd.errors.EmptyDataError(
+                f"No columns to parse from file: {self.file_path}"
+            ) from exc
+
+        self.__columns = self.__raw_data_frame.columns.tolist()
+        self.__constant_values = None
+        self.__pyramids = {}
+        self.__update_constant_values(self.__raw_data_frame)
+
+    def read_header(
+        self, file_path: str, dialect: dict[str, str] | None = None
+    ) -> None:
+        """
+        Open a CSV file and read only its header row.
+
+        The column names are available through `columns` afterwards, while the data
+        of the file can be read later on with `read_file_in_chunks`.
+
+        Args:
+            file_path (str): The CSV file path.
+            dialect (dict[str, str] | None, optional): A known dialect of the file, e.g. from the
+                                                        recent files, instead of detecting it. Defaults to None.
+
+        Raises:
+            FileNotFoundError: If the file was not found.
+            pd.errors.EmptyDataError: If the file is empty.
+        """
+        self.file_path = file_path
+        self.__raw_data_frame = pd.DataFrame()
+        self.__constant_values = None
+        self.__pyramids = {}
+        if dialect is not None:
+            self.__dialect = dict(dialect)
+
+        try:
+            self.__columns = self.__read_csv(self.file_path, nrows=0).columns.tolist()
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(
+                f"The file {self.file_path} was not found!"
+            ) from exc
+        except pd.errors.EmptyDataError as exc:
+            raise pd.errors.EmptyDataError(
+                f"No columns to parse from file: {self.file_path}"
+            ) from exc
+
+    def read_file_in_chunks(
+        self,
+        file_path: str,
+        chunk_size: int,
+        cache_manager: CSVCacheManager | None = None,
+        optimize_dtypes: bool = False,
+        sample_size: int = 1000,
+        parser_backend: str = ParserBackend.C,
+        pyarrow_min_size: int = 0,
+    ) -> Iterator[float]:
+        """
+        Open a CSV file and read the data chunk by chunk, yielding the progress after each chunk.
+
+        The column names are available through `columns` after the first chunk. The columns are
+        classified chunk by chunk and the chunks are concatenated only once after the last chunk,
+        so `raw_data` holds the complete data frame when the iteration is finished.
+
+        If a cache manager is given, a cached version of the file is loaded instead of parsing
+        the file and a parsed file is stored in the cache. Only a version parsed with the same
+        dialect and the same dtype and parser settings is loaded.
+
+        If the dtypes are optimized, the narrowest safe dtypes are inferred from a sample of the
+        first rows. Integer columns are shrunk and float columns verified chunk by chunk right
+        after parsing, float32 columns, booleans and categoricals are created once all chunks
+        are read. The saved memory is available through `memory_saved` afterwards.
+
+        Closing the iterator stops the reading at the next chunk boundary, e.g. to cancel it,
+        and discards the chunks read so far.
+
+        The pyarrow parser reads the whole file at once, so the progress is yielded only when
+        the file is read. If pyarrow fails to parse the file, e.g. because of quoting edge cases
+        or rows with missing fields, the file is read chunk by chunk with the C parser instead.
+
+        Args:
+            file_path (str): The CSV file path.
+            chunk_size (int): The number of rows per chunk.
+            cache_manager (CSVCacheManager | None, optional): The cache of parsed CSV files. Defaults to None.
+            optimize_dtypes (bool, optional): Indicator if the dtypes of the columns are shrunk. Defaults to False.
+            sample_size (int, optional): The number of rows to infer the dtypes from. Defaults to 1000.
+            parser_backend (str, optional): The parser backend, see `ParserBackend`. Defaults to ParserBackend.C.
+            pyarrow_min_size (int, optional): The minimum file size in bytes to select pyarrow automatically.
+                                                Defaults to 0.
+
+        Raises:
+            FileNotFoundError: If the file was not found.
+            pd.errors.EmptyDataError: If the file is empty.
+            ValueError: If the parser backend is unknown.
+
+        Yields:
+            Iterator[float]: The progress of reading the file in percent.
+        """
+        self.file_path = file_path
+        self.__raw_data_frame = pd.DataFrame()
+        self.__columns = []
+        self.__constant_values = None
+        self.__memory_saved = 0
+        self.__pyramids = {}
+
+        cache_settings: dict[str, Any] = {}
+        if cache_manager is not None:
+            try:
+                cache_settings = self.__get_cache_settings(
+                    optimize_dtypes, sample_size, parser_backend, pyarrow_min_size
+                )
+            except FileNotFoundError as exc:
+                raise FileNotFoundError(
+                    f"The file {self.file_path} was not found!"
+                ) from exc
+
+            cached_data_frame: pd.DataFrame | None = cache_manager.load(
+                self.file_path, cache_settings
+            )
+            if cached_data_frame is not None:
+                self.__set_cached_data_frame(cached_data_frame)
+                self.__pyramids = cache_manager.load_pyramids(
+                    self.file_path, cache_settings
+                )
+
+                yield 100.0
+                return
+
+        try:
+            dtypes: dict[str, Literal["float32", "integer", "bool", "category"]] = {}
+            if optimize_dtypes:
+                dtypes = infer_dtypes(self.__read_csv(self.file_path, nrows=sample_size))
+
+            parser_backend = select_parser_backend(
+                os.path.getsize(self.file_path), parser_backend, pyarrow_min_size
             )
+            chunks: list[pd.DataFrame] = []
+            for chunk, progress in self.__parse_chunks(chunk_size, parser_backend):
+                chunk = self.__shrink_numeric_dtypes(chunk, dtypes)
+                if not chunks:
+                    self.__columns = chunk.columns.tolist()
+                chunks.append(chunk)
+                self.__update_constant_values(chunk)
+
+                yield progress
+        except GeneratorExit:
+            # The reading got stopped at a chunk boundary, no incomplete data is kept
+            self.__raw_data_frame = pd.DataFrame()
+            self.__constant_values = None
+            raise
         except FileNotFoundError as exc:
             raise FileNotFoundError(
                 f"The file {self.file_path} was not found!"
@@ -90,6 +501,289 @@ class CSVDataManager:
                 f"No columns to parse from file: {self.file_path}"
             ) from exc
 
+        self.__raw_data_frame = pd.concat(chunks, ignore_index=True)
+
+        if optimize_dtypes:
+            self.__shrink_dtypes(dtypes)
+
+        if cache_manager is not None:
+            self.__raw_data_frame.attrs["constant_values"] = {
+                column: value.item() if isinstance(value, np.generic) else value
+                for column, value in (self.__constant_values or {}).items()
+            }
+            self.__raw_data_frame.attrs["memory_saved"] = self.__memory_saved
+            cache_manager.store(self.file_path, self.__raw_data_frame, cache_settings)
+
+            # Continue with the memory-mapped columns, so only accessed columns stay in memory
+            cached_data_frame = cache_manager.load(self.file_path, cache_settings)
+            if cached_data_frame is not None:
+                self.__set_cached_data_frame(cached_data_frame)
+                self.__pyramids = cache_manager.load_pyramids(
+                    self.file_path, cache_settings
+                )
+
+    def __get_cache_settings(
+        self,
+        optimize_dtypes: bool,
+        sample_size: int,
+        parser_backend: str,
+        pyarrow_min_size: int,
+    ) -> dict[str, Any]:
+        """
+        Get the settings the read data depends on, so data cached with other settings is not loaded.
+        The dialect is detected if it is not known yet.
+
+        Args:
+            optimize_dtypes (bool): Indicator if the dtypes of the columns are shrunk.
+            sample_size (int): The number of rows to infer the dtypes from.
+            parser_backend (str): The parser backend, see `ParserBackend`.
+            pyarrow_min_size (int): The minimum file size in bytes to select pyarrow automatically.
+
+        Raises:
+            FileNotFoundError: If the file was not found.
+
+        Returns:
+            dict[str, Any]: The dialect, the dtype settings and the parser settings.
+        """
+        if self.__dialect is None:
+            self.__dialect = sniff_dialect(self.file_path)
+
+        return {
+            "dialect": dict(self.__dialect),
+            "optimize_dtypes": optimize_dtypes,
+            "sample_size": sample_size if optimize_dtypes else None,
+            "parser_backend": parser_backend,
+            "pyarrow_min_size": pyarrow_min_size,
+        }
+
+    def __read_csv(self, source: str | BinaryIO, **kwargs: Any) -> Any:
+        """
+        Read a CSV file with its dialect. The dialect is detected once on the first read.
+
+        Args:
+            source (str | BinaryIO): The CSV file path or the opened CSV file.
+            **kwargs (Any): Further arguments of `pd.read_csv`, e.g. the engine or the chunk size.
+
+        Returns:
+            Any: The data frame or the chunk reader if a chunk size is given.
+        """
+        if self.__dialect is None:
+            self.__dialect = sniff_dialect(self.file_path)
+
+        return pd.read_csv(source, **self.__dialect, **kwargs)
+
+    def __parse_chunks(
+        self, chunk_size: int, parser_backend: str
+    ) -> Iterator[tuple[pd.DataFrame, float]]:
+        """
+        Parse the CSV file with a parser backend.
+
+        Args:
+            chunk_size (int): The number of rows per chunk.
+            parser_backend (str): The selected parser backend.
+
+        Yields:
+            Iterator[tuple[pd.DataFrame, float]]: Each parsed chunk and the progress in percent.
+        """
+        if parser_backend == ParserBackend.PYARROW:
+            try:
+                data_frame: pd.DataFrame = self.__read_csv(
+                    self.file_path, engine=ParserBackend.PYARROW
+                )
+            except ValueError:
+                # Pyarrow is strict, let the C parser deal with the rows it rejects
+                parser_backend = ParserBackend.C
+            else:
+                yield data_frame, 100.0
+                return
+
+        file_size: int = os.path.getsize(self.file_path)
+        with open(self.file_path, "rb") as file_open:
+            with self.__read_csv(
+                file_open, engine=parser_backend, chunksize=chunk_size
+            ) as reader:
+                for chunk in reader:
+                    yield chunk, min(file_open.tell() / max(file_size, 1) * 100, 100.0)
+
+    def __set_cached_data_frame(self, cached_data_frame: pd.DataFrame) -> None:
+        """
+        Set the data loaded from the cache. The classification is taken from the cache as well,
+        so the memory-mapped columns do not need to be read.
+
+        Args:
+            cached_data_frame (pd.DataFrame): The data loaded from the cache.
+        """
+        self.__raw_data_frame = cached_data_frame
+        self.__columns = cached_data_frame.columns.tolist()
+        self.__memory_saved = cached_data_frame.attrs.get("memory_saved", 0)
+
+        if "constant_values" in cached_data_frame.attrs:
+            self.__constant_values = cached_data_frame.attrs["constant_values"]
+        else:
+            self.__constant_values = None
+            self.__update_constant_values(cached_data_frame)
+
+    @staticmethod
+    def __shrink_numeric_dtypes(
+        chunk: pd.DataFrame,
+        dtypes: dict[str, Literal["float32", "integer", "bool", "category"]],
+    ) -> pd.DataFrame:
+        """
+        Shrink the integer columns of a parsed chunk and verify its float columns. Integer
+        columns of the chunk that turned out not to match their inferred dtype are kept as they
+        are, so the chunks are upcast again when they are concatenated. A float column is only
+        cast to float32 once all chunks are read, so it is removed from the inferred dtypes if
+        one chunk does not fit.
+
+        Args:
+            chunk (pd.DataFrame): The parsed chunk.
+            dtypes (dict[str, Literal["float32", "integer", "bool", "category"]]): The inferred dtypes.
+
+        Returns:
+            pd.DataFrame: The chunk with the shrunk columns.
+        """
+        for column, dtype in list(dtypes.items()):
+            if dtype == "float32":
+                if not pd.api.types.is_float_dtype(chunk[column]) or not is_float32_safe(
+                    chunk[column].to_numpy(dtype=np.float64)
+                ):
+                    del dtypes[column]
+            elif dtype in ("integer", "bool") and pd.api.types.is_integer_dtype(
+                chunk[column]
+            ):
+                chunk[column] = pd.to_numeric(chunk[column], downcast="integer")
+
+        return chunk
+
+    def __shrink_dtypes(
+        self, dtypes: dict[str, Literal["float32", "integer", "bool", "category"]]
+    ) -> None:
+        """
+        Create the float32, boolean and categorical columns of the read data and calculate
+        the memory saved compared to the default dtypes.
+
+        Args:
+            dtypes (dict[str, Literal["float32", "integer", "bool", "category"]]): The inferred dtypes.
+        """
+        nr_of_rows: int = len(self.__raw_data_frame)
+
+        # Without shrinking, every numeric column would take 8 bytes per value
+        default_memory: int = 0
+        for column in self.__raw_data_frame.columns:
+            values: pd.Series = self.__raw_data_frame[column]
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(
+                values
+            ):
+                default_memory += 8 * nr_of_rows
+            else:
+                default_memory += values.memory_usage(deep=True, index=False)
+
+        for column, dtype in dtypes.items():
+            values = self.__raw_data_frame[column]
+            if dtype == "float32" and pd.api.types.is_float_dtype(values):
+                self.__raw_data_frame[column] = values.astype(np.float32)
+            elif (
+                dtype == "bool"
+                and pd.api.types.is_integer_dtype(values)
+                and values.isin([0, 1]).all()
+            ):
+                self.__raw_data_frame[column] = values.astype(bool)
+            elif dtype == "category" and not pd.api.types.is_numeric_dtype(values):
+                self.__raw_data_frame[column] = values.astype("category")
+
+        self.__memory_saved = max(
+            default_memory
+            - int(self.__raw_data_frame.memory_usage(deep=True, index=False).sum()),
+            0,
+        )
+
+    def __update_constant_values(self, data_frame: pd.DataFrame) -> None:
+        """
+        Update the values of the columns that are constant so far with the rows of a data frame.
+        Columns that are already known to be not constant are not compared again.
+
+        Args:
+            data_frame (pd.DataFrame): The (chunk of the) read CSV data.
+        """
+        if data_frame.empty:
+            return
+
+        if self.__constant_values is None:
+            self.__constant_values = {
+                column: data_frame[column].iat[0] for column in data_frame.columns
+            }
+
+        self.__constant_values = {
+            column: value
+            for column, value in self.__constant_values.items()
+            if is_constant_column(data_frame[column].to_numpy(), value)
+        }
+
+    def get_column(self, column: str) -> np.ndarray:
+        """
+        Get the values of a column as a read-only array. For numeric columns the array is a view
+        on the stored data, which is memory-mapped if the file was loaded from the cache, so no
+        other column is copied or loaded.
+
+        Args:
+            column (str): The name of the column.
+
+        Raises:
+            KeyError: If the column was not found.
+
+        Returns:
+            np.ndarray: The read-only values of the column.
+        """
+        if column not in self.__raw_data_frame.columns:
+            raise KeyError(f"The column {column} was not found!")
+
+        values: np.ndarray = self.__raw_data_frame[column].to_numpy().view()
+        values.flags.writeable = False
+
+        return values
+
+    def get_columns(self, columns: list[str]) -> dict[str, np.ndarray]:
+        """
+        Get the values of several columns as read-only arrays.
+
+        Args:
+            columns (list[str]): The names of the columns.
+
+        Raises:
+            KeyError: If a column was not found.
+
+        Returns:
+            dict[str, np.ndarray]: The read-only values of each column.
+        """
+        return {column: self.get_column(column) for column in columns}
+
+    def get_pyramid(self, column: str) -> MinMaxPyramid | None:
+        """
+        Get the min/max pyramid of a numeric column, e.g. to decimate it for plotting.
+        A pyramid which was not loaded from the cache is built on the first access.
+
+        Args:
+            column (str): The name of the column.
+
+        Raises:
+            KeyError: If the column was not found.
+
+        Returns:
+            MinMaxPyramid | None: The pyramid of the column or None if the column is not numeric
+                                    or too short to need one.
+        """
+        if column not in self.__pyramids:
+            values: np.ndarray = self.get_column(column)
+            if (
+                values.dtype.kind not in "biuf"
+                or len(values) < CSVCacheManager.PYRAMID_MIN_ROWS
+            ):
+                return None
+
+            self.__pyramids[column] = MinMaxPyramid.build(values)
+
+        return self.__pyramids[column]
+
     def get_raw_data_columns_count(self) -> int:
         """
         Get the number of columns from the CSV file.
@@ -97,7 +791,22 @@ class CSVDataManager:
         Returns:
             int: The number of columns from the CSV file.
         """
-        return len(self.__raw_data_frame.columns)
+        return len(self.__columns)
+
+    def get_header_list(
+        self, prefix: str | None = None, postfix: str | None = None
+    ) -> list[str]:
+        """
+        Get the headers of the CSV file without their pre- and postfix.
+
+        Args:
+            prefix (str, optional): The prefix of the header of the column. Defaults to None.
+            postfix (str, optional): The postfix of the header of the column. Defaults to None.
+
+        Returns:
+            list[str]: The headers of the CSV file.
+        """
+        return [search_substring(column, prefix, postfix) for column in self.__columns]
 
     def get_classified_headers(
         self,
@@ -115,6 +824,8 @@ class CSVDataManager:
             1 - 'constant at exactly zero'
             2 - 'constant at a value different from zero'
 
+        As long as only the header row was read, every column is classified as 'not constant'.
+
         Args:
             exclude_index (int): Index of the column to exclude from classification.
             prefix (str, optional): The prefix of the header of the column. Defaults to None.
@@ -130,73 +841,97 @@ class CSVDataManager:
                                                             substring and its classification as values.
         """
         # Determine the columns to process, excluding the specified index
-        columns_to_process: list[str] = self.raw_data.columns.tolist()
+        columns_to_process: list[str] = self.columns
         columns_to_process = (
             columns_to_process[:exclude_index] + columns_to_process[exclude_index + 1 :]
         )
 
-        # Vectorized classification using efficient operations
         column_classification: defaultdict[
             str, list[Literal[0, 1, 2]] | list[tuple[str, Literal[0, 1, 2]]]
         ] = defaultdict(list)
 
-        raw_data_copy: pd.DataFrame = self.raw_data.copy()
-
         for column in columns_to_process:
-            unique_values = raw_data_copy[column].unique()
-
-            column_modified: str = search_substring(column, prefix, postfix)
-
-            if separator != "":
-                if order:
-                    column_first_half, column_second_half = column_modified.split(
-                        separator
-                    )
-                else:
-                    column_second_half, column_first_half = column_modified.split(
-                        separator
-                    )
-
-                column_first_half = column_first_half.strip()
-                column_second_half = column_second_half.strip()
-            else:
-                column_first_half = column_modified
-
-            classification: Literal[0, 1, 2] = (
-                0 if len(unique_values) > 1 else 1 if unique_values[0] == 0 else 2
+            column_first_half, column_second_half = split_header(
+                column, prefix, postfix, separator, order
             )
+            classification: Literal[0, 1, 2] = self.get_column_classification(column)
 
             if separator != "":
-                column_classification[column_first_half.strip()].append(
-                    (column_second_half.strip(), classification)
+                column_classification[column_first_half].append(
+                    (column_second_half, classification)
                 )
             else:
-                column_classification[column_first_half.strip()].append(classification)
+                column_classification[column_first_half].append(classification)
 
         return column_classification
 
-    def export_to_excel(self, file_path: str) -> None:
+    def get_column_classification(self, column: str) -> Literal[0, 1, 2]:
         """
-        Export CSV data to an excel file.
+        Get the classification of a column, see `get_classified_headers`.
 
         Args:
-            file_path (str): The CSV file path.
+            column (str): The column name.
+
+        Returns:
+            Literal[0, 1, 2]: The classification of the column.
+        """
+        # The classification was already done while reading the file
+        constant_values: dict[str, Any] = self.__constant_values or {}
+
+        if column not in constant_values:
+            return 0
+
+        return 1 if constant_values[column] == 0 else 2
+
+    def get_snapshot(self, file_path: str) -> pd.DataFrame:
+        """
+        Get a snapshot of the read data, which is not affected by reading another file.
+
+        Args:
+            file_path (str): The CSV file path the data has to be read from.
 
         Raises:
-            pd.errors.EmptyDataError: If the file is empty.
+            pd.errors.EmptyDataError: If the file is empty or not read.
+
+        Returns:
+            pd.DataFrame: The read data.
         """
-        self.file_path = file_path
+        try:
+            current_file_path: str | None = self.__file_path
+        except AttributeError:  # No file was set yet
+            current_file_path = None
+        data_frame: pd.DataFrame = self.__raw_data_frame
 
-        if not self.__raw_data_frame.empty:
-            self.__raw_data_frame.to_excel(
-                self.file_path.replace(".csv", ".xlsx"),
-                engine="xlsxwriter",
-                index=False,
-            )
-        else:
+        if current_file_path != file_path or data_frame.empty:
             raise pd.errors.EmptyDataError(
-                f"No columns to parse from file: {self.file_path}"
+                f"No columns to parse from file: {file_path}"
             )
 
+        # The data is only copied if either of them is changed
+        return data_frame.copy(deep=False)
+
+    def export_to_excel(
+        self, file_path: str, data_frame: pd.DataFrame | None = None
+    ) -> None:
+        """
+        Export CSV data to an excel file. The read data is not changed, so reading another file
+        is not affected.
+
+        Args:
+            file_path (str): The CSV file path.
+            data_frame (pd.DataFrame | None, optional): A snapshot of the data to export, see `get_snapshot`.
+                                                        Defaults to None for the read data of the file.
+
+        Raises:
+            pd.errors.EmptyDataError: If the file is empty or not read.
+        """
+        if data_frame is None:
+            data_frame = self.get_snapshot(file_path)
+
+        data_frame.to_excel(
+            file_path.replace(".csv", ".xlsx"),
+            engine="xlsxwriter",
+            index=False,
+        )
 
 csv_data_manager = CSVDataManager()
@@ -0,0 +1,288 @@
+""" Defines the CSVDatasetManager class which loads several CSV files concurrently in a process pool,
+    e.g. to compare the runs of a test campaign, and keeps each file as its own dataset. """
+
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Literal
+import pandas as pd
+from models.csv_cache_manager import CSVCacheManager
+from models.csv_data_manager import CSVDataManager, ParserBackend, split_header
+
+
+def read_dataset(
+    file_path: str,
+    chunk_size: int,
+    cache_manager: CSVCacheManager | None = None,
+    optimize_dtypes: bool = False,
+    sample_size: int = 1000,
+    parser_backend: str = ParserBackend.C,
+    pyarrow_min_size: int = 0,
+) -> CSVDataManager | None:
+    """
+    Read a CSV file in a worker process.
+
+    Args:
+        file_path (str): The CSV file path.
+        chunk_size (int): The number of rows per chunk.
+        cache_manager (CSVCacheManager | None, optional): The cache of parsed CSV files. Defaults to None.
+        optimize_dtypes (bool, optional): Indicator if the dtypes of the columns are shrunk. Defaults to False.
+        sample_size (int, optional): The number of rows to infer the dtypes from. Defaults to 1000.
+        parser_backend (str, optional): The parser backend, see `ParserBackend`. Defaults to ParserBackend.C.
+        pyarrow_min_size (int, optional): The minimum file size in bytes to select pyarrow automatically.
+                                            Defaults to 0.
+
+    Returns:
+        CSVDataManager | None: The read file or None if it was stored in the cache.
+    """
+    data_manager: CSVDataManager = CSVDataManager()
+    for _ in data_manager.read_file_in_chunks(
+        file_path,
+        chunk_size,
+        cache_manager,
+        optimize_dtypes,
+        sample_size,
+        parser_backend,
+        pyarrow_min_size,
+    ):
+        pass
+
+    # A cached file is loaded memory-mapped from the cache, instead of copying it between processes
+    return None if cache_manager is not None else data_manager
+
+
+class CSVDatasetManager:
+    """
+    Class for operations on several CSV files at once.
+
+    Every file is a dataset of its own, held by a `CSVDataManager`. The header index maps the union
+    of the headers of all datasets to the files containing them, in the order of their first appearance.
+    """
+
+    __slots__ = "__datasets", "__header_index", "__errors"
+
+    def __init__(self) -> None:
+        self.__datasets: dict[str, CSVDataManager] = {}
+        self.__header_index: dict[str, list[str]] = {}
+        # The error message of each file that could not be read
+        self.__errors: dict[str, str] = {}
+
+    @property
+    def datasets(self) -> dict[str, CSVDataManager]:
+        """
+        Get the datasets.
+
+        Returns:
+            dict[str, CSVDataManager]: The read data of each CSV file path.
+        """
+        return self.__datasets
+
+    @property
+    def header_index(self) -> dict[str, list[str]]:
+        """
+        Get the header index.
+
+        Returns:
+            dict[str, list[str]]: The CSV file paths containing each header.
+        """
+        return self.__header_index
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """
+        Get the errors of the last loading.
+
+        Returns:
+            dict[str, str]: The error message of each CSV file path that could not be read.
+        """
+        return self.__errors
+
+    def clear(self) -> None:
+        """
+        Remove all datasets.
+        """
+        self.__datasets = {}
+        self.__header_index = {}
+        self.__errors = {}
+
+    def load_files(
+        self,
+        file_paths: list[str],
+        chunk_size: int,
+        cache_manager: CSVCacheManager | None = None,
+        optimize_dtypes: bool = False,
+        sample_size: int = 1000,
+        parser_backend: str = ParserBackend.C,
+        pyarrow_min_size: int = 0,
+        max_workers: int | None = None,
+    ) -> Iterator[float]:
+        """
+        Read several CSV files concurrently in a process pool, yielding the progress after each file.
+
+        Files which can not be read are skipped and their error messages are available through `errors`.
+        Closing the iterator stops the loading, the files which are read at that moment are finished
+        but not kept.
+        With a cache manager, the workers store the parsed files in the cache and the datasets are loaded
+        memory-mapped from it, so the data is not copied from the worker processes.
+
+        Args:
+            file_paths (list[str]): The CSV file paths.
+            chunk_size (int): The number of rows per chunk.
+            cache_manager (CSVCacheManager | None, optional): The cache of parsed CSV files. Defaults to None.
+            optimize_dtypes (bool, optional): Indicator if the dtypes of the columns are shrunk. Defaults to False.
+            sample_size (int, optional): The number of rows to infer the dtypes from. Defaults to 1000.
+            parser_backend (str, optional): The parser backend, see `ParserBackend`. Defaults to ParserBackend.C.
+            pyarrow_min_size (int, optional): The minimum file size in bytes to select pyarrow automatically.
+                                                Defaults to 0.
+            max_workers (int | None, optional): The maximum number of worker processes,
+                                                None for the number of processors. Defaults to None.
+
+        Yields:
+            Iterator[float]: The progress of reading the files in percent.
+        """
+        self.clear()
+        file_paths = list(dict.fromkeys(file_paths))
+        if not file_paths:
+            return
+
+        datasets: dict[str, CSVDataManager] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or len(file_paths), len(file_paths))
+        ) as executor:
+            futures: dict[Future, str] = {
+                executor.submit(
+                    read_dataset,
+                    file_path,
+                    chunk_size,
+                    cache_manager,
+                    optimize_dtypes,
+                    sample_size,
+                    parser_backend,
+                    pyarrow_min_size,
+                ): file_path
+                for file_path in file_paths
+            }
+
+            for nr_of_files_read, future in enumerate(as_completed(futures), start=1):
+                file_path: str = futures[future]
+                try:
+                    data_manager: CSVDataManager | None = future.result()
+                    if data_manager is None:
+                        # Loaded from the cache, unless the entry got evicted meanwhile or
+                        # could not be stored, then the file is read again with the same settings
+                        data_manager = CSVDataManager()
+                        for _ in data_manager.read_file_in_chunks(
+                            file_path,
+                            chunk_size,
+                            cache_manager,
+                            optimize_dtypes,
+                            sample_size,
+                            parser_backend,
+                            pyarrow_min_size,
+                        ):
+                            pass
+                except (OSError, pd.errors.EmptyDataError, ValueError) as exc:
+                    self.__errors[file_path] = str(exc)
+                else:
+                    datasets[file_path] = data_manager
+
+                try:
+                    yield nr_of_files_read / len(file_paths) * 100
+                except GeneratorExit:
+                    # The loading got stopped, the files not started yet are not read anymore
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    self.clear()
+                    raise
+
+        # Keep the order of the given files, not the order in which they were read
+        for file_path in file_paths:
+            if file_path in datasets:
+                self.__datasets[file_path] = datasets[file_path]
+                for column in datasets[file_path].columns:
+                    self.__header_index.setdefault(column, []).append(file_path)
+
+    def get_dataset(self, file_path: str) -> CSVDataManager:
+        """
+        Get the dataset of a CSV file.
+
+        Args:
+            file_path (str): The CSV file path.
+
+        Raises:
+            KeyError: If the file was not loaded.
+
+        Returns:
+            CSVDataManager: The read data of the CSV file.
+        """
+        try:
+            return self.__datasets[file_path]
+        except KeyError as exc:
+            raise KeyError(f"The file {file_path} was not loaded!") from exc
+
+    def get_classified_headers(
+        self,
+        exclude_index: int,
+        prefix: str | None = None,
+        postfix: str | None = None,
+        separator: str = "",
+        order: bool = True,
+    ) -> defaultdict[
+        str,
+        list[dict[str, Literal[0, 1, 2]]]
+        | list[tuple[str, dict[str, Literal[0, 1, 2]]]],
+    ]:
+        """
+        Classify the union of the headers of all datasets, see `CSVDataManager.get_classified_headers`.
+
+        Instead of a single classification, every header has the classification of each file containing it.
+
+        Args:
+            exclude_index (int): Index of the column of each file to exclude from classification.
+            prefix (str, optional): The prefix of the header of the column. Defaults to None.
+            postfix (str, optional): The postfix of the header of the column. Defaults to None.
+            separator (str, optional): Separator to divide the header of the column into two substrings.
+                                        Defaults to "".
+            order (bool, optional): Indicator of which of the substrings will be the key and which part of the value.
+                                                If True, then the first half will be the key else the second half. Defaults to True.
+
+        Returns:
+            defaultdict[str, list[dict[str, Literal[0, 1, 2]]] | list[tuple[str, dict[str, Literal[0, 1, 2]]]]]:
+                A dictionary with the header of the column or a substring of it as keys and a list of the
+                classification of each file or a tuple of the other substring and the classification of each file.
+        """
+        excluded_columns: set[str] = {
+            data_manager.columns[exclude_index]
+            for data_manager in self.__datasets.values()
+            if -len(data_manager.columns) <= exclude_index < len(data_manager.columns)
+        }
+
+        column_classification: defaultdict[
+            str,
+            list[dict[str, Literal[0, 1, 2]]]
+            | list[tuple[str, dict[str, Literal[0, 1, 2]]]],
+        ] = defaultdict(list)
+
+        for column, file_paths in self.__header_index.items():
+            if column in excluded_columns:
+                continue
+
+            column_first_half, column_second_half = split_header(
+                column, prefix, postfix, separator, order
+            )
+            classification: dict[str, Literal[0, 1, 2]] = {
+                file_path: self.__datasets[file_path].get_column_classification(column)
+                for file_path in file_paths
+            }
+
+            if separator != "":
+                column_classification[column_first_half].append(
+                    (column_second_half, classification)
+                )
+            else:
+                column_classification[column_first_half].append(classification)
+
+        return column_classification
+
+
+csv_dataset_manager = CSVDatasetManager()
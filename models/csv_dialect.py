@@ -0,0 +1,184 @@
+""" Defines functions to detect the dialect of a CSV file, i.e. its encoding, delimiter,
+    quote character and decimal separator, from the first bytes of the file. """
+
+import codecs
+import re
+
+# The dialect of the CSV files written by the test benches
+DEFAULT_DIALECT: dict[str, str] = {
+    "encoding": "utf-8",
+    "delimiter": ";",
+    "quotechar": "|",
+    "decimal": ".",
+}
+
+DELIMITERS: tuple[str, ...] = (";", ",", "\t", "|")
+QUOTECHARS: tuple[str, ...] = ('"', "|", "'")
+
+
+def sniff_dialect(file_path: str, sample_size: int = 64 * 1024) -> dict[str, str]:
+    """
+    Detect the dialect of a CSV file. Only the first bytes of the file are read once.
+
+    Args:
+        file_path (str): The CSV file path.
+        sample_size (int, optional): The number of bytes to read. Defaults to 64 * 1024.
+
+    Raises:
+        FileNotFoundError: If the file was not found.
+
+    Returns:
+        dict[str, str]: The encoding, the delimiter, the quote character and the decimal separator,
+                        which can be passed to `pd.read_csv` as they are.
+    """
+    with open(file_path, "rb") as file_open:
+        sample: bytes = file_open.read(sample_size)
+
+    encoding: str = sniff_encoding(sample)
+    text: str = (
+        codecs.getincrementaldecoder(encoding)(errors="replace")
+        .decode(sample)
+        .replace("\r\n", "\n")
+    )
+
+    # The last line of a truncated sample is incomplete
+    if len(sample) == sample_size and "\n" in text:
+        text = text[: text.rindex("\n")]
+
+    quotechar: str = sniff_quotechar(text)
+    # Quoted values may contain any character, so only the unquoted text is analysed
+    unquoted_text: str = re.sub(
+        f"{re.escape(quotechar)}[^{re.escape(quotechar)}]*{re.escape(quotechar)}",
+        "",
+        text,
+    )
+    delimiter: str = sniff_delimiter(unquoted_text, quotechar)
+
+    return {
+        "encoding": encoding,
+        "delimiter": delimiter,
+        "quotechar": quotechar,
+        "decimal": sniff_decimal(unquoted_text, delimiter),
+    }
+
+
+def sniff_encoding(sample: bytes) -> str:
+    """
+    Detect the encoding of the first bytes of a file by its byte order mark or by decoding it.
+
+    Args:
+        sample (bytes): The first bytes of the file.
+
+    Returns:
+        str: The encoding.
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+
+    for encoding in ("utf-8", "cp1252"):
+        try:
+            # An incremental decoder ignores a character cut off at the end of the sample
+            codecs.getincrementaldecoder(encoding)().decode(sample)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+
+    # Every byte is a valid latin-1 character
+    return "latin-1"
+
+
+def sniff_quotechar(text: str) -> str:
+    """
+    Detect the quote character as the one enclosing most of the values.
+
+    Args:
+        text (str): The decoded first lines of the file.
+
+    Returns:
+        str: The quote character or '"' if no values are quoted.
+    """
+    counts: dict[str, int] = {}
+    for quotechar in QUOTECHARS:
+        delimiters: str = re.escape(
+            "".join(delimiter for delimiter in DELIMITERS if delimiter != quotechar)
+        )
+        quote: str = re.escape(quotechar)
+        counts[quotechar] = len(
+            re.findall(
+                f"(?:^|[{delimiters}]){quote}[^{quote}]*{quote}(?=[{delimiters}]|$)",
+                text,
+                re.MULTILINE,
+            )
+        )
+
+    quotechar: str = max(counts, key=counts.__getitem__)
+
+    return quotechar if counts[quotechar] else '"'
+
+
+def sniff_delimiter(text: str, quotechar: str = '"') -> str:
+    """
+    Detect the delimiter as the character that occurs in the header and equally often in most
+    of the following lines. A decimal comma therefore does not count, as it is missing in the header.
+
+    Args:
+        text (str): The decoded first lines of the file without the quoted values.
+        quotechar (str, optional): The quote character, which cannot be the delimiter. Defaults to '"'.
+
+    Returns:
+        str: The delimiter or the default delimiter if no character qualifies.
+    """
+    lines: list[str] = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return DEFAULT_DIALECT["delimiter"]
+
+    best_delimiter: str = DEFAULT_DIALECT["delimiter"]
+    best_score: tuple[float, int] = (0.0, 0)
+
+    for delimiter in DELIMITERS:
+        if delimiter == quotechar:
+            continue
+
+        header_count: int = lines[0].count(delimiter)
+        if header_count == 0:
+            continue
+
+        consistency: float = sum(
+            line.count(delimiter) == header_count for line in lines
+        ) / len(lines)
+        if (consistency, header_count) > best_score:
+            best_delimiter = delimiter
+            best_score = (consistency, header_count)
+
+    return best_delimiter
+
+
+def sniff_decimal(text: str, delimiter: str) -> str:
+    """
+    Detect the decimal separator by counting the values with a decimal comma and a decimal point.
+
+    Args:
+        text (str): The decoded first lines of the file without the quoted values.
+        delimiter (str): The delimiter.
+
+    Returns:
+        str: The decimal separator.
+    """
+    if delimiter == ",":
+        return "."
+
+    separator: str = re.escape(delimiter)
+    counts: dict[str, int] = {
+        decimal: len(
+            re.findall(
+                f"(?:^|{separator})\\s*[-+]?\\d+{re.escape(decimal)}\\d+(?:[eE][-+]?\\d+)?\\s*(?={separator}|$)",
+                text,
+                re.MULTILINE,
+            )
+        )
+        for decimal in (".", ",")
+    }
+
+    return "," if counts[","] > counts["."] else "."
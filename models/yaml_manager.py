@@ -107,16 +107,26 @@ class YAMLManager:
 
         return old_user_settings
 
-    def update_file_paths(self, new_file_path: str, old_file_paths: dict) -> dict:
+    def update_file_paths(
+        self,
+        new_file_path: str,
+        old_file_paths: dict,
+        dialect: dict[str, str] | None = None,
+    ) -> dict:
         """
         Adds a new filepath with the current timestamp as the key to the old_content_dict.
         If the number of filepaths exceeds the content limit, the oldest filepath is removed
         except when the content limit is set to 0.
 
+        Every filepath is stored together with the dialect of the CSV file, so the dialect does
+        not need to be detected again when the file is reopened.
+
         Args:
             new_file_path (str): New filepath to be added to the YAML file.
             old_file_paths (dict): The current dictionary of filepaths from the YAML file,
                                         with timestamp keys.
+            dialect (dict[str, str] | None, optional): The dialect of the CSV file. If None,
+                                                        a stored dialect is kept. Defaults to None.
 
         Returns:
             dict: The updated dictionary of contents after the new dilepath is added.
@@ -124,20 +134,24 @@ class YAMLManager:
         if not isinstance(new_file_path, str):
             raise ValueError("Invalid file path!")
 
-        new_content_dict = {
-            datetime.now().strftime("%d-%m-%Y %H:%M:%S,%f"): new_file_path
-        }
+        new_entry: dict = {"file_path": new_file_path}
+        if dialect is not None:
+            new_entry["dialect"] = dict(dialect)
+
+        new_content_dict = {datetime.now().strftime("%d-%m-%Y %H:%M:%S,%f"): new_entry}
 
         if old_file_paths:
             file_found = False
-            for date_time, file in old_file_paths.items():
-                if new_file_path == file:  # Does the file already exists?
+            for date_time, entry in old_file_paths.items():
+                # Does the file already exists?
+                if new_file_path == self.get_entry_file_path(entry):
                     file_found = True
 
+                    if dialect is None and isinstance(entry, dict) and "dialect" in entry:
+                        new_entry["dialect"] = entry["dialect"]
+
                     del old_file_paths[date_time]
-                    old_file_paths[datetime.now().strftime("%d-%m-%Y %H:%M:%S,%f")] = (
-                        new_file_path
-                    )
+                    old_file_paths.update(new_content_dict)
 
                     break
 
@@ -153,18 +167,62 @@ class YAMLManager:
 
         return old_file_paths
 
-    def dump_yaml_file(self, new_content: str) -> None:
+    @staticmethod
+    def get_entry_file_path(entry: str | dict) -> str:
+        """
+        Get the filepath of an entry of the file paths YAML file.
+
+        Args:
+            entry (str | dict): The entry, either the filepath or the filepath with its dialect.
+
+        Returns:
+            str: The filepath of the entry.
+        """
+        return entry["file_path"] if isinstance(entry, dict) else entry
+
+    def get_file_paths(self) -> list[str]:
+        """
+        Get the filepaths of the file paths YAML file, the oldest first.
+
+        Returns:
+            list[str]: The filepaths.
+        """
+        return [
+            self.get_entry_file_path(entry) for entry in self.open_file().values()
+        ]
+
+    def get_file_dialect(self, file_path: str) -> dict[str, str] | None:
+        """
+        Get the stored dialect of a CSV file from the file paths YAML file.
+
+        Args:
+            file_path (str): The CSV file path.
+
+        Returns:
+            dict[str, str] | None: The dialect of the CSV file or None if no dialect is stored.
+        """
+        for entry in self.open_file().values():
+            if self.get_entry_file_path(entry) == file_path and isinstance(entry, dict):
+                return entry.get("dialect")
+
+        return None
+
+    def dump_yaml_file(
+        self, new_content: str, dialect: dict[str, str] | None = None
+    ) -> None:
         """
         Updates a YAML file with new content.
 
         Args:
             new_content (str): Content to be added to the YAML file.
+            dialect (dict[str, str] | None, optional): The dialect of a CSV file added to
+                                                        the file paths. Defaults to None.
         """
         try:
             old_content = self.open_file()
 
             if "file_paths" in self.file_path:
-                old_content = self.update_file_paths(new_content, old_content)
+                old_content = self.update_file_paths(new_content, old_content, dialect)
                 sort_keys = True
             elif "user_settings" in self.file_path:
                 old_content = self.update_user_settings(new_content, old_content)
@@ -0,0 +1,49 @@
+""" Defines the helpers shared by the unit tests. """
+
+import os
+from collections.abc import Callable
+
+
+class FakeRoot:
+    """
+    Tk root which runs the scheduled callbacks only when the test asks for it.
+    """
+
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], None]] = []
+
+    def after(self, _ms: int, callback: Callable[[], None]) -> None:
+        """
+        Schedule a callback for the next frame.
+        """
+        self.callbacks.append(callback)
+
+    def run_frame(self) -> None:
+        """
+        Run the scheduled callbacks, callbacks scheduled meanwhile run in the next frame.
+        """
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def create_csv_file(directory: str, file_name: str, content: str | bytes) -> str:
+    """
+    Create a CSV file in a directory, e.g. a temporary one.
+
+    Args:
+        directory (str): The directory of the file.
+        file_name (str): The name of the file.
+        content (str | bytes): The content of the file, a text is encoded as UTF-8.
+
+    Returns:
+        str: The path of the created file.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    file_path: str = os.path.join(directory, file_name)
+    with open(file_path, "wb") as file_open:
+        file_open.write(content)
+
+    return file_path
@@ -0,0 +1,115 @@
+"""Unit test for redrawing the artists of a figure by blitting."""
+
+import unittest
+from unittest.mock import patch
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from utils.blit_manager import BlitManager
+
+
+class TestBlitManager(unittest.TestCase):
+    """
+    Test class for testing the BlitManager class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.figure = Figure(figsize=(4, 3), dpi=50)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlim(0, 10)
+        self.axes.set_ylim(0, 10)
+
+        self.blit_manager = BlitManager(self.canvas, self.axes.bbox, max_snapshots=4)
+        self.lines = [
+            self.axes.plot([1, 9], [index + 1, 9 - index])[0] for index in range(8)
+        ]
+        self.blit_manager.add_layers(self.lines)
+        self.canvas.draw()
+
+    def count_drawn_lines(self, function, *args) -> int:
+        """
+        Count the plotted lines drawn while calling a function.
+
+        Args:
+            function (Callable): The function to call.
+
+        Returns:
+            int: The number of drawn lines, without the ticks.
+        """
+        with patch.object(
+            Line2D, "draw", autospec=True, side_effect=Line2D.draw
+        ) as draw_mock:
+            function(*args)
+        return sum(call.args[0] in self.axes.lines for call in draw_mock.call_args_list)
+
+    def assert_equal_to_full_draw(self) -> None:
+        """
+        Assert the blitted canvas equals a full draw of the same artists, which is blitted again afterwards.
+        """
+        self.blit_manager.update()
+        blitted: np.ndarray = np.asarray(self.canvas.buffer_rgba()).copy()
+
+        with self.blit_manager.static():
+            self.canvas.draw()
+        np.testing.assert_array_equal(np.asarray(self.canvas.buffer_rgba()), blitted)
+
+        self.canvas.draw()
+
+    def test_layers(self) -> None:
+        """
+        Testing the animated layers.
+        """
+        self.assertEqual(self.blit_manager.layers, self.lines)
+        self.assertTrue(all(line.get_animated() for line in self.lines))
+
+        with self.blit_manager.static():
+            self.assertFalse(any(line.get_animated() for line in self.lines))
+        self.assertTrue(all(line.get_animated() for line in self.lines))
+
+    def test_add_layers(self) -> None:
+        """
+        Testing adding a layer draws only this layer.
+        """
+        (line,) = self.axes.plot([1, 9], [5, 5])
+
+        self.assertEqual(
+            self.count_drawn_lines(self.blit_manager.add_layers, [line]), 1
+        )
+        self.assert_equal_to_full_draw()
+
+    def test_remove_layers(self) -> None:
+        """
+        Testing removing a layer draws only the layers above it.
+        """
+        for line, expected_count in (
+            (self.lines[-1], 0),
+            (self.lines[4], 2),
+            (self.lines[1], 5),
+        ):
+            with self.subTest(expected_count=expected_count):
+                line.remove()
+                self.assertEqual(
+                    self.count_drawn_lines(self.blit_manager.remove_layers, [line]),
+                    expected_count,
+                )
+                self.assert_equal_to_full_draw()
+
+    def test_invalidate(self) -> None:
+        """
+        Testing the layers are drawn with the next full draw after invalidating.
+        """
+        self.blit_manager.invalidate()
+        (line,) = self.axes.plot([1, 9], [5, 5])
+
+        self.assertEqual(
+            self.count_drawn_lines(self.blit_manager.add_layers, [line]), 0
+        )
+        self.assertEqual(self.count_drawn_lines(self.canvas.draw), 9)
+        self.assert_equal_to_full_draw()
+
+
+if __name__ == "__main__":
+    unittest.main()
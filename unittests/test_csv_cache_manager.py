@@ -0,0 +1,216 @@
+""" Unit test for the CSVCacheManager class. """
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from models.csv_cache_manager import CSVCacheManager
+from models.csv_data_manager import CSVDataManager
+from utils.level_of_detail import MinMaxPyramid
+from unittests.helpers import create_csv_file
+
+
+class TestCSVCacheManager(unittest.TestCase):
+    """
+    Test class for testing the CSVCacheManager class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir: str = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self) -> None:
+        # Deinitialize after each test
+        self.temp_dir.cleanup()
+
+    def test_store_and_load(self) -> None:
+        """
+        Testing the storing and loading of a parsed CSV file.
+        """
+        cache_manager = CSVCacheManager(self.cache_dir)
+        file_path: str = create_csv_file(
+            self.temp_dir.name, "file.csv", "time_index;value;text\n0;0.5;a\n1;1.5;\n"
+        )
+        self.assertIsNone(cache_manager.load(file_path))
+        self.assertIsNone(cache_manager.load("NonExistentingFilePath.csv"))
+
+        data_frame: pd.DataFrame = pd.read_csv(file_path, delimiter=";")
+        cache_manager.store(file_path, data_frame)
+
+        cached_data_frame = cache_manager.load(file_path)
+        self.assertIsNotNone(cached_data_frame)
+        pd.testing.assert_frame_equal(data_frame, cached_data_frame)
+        values: np.ndarray = cached_data_frame["value"].to_numpy()
+        while not isinstance(values, np.memmap) and values.base is not None:
+            values = values.base
+        self.assertIsInstance(values, np.memmap)
+
+        # A modified file is not loaded from the cache
+        os.utime(file_path, ns=(0, 0))
+        self.assertIsNone(cache_manager.load(file_path))
+
+    def test_store_and_load_pyramids(self) -> None:
+        """
+        Testing the storing and loading of the min/max pyramids of the numeric columns.
+        """
+        cache_manager = CSVCacheManager(self.cache_dir)
+        file_path: str = create_csv_file(
+            self.temp_dir.name,
+            "file.csv",
+            "time_index;value;text\n"
+            + "".join(f"{index};{index % 7};t{index}\n" for index in range(1000)),
+        )
+        self.assertEqual(cache_manager.load_pyramids(file_path), {})
+
+        data_frame: pd.DataFrame = pd.read_csv(file_path, delimiter=";")
+        with patch.object(CSVCacheManager, "PYRAMID_MIN_ROWS", 100):
+            cache_manager.store(file_path, data_frame)
+
+        pyramids = cache_manager.load_pyramids(file_path)
+        self.assertEqual(list(pyramids), ["time_index", "value"])
+        self.assertIsInstance(pyramids["value"].indices.base, np.memmap)
+        np.testing.assert_array_equal(
+            pyramids["value"].indices,
+            MinMaxPyramid.build(data_frame["value"].to_numpy()).indices,
+        )
+
+        # Short columns get no pyramid
+        cache_manager.store(file_path, data_frame)
+        self.assertEqual(cache_manager.load_pyramids(file_path), {})
+
+    def test_evict(self) -> None:
+        """
+        Testing the eviction of cached files.
+        """
+        cache_manager = CSVCacheManager(self.cache_dir, max_entries=2)
+        file_paths: list[str] = [
+            create_csv_file(self.temp_dir.name, f"file{index}.csv", f"value\n{index}\n")
+            for index in range(3)
+        ]
+        for index, file_path in enumerate(file_paths):
+            cache_manager.store(file_path, pd.read_csv(file_path))
+            entry_dir = cache_manager.get_entry_dir(file_path)
+            os.utime(entry_dir, (index, index))
+
+        cache_manager.evict()
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+        self.assertIsNone(cache_manager.load(file_paths[0]))
+        self.assertIsNotNone(cache_manager.load(file_paths[2]))
+
+        cache_manager = CSVCacheManager(self.cache_dir, max_age=60)
+        cache_manager.evict()
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+        cache_manager = CSVCacheManager(self.cache_dir, max_size=1)
+        cache_manager.evict()
+        self.assertEqual(0, len(os.listdir(self.cache_dir)))
+
+    def test_evict_removed_entry(self) -> None:
+        """
+        Testing that an entry removed by another process while evicting is skipped.
+        """
+        cache_manager = CSVCacheManager(self.cache_dir)
+        file_paths: list[str] = [
+            create_csv_file(self.temp_dir.name, f"file{index}.csv", f"value\n{index}\n")
+            for index in range(2)
+        ]
+        for file_path in file_paths:
+            cache_manager.store(file_path, pd.read_csv(file_path))
+        removed_dir = cache_manager.get_entry_dir(file_paths[0])
+        path_stat = Path.stat
+
+        def stat(path: Path, *args, **kwargs) -> os.stat_result:
+            if path == removed_dir:
+                raise FileNotFoundError(path)
+            return path_stat(path, *args, **kwargs)
+
+        cache_manager = CSVCacheManager(self.cache_dir, max_size=1)
+        with patch.object(Path, "stat", stat):
+            cache_manager.evict()
+        self.assertEqual([removed_dir.name], os.listdir(self.cache_dir))
+
+    def test_read_file_with_cache(self) -> None:
+        """
+        Testing the reading of a CSV file with the cache.
+        """
+        cache_manager = CSVCacheManager(self.cache_dir)
+        file_path: str = create_csv_file(
+            self.temp_dir.name,
+            "file.csv",
+            "time_index;value;zero\n0;1;0\n1;2;0\n2;3;0\n",
+        )
+
+        csv_data_manager = CSVDataManager()
+        list(csv_data_manager.read_file_in_chunks(file_path, 2, cache_manager))
+        # The file is only loaded with the settings it was parsed with
+        self.assertEqual(1, len(list(cache_manager.cache_dir.iterdir())))
+        self.assertIsNone(cache_manager.load(file_path))
+        self.assertEqual(
+            {"value": [0], "zero": [1]}, dict(csv_data_manager.get_classified_headers(0))
+        )
+
+        # The data is continued with memory-mapped columns
+        values: np.ndarray = csv_data_manager.get_column("value")
+        while not isinstance(values, np.memmap) and values.base is not None:
+            values = values.base
+        self.assertIsInstance(values, np.memmap)
+
+        cached_csv_data_manager = CSVDataManager()
+        self.assertEqual(
+            [100.0],
+            list(cached_csv_data_manager.read_file_in_chunks(file_path, 2, cache_manager)),
+        )
+        pd.testing.assert_frame_equal(
+            csv_data_manager.raw_data, cached_csv_data_manager.raw_data
+        )
+        self.assertEqual(
+            dict(csv_data_manager.get_classified_headers(0)),
+            dict(cached_csv_data_manager.get_classified_headers(0)),
+        )
+        # The dialect is kept, e.g. for the recent files of several opened files
+        self.assertIsNotNone(cached_csv_data_manager.dialect)
+        self.assertEqual(csv_data_manager.dialect, cached_csv_data_manager.dialect)
+
+        # With shrunk dtypes the file is parsed again and cached as another entry
+        optimized_csv_data_manager = CSVDataManager()
+        self.assertNotEqual(
+            [100.0],
+            list(
+                optimized_csv_data_manager.read_file_in_chunks(
+                    file_path, 2, cache_manager, True
+                )
+            ),
+        )
+        self.assertEqual(np.int8, optimized_csv_data_manager.raw_data["value"].dtype)
+        self.assertEqual(
+            [100.0],
+            list(
+                CSVDataManager().read_file_in_chunks(file_path, 2, cache_manager, True)
+            ),
+        )
+        self.assertEqual(
+            [100.0],
+            list(CSVDataManager().read_file_in_chunks(file_path, 2, cache_manager)),
+        )
+
+        # A corrected dialect parses the file again
+        corrected_csv_data_manager = CSVDataManager()
+        corrected_csv_data_manager.read_header(
+            file_path, {**csv_data_manager.dialect, "decimal": ","}
+        )
+        self.assertNotEqual(
+            [100.0],
+            list(
+                corrected_csv_data_manager.read_file_in_chunks(
+                    file_path, 2, cache_manager
+                )
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
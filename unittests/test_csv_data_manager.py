@@ -1,10 +1,37 @@
 """ Unit test for the CSVDataManager class. """
 
+import io
+import os
+import tempfile
 import unittest
-from unittest.mock import mock_open, patch
+from importlib.util import find_spec
+from unittest.mock import MagicMock, patch
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from models.csv_data_manager import CSVDataManager
+from models.csv_cache_manager import CSVCacheManager
+from models.csv_data_manager import (
+    CSVDataManager,
+    ParserBackend,
+    infer_dtypes,
+    is_constant_column,
+    is_float32_safe,
+    select_parser_backend,
+)
+
+
+def mock_csv_open(read_data: str) -> MagicMock:
+    """
+    Mock of open, which returns the content as bytes or as text depending on the mode,
+    as the dialect is detected from the bytes of a file.
+    """
+
+    def open_file(_file: str, mode: str = "r", *_args, **_kwargs) -> io.IOBase:
+        if "b" in mode:
+            return io.BytesIO(read_data.encode("utf-8"))
+        return io.StringIO(read_data)
+
+    return MagicMock(side_effect=open_file)
 
 
 class TestCSVDataManager(unittest.TestCase):
@@ -82,7 +109,7 @@ class TestCSVDataManager(unittest.TestCase):
         file_path = "empty_file.csv"
         csv_data_manager = CSVDataManager()
         with patch(
-            "builtins.open", mock_open(read_data=mock_file_content), create=True
+            "builtins.open", mock_csv_open(mock_file_content), create=True
         ):
             with self.assertRaises(
                 pd.errors.EmptyDataError,
@@ -94,7 +121,7 @@ class TestCSVDataManager(unittest.TestCase):
         file_path = "file.csv"
         csv_data_manager = CSVDataManager()
         with patch(
-            "builtins.open", mock_open(read_data=mock_file_content), create=True
+            "builtins.open", mock_csv_open(mock_file_content), create=True
         ):
             csv_data_manager.read_file(file_path)
             self.assertEqual("time_index", csv_data_manager.raw_data.columns[0])
@@ -102,6 +129,345 @@ class TestCSVDataManager(unittest.TestCase):
             self.assertEqual(10, csv_data_manager.raw_data["time_index"][0])
             self.assertEqual(20, csv_data_manager.raw_data["value"][0])
 
+    def test_read_header(self) -> None:
+        """
+        Testing the reading of only the header row of a CSV file.
+        """
+        csv_data_manager = CSVDataManager()
+        with self.assertRaises(
+            FileNotFoundError, msg="The file NonExistentingFilePath.csv was not found."
+        ):
+            csv_data_manager.read_header("NonExistentingFilePath.csv")
+
+        mock_file_content = "time_index;value1;value2\n10;20;0\n11;20;0\n"
+        with patch(
+            "builtins.open", mock_csv_open(mock_file_content), create=True
+        ):
+            csv_data_manager.read_header("file.csv")
+            self.assertEqual(["time_index", "value1", "value2"], csv_data_manager.columns)
+            self.assertTrue(csv_data_manager.raw_data.empty)
+            self.assertEqual(
+                {"value1": [0], "value2": [0]},
+                dict(csv_data_manager.get_classified_headers(0)),
+            )
+
+            csv_data_manager.read_file("file.csv")
+            self.assertEqual(
+                {"value1": [2], "value2": [1]},
+                dict(csv_data_manager.get_classified_headers(0)),
+            )
+
+    def test_read_file_in_chunks(self) -> None:
+        """
+        Testing the reading of a CSV file in chunks.
+        """
+        csv_data_manager = CSVDataManager()
+        with self.assertRaises(
+            FileNotFoundError, msg="The file NonExistentingFilePath.csv was not found."
+        ):
+            list(csv_data_manager.read_file_in_chunks("NonExistentingFilePath.csv", 2))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "empty_file.csv")
+            with open(file_path, "w", encoding="utf-8"):
+                pass
+            with self.assertRaises(pd.errors.EmptyDataError):
+                list(csv_data_manager.read_file_in_chunks(file_path, 2))
+
+            file_path = os.path.join(temp_dir, "file.csv")
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write("time_index;value\n")
+                file_open.writelines(f"{index};{index * 2}\n" for index in range(5))
+
+            chunks = csv_data_manager.read_file_in_chunks(file_path, 2)
+            next(chunks)
+            self.assertEqual(["time_index", "value"], csv_data_manager.columns)
+            self.assertTrue(csv_data_manager.raw_data.empty)
+
+            progress = [next(chunks), *chunks]
+            self.assertEqual(2, len(progress))
+            self.assertEqual(5, len(csv_data_manager.raw_data))
+
+            # Closing the iterator stops the reading at a chunk boundary
+            chunks = csv_data_manager.read_file_in_chunks(file_path, 2)
+            next(chunks)
+            chunks.close()
+            self.assertTrue(csv_data_manager.raw_data.empty)
+            self.assertEqual([0], csv_data_manager.get_classified_headers(0)["value"])
+
+            chunks = csv_data_manager.read_file_in_chunks(file_path, 2)
+            next(chunks)
+            progress = [next(chunks), *chunks]
+            self.assertEqual(sorted(progress), progress)
+            self.assertEqual(100.0, progress[-1])
+            self.assertEqual(5, len(csv_data_manager.raw_data))
+            self.assertEqual(list(range(5)), csv_data_manager.raw_data["time_index"].tolist())
+            self.assertEqual(8, csv_data_manager.raw_data["value"][4])
+
+            file_path = os.path.join(temp_dir, "classified_file.csv")
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write("time_index;changing;zero;constant;empty\n")
+                file_open.writelines(f"{index};0;0;3;\n" for index in range(5))
+                file_open.write("5;1;0;3;\n")
+
+            list(csv_data_manager.read_file_in_chunks(file_path, 2))
+            classified_headers = dict(csv_data_manager.get_classified_headers(0))
+            csv_data_manager.read_file(file_path)
+            self.assertEqual(
+                {"changing": [0], "zero": [1], "constant": [2], "empty": [2]},
+                classified_headers,
+            )
+            self.assertEqual(
+                classified_headers, dict(csv_data_manager.get_classified_headers(0))
+            )
+
+    def test_select_parser_backend(self) -> None:
+        """
+        Testing the selection of the parser backend.
+        """
+        with self.assertRaises(ValueError, msg="Invalid parser backend: polars!"):
+            select_parser_backend(0, "polars")
+
+        self.assertEqual(ParserBackend.C, select_parser_backend(10, ParserBackend.C))
+        self.assertEqual(
+            ParserBackend.PYTHON, select_parser_backend(10, ParserBackend.PYTHON)
+        )
+
+        with patch("models.csv_data_manager.find_spec", return_value=None):
+            self.assertEqual(
+                ParserBackend.C, select_parser_backend(10, ParserBackend.PYARROW)
+            )
+            self.assertEqual(
+                ParserBackend.C, select_parser_backend(100, ParserBackend.AUTO, 50)
+            )
+
+        with patch("models.csv_data_manager.find_spec", return_value=object()):
+            self.assertEqual(
+                ParserBackend.C, select_parser_backend(10, ParserBackend.AUTO, 50)
+            )
+            self.assertEqual(
+                ParserBackend.PYARROW,
+                select_parser_backend(100, ParserBackend.AUTO, 50),
+            )
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_read_file_with_pyarrow(self) -> None:
+        """
+        Testing the reading of a CSV file with the pyarrow parser and its fallback to the C parser.
+        """
+        csv_data_manager = CSVDataManager()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "file.csv")
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write("time_index;name;value\n")
+                file_open.writelines(f"{index};|a;b|;{index / 2}\n" for index in range(5))
+
+            progress = list(
+                csv_data_manager.read_file_in_chunks(
+                    file_path, 2, parser_backend=ParserBackend.PYARROW
+                )
+            )
+            self.assertEqual([100.0], progress)
+            pyarrow_data = csv_data_manager.raw_data
+            csv_data_manager.read_file(file_path)
+            pd.testing.assert_frame_equal(csv_data_manager.raw_data, pyarrow_data)
+
+            # Pyarrow rejects rows with missing fields, the C parser fills them up
+            with open(file_path, "a", encoding="utf-8") as file_open:
+                file_open.write("5;c\n")
+
+            progress = list(
+                csv_data_manager.read_file_in_chunks(
+                    file_path, 2, parser_backend=ParserBackend.PYARROW
+                )
+            )
+            self.assertEqual(3, len(progress))
+            self.assertEqual(6, len(csv_data_manager.raw_data))
+            self.assertTrue(pd.isna(csv_data_manager.raw_data["value"][5]))
+
+            empty_file_path = os.path.join(temp_dir, "empty_file.csv")
+            with open(empty_file_path, "w", encoding="utf-8"):
+                pass
+            with self.assertRaises(pd.errors.EmptyDataError):
+                list(
+                    csv_data_manager.read_file_in_chunks(
+                        empty_file_path, 2, parser_backend=ParserBackend.PYARROW
+                    )
+                )
+
+    def test_optimize_dtypes(self) -> None:
+        """
+        Testing the shrinking of the dtypes while reading a CSV file.
+        """
+        sample = pd.DataFrame(
+            {
+                "float32": [0.1, 2.5, np.nan],
+                "float64": [0.123456789, 1.0, 2.0],
+                "integer": [1, 2, 300],
+                "flag": [0, 1, 1],
+                "category": ["on", "off", "on"],
+                "text": ["a", "b", "c"],
+            }
+        )
+        self.assertEqual(
+            {
+                "float32": "float32",
+                "integer": "integer",
+                "flag": "bool",
+                "category": "category",
+            },
+            infer_dtypes(sample, 0.7),
+        )
+        self.assertTrue(is_float32_safe(np.array([0.0, np.nan, 1e-3, 123456.0])))
+        self.assertFalse(is_float32_safe(np.array([1234567.0])))
+        self.assertFalse(is_float32_safe(np.array([1e300])))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "file.csv")
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write("time_index;value;flag;state\n")
+                file_open.writelines(
+                    f"{index};{index / 4};{index % 2};{'on' if index % 3 else 'off'}\n"
+                    for index in range(100)
+                )
+                # Values after the sample that do not fit the inferred dtypes
+                file_open.write("100000;0.123456789;2;off\n")
+
+            csv_data_manager = CSVDataManager()
+            list(csv_data_manager.read_file_in_chunks(file_path, 30, None, True, 50))
+            raw_data = csv_data_manager.raw_data
+
+            self.assertEqual(np.int32, raw_data["time_index"].dtype)
+            self.assertEqual(np.float64, raw_data["value"].dtype)
+            self.assertEqual(0.123456789, raw_data["value"].iloc[-1])
+            self.assertEqual(np.int8, raw_data["flag"].dtype)
+            self.assertIsInstance(raw_data["state"].dtype, pd.CategoricalDtype)
+            self.assertGreater(csv_data_manager.memory_saved, 0)
+
+            file_path = os.path.join(temp_dir, "float32_file.csv")
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write("time_index;value\n")
+                file_open.writelines(f"{index};{index / 4}\n" for index in range(100))
+
+            list(csv_data_manager.read_file_in_chunks(file_path, 30, None, True, 50))
+            self.assertEqual(np.float32, csv_data_manager.raw_data["value"].dtype)
+            self.assertEqual(24.75, csv_data_manager.raw_data["value"].iloc[-1])
+
+            # A column which is float32-safe in the first chunks but not in a later one
+            file_path = os.path.join(temp_dir, "float64_file.csv")
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write("time_index;value\n")
+                file_open.writelines(f"{index};{index / 10}\n" for index in range(100))
+                file_open.write("100;0.123456789\n")
+
+            list(csv_data_manager.read_file_in_chunks(file_path, 30, None, True, 50))
+            self.assertEqual(np.float64, csv_data_manager.raw_data["value"].dtype)
+            self.assertEqual(0.1, csv_data_manager.raw_data["value"].iloc[1])
+            self.assertEqual(
+                [index / 10 for index in range(100)],
+                csv_data_manager.raw_data["value"].iloc[:100].tolist(),
+            )
+
+    def test_get_column(self) -> None:
+        """
+        Testing the getter functions for the values of columns.
+        """
+        mock_file_content = "time_index;value\n10;20\n11;21\n"
+        csv_data_manager = CSVDataManager()
+        with patch(
+            "builtins.open", mock_csv_open(mock_file_content), create=True
+        ):
+            csv_data_manager.read_file("file.csv")
+
+        values = csv_data_manager.get_column("value")
+        self.assertEqual([20, 21], values.tolist())
+        self.assertFalse(values.flags.writeable)
+        self.assertTrue(
+            np.shares_memory(values, csv_data_manager.raw_data["value"].to_numpy())
+        )
+
+        columns = csv_data_manager.get_columns(["time_index", "value"])
+        self.assertEqual(["time_index", "value"], list(columns))
+        self.assertEqual([10, 11], columns["time_index"].tolist())
+
+        with self.assertRaises(KeyError, msg="The column missing was not found!"):
+            csv_data_manager.get_column("missing")
+
+    def test_get_pyramid(self) -> None:
+        """
+        Testing the getter function for the min/max pyramids of numeric columns.
+        """
+        mock_file_content = "time_index;value;text\n" + "".join(
+            f"{index};{index % 5};t\n" for index in range(100)
+        )
+        csv_data_manager = CSVDataManager()
+        with patch(
+            "builtins.open", mock_csv_open(mock_file_content), create=True
+        ):
+            csv_data_manager.read_file("file.csv")
+
+        self.assertIsNone(csv_data_manager.get_pyramid("value"))
+
+        with patch.object(CSVCacheManager, "PYRAMID_MIN_ROWS", 64):
+            pyramid = csv_data_manager.get_pyramid("value")
+            self.assertIsNotNone(pyramid)
+            self.assertIs(csv_data_manager.get_pyramid("value"), pyramid)
+            self.assertIsNone(csv_data_manager.get_pyramid("text"))
+
+        with self.assertRaises(KeyError, msg="The column missing was not found!"):
+            csv_data_manager.get_pyramid("missing")
+
+    def test_export_to_excel(self) -> None:
+        """
+        Testing that exporting does not change the read data of the file.
+        """
+        mock_file_content = "time_index;value\n10;20\n11;21\n"
+        csv_data_manager = CSVDataManager()
+        with patch(
+            "builtins.open", mock_csv_open(mock_file_content), create=True
+        ):
+            csv_data_manager.read_file("file.csv")
+
+        with patch.object(pd.DataFrame, "to_excel") as to_excel_mock:
+            csv_data_manager.export_to_excel("file.csv")
+            to_excel_mock.assert_called_once()
+            self.assertEqual("file.xlsx", to_excel_mock.call_args.args[0])
+
+            # Another file is not read, the data of the read file is kept
+            with self.assertRaises(pd.errors.EmptyDataError):
+                csv_data_manager.export_to_excel("other_file.csv")
+            to_excel_mock.assert_called_once()
+
+        self.assertEqual("file.csv", csv_data_manager.file_path)
+        self.assertEqual(["time_index", "value"], csv_data_manager.columns)
+        self.assertFalse(csv_data_manager.raw_data.empty)
+
+        # A snapshot is exported even if another file got read meanwhile
+        snapshot: pd.DataFrame = csv_data_manager.get_snapshot("file.csv")
+        with patch(
+            "builtins.open", mock_csv_open("time_index;other\n1;2\n"), create=True
+        ):
+            csv_data_manager.read_file("other_file.csv")
+        self.assertEqual(["time_index", "value"], list(snapshot.columns))
+        self.assertEqual([20, 21], snapshot["value"].tolist())
+
+        with patch.object(pd.DataFrame, "to_excel") as to_excel_mock:
+            csv_data_manager.export_to_excel("file.csv", snapshot)
+            self.assertEqual("file.xlsx", to_excel_mock.call_args.args[0])
+
+    def test_is_constant_column(self) -> None:
+        """
+        Testing the check if a column is constant.
+        """
+        self.assertTrue(is_constant_column(np.zeros(5000), 0))
+        self.assertFalse(is_constant_column(np.arange(5000), 0))
+        self.assertFalse(is_constant_column(np.append(np.ones(5000), 2), 1, 16))
+        self.assertTrue(is_constant_column(np.full(10, np.nan), np.nan))
+        self.assertFalse(is_constant_column(np.array([np.nan, 1.0]), np.nan))
+        self.assertFalse(is_constant_column(np.array([1.0, np.nan]), 1.0))
+        self.assertTrue(is_constant_column(np.array(["a", "a"], dtype=object), "a"))
+        self.assertTrue(is_constant_column(np.array([]), 0))
+
     def test_get_header_list(self) -> None:
         """
         Testing the getter function for the header list..
@@ -109,7 +475,7 @@ class TestCSVDataManager(unittest.TestCase):
         mock_file_content = "heading1::subheading1;heading2::subheading2"
         csv_data_manager = CSVDataManager()
         with patch(
-            "builtins.open", mock_open(read_data=mock_file_content), create=True
+            "builtins.open", mock_csv_open(mock_file_content), create=True
         ):
             csv_data_manager.read_file("file.csv")
             self.assertEqual(
@@ -119,7 +485,7 @@ class TestCSVDataManager(unittest.TestCase):
 
         mock_file_content = "asdf_heading1::subheading1;asdf_heading2::subheading2"
         with patch(
-            "builtins.open", mock_open(read_data=mock_file_content), create=True
+            "builtins.open", mock_csv_open(mock_file_content), create=True
         ):
             csv_data_manager.read_file("file.csv")
             self.assertEqual(
@@ -129,7 +495,7 @@ class TestCSVDataManager(unittest.TestCase):
 
         mock_file_content = "heading1::subheading1_asdf;heading2::subheading2_asdf"
         with patch(
-            "builtins.open", mock_open(read_data=mock_file_content), create=True
+            "builtins.open", mock_csv_open(mock_file_content), create=True
         ):
             csv_data_manager.read_file("file.csv")
             self.assertEqual(
@@ -141,7 +507,7 @@ class TestCSVDataManager(unittest.TestCase):
             "asdf_heading1::subheading1_asdf;asdf_heading2::subheading2_asdf"
         )
         with patch(
-            "builtins.open", mock_open(read_data=mock_file_content), create=True
+            "builtins.open", mock_csv_open(mock_file_content), create=True
         ):
             csv_data_manager.read_file("file.csv")
             self.assertEqual(
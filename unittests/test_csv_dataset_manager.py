@@ -0,0 +1,123 @@
+""" Unit test for the CSVDatasetManager class. """
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from models.csv_cache_manager import CSVCacheManager
+from models.csv_dataset_manager import CSVDatasetManager
+
+
+class TestCSVDatasetManager(unittest.TestCase):
+    """
+    Test class for testing the CSVDatasetManager class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_paths: list[str] = []
+
+        for file_name, content in (
+            ("run_1.csv", "time;speed;temp\n0;1;0\n1;2;0\n"),
+            ("run_2.csv", "time;speed;torque\n0;3;5\n1;3;5\n"),
+        ):
+            file_path: str = os.path.join(self.temp_dir.name, file_name)
+            with open(file_path, "w", encoding="utf-8") as file_open:
+                file_open.write(content)
+            self.file_paths.append(file_path)
+
+    def tearDown(self) -> None:
+        # Deinitialize after each test
+        self.temp_dir.cleanup()
+
+    def test_load_files(self) -> None:
+        """
+        Testing the concurrent loading of several CSV files.
+        """
+        csv_dataset_manager = CSVDatasetManager()
+        missing_file_path: str = os.path.join(self.temp_dir.name, "missing.csv")
+        # A file which can not be read does not abort the loading of the other files
+        unreadable_file_path: str = os.path.join(self.temp_dir.name, "folder.csv")
+        os.mkdir(unreadable_file_path)
+
+        progress = list(
+            csv_dataset_manager.load_files(
+                [
+                    *self.file_paths,
+                    missing_file_path,
+                    unreadable_file_path,
+                    self.file_paths[0],
+                ],
+                1,
+            )
+        )
+        np.testing.assert_allclose([25, 50, 75, 100.0], progress)
+        self.assertEqual(self.file_paths, list(csv_dataset_manager.datasets))
+        self.assertCountEqual(
+            [missing_file_path, unreadable_file_path], csv_dataset_manager.errors
+        )
+        self.assertEqual(
+            {
+                "time": self.file_paths,
+                "speed": self.file_paths,
+                "temp": self.file_paths[:1],
+                "torque": self.file_paths[1:],
+            },
+            csv_dataset_manager.header_index,
+        )
+        self.assertEqual(
+            [3, 3],
+            csv_dataset_manager.get_dataset(self.file_paths[1])
+            .raw_data["speed"]
+            .tolist(),
+        )
+
+        with self.assertRaises(KeyError):
+            csv_dataset_manager.get_dataset(missing_file_path)
+
+        self.assertEqual(
+            {
+                "speed": [{self.file_paths[0]: 0, self.file_paths[1]: 2}],
+                "temp": [{self.file_paths[0]: 1}],
+                "torque": [{self.file_paths[1]: 2}],
+            },
+            dict(csv_dataset_manager.get_classified_headers(0)),
+        )
+
+        csv_dataset_manager.clear()
+        self.assertEqual({}, csv_dataset_manager.datasets)
+        self.assertEqual({}, csv_dataset_manager.header_index)
+
+    def test_load_files_with_cache(self) -> None:
+        """
+        Testing the loading of several CSV files through the cache.
+        """
+        csv_dataset_manager = CSVDatasetManager()
+        cache_manager = CSVCacheManager(os.path.join(self.temp_dir.name, "cache"))
+
+        list(csv_dataset_manager.load_files(self.file_paths, 1, cache_manager))
+        self.assertEqual(self.file_paths, list(csv_dataset_manager.datasets))
+
+        values = csv_dataset_manager.get_dataset(self.file_paths[0]).get_column("speed")
+        while values.base is not None and not isinstance(values, np.memmap):
+            values = values.base
+        self.assertIsInstance(values, np.memmap)
+
+        # A file missing in the cache is read again with the same settings
+        with patch.object(CSVCacheManager, "load", return_value=None):
+            list(
+                csv_dataset_manager.load_files(
+                    self.file_paths, 1, cache_manager, optimize_dtypes=True
+                )
+            )
+        self.assertEqual(self.file_paths, list(csv_dataset_manager.datasets))
+        self.assertEqual(
+            np.int8,
+            csv_dataset_manager.get_dataset(self.file_paths[0]).raw_data["speed"].dtype,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+""" Unit test for the detection of the CSV dialect. """
+
+import os
+import tempfile
+import unittest
+from models.csv_data_manager import CSVDataManager
+from models.csv_dialect import (
+    DEFAULT_DIALECT,
+    sniff_decimal,
+    sniff_delimiter,
+    sniff_dialect,
+    sniff_encoding,
+    sniff_quotechar,
+)
+from unittests.helpers import create_csv_file
+
+
+class TestCSVDialect(unittest.TestCase):
+    """
+    Test class for testing the detection of the CSV dialect.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        # Deinitialize after each test
+        self.temp_dir.cleanup()
+
+    def test_sniff_encoding(self) -> None:
+        """
+        Testing the detection of the encoding.
+        """
+        self.assertEqual("utf-8", sniff_encoding("a;b\n1;ä\n".encode("utf-8")))
+        self.assertEqual("utf-8-sig", sniff_encoding("a;b\n".encode("utf-8-sig")))
+        self.assertEqual("utf-16", sniff_encoding("a;b\n".encode("utf-16")))
+        self.assertEqual("cp1252", sniff_encoding("a;b\n1;ä\n".encode("cp1252")))
+        # A character cut off at the end of the sample
+        self.assertEqual("utf-8", sniff_encoding("a;ä".encode("utf-8")[:-1]))
+
+    def test_sniff_quotechar(self) -> None:
+        """
+        Testing the detection of the quote character.
+        """
+        self.assertEqual('"', sniff_quotechar("a;b\n1;2\n"))
+        self.assertEqual('"', sniff_quotechar('a,b\n1,"x,y"\n2,"z"\n'))
+        self.assertEqual("|", sniff_quotechar("a;b\n1;|x;y|\n2;|z|\n"))
+
+    def test_sniff_delimiter(self) -> None:
+        """
+        Testing the detection of the delimiter.
+        """
+        self.assertEqual(";", sniff_delimiter("a;b;c\n1;2;3\n"))
+        self.assertEqual(",", sniff_delimiter("a,b,c\n1,2,3\n"))
+        self.assertEqual("\t", sniff_delimiter("a\tb\n1\t2\n"))
+        self.assertEqual(";", sniff_delimiter("a;b\n1,5;2,5\n3,5;4,5\n"))
+        self.assertEqual(DEFAULT_DIALECT["delimiter"], sniff_delimiter(""))
+
+    def test_sniff_decimal(self) -> None:
+        """
+        Testing the detection of the decimal separator.
+        """
+        self.assertEqual(".", sniff_decimal("a;b\n1.5;2.5\n", ";"))
+        self.assertEqual(",", sniff_decimal("a;b\n1,5;-2,5e3\n", ";"))
+        self.assertEqual(".", sniff_decimal("a,b\n1,5\n", ","))
+        self.assertEqual(".", sniff_decimal("a;b\n1;2\n", ";"))
+
+    def test_sniff_dialect(self) -> None:
+        """
+        Testing the detection of the dialect of a file and the reading of the file with it.
+        """
+        with self.assertRaises(FileNotFoundError):
+            sniff_dialect(os.path.join(self.temp_dir.name, "NonExistentingFilePath.csv"))
+
+        file_path: str = create_csv_file(
+            self.temp_dir.name,
+            "export.csv",
+            'time,name,value\r\n0,"a,b",1.5\r\n1,"c",2.5\r\n'.encode("utf-8"),
+        )
+        self.assertEqual(
+            {"encoding": "utf-8", "delimiter": ",", "quotechar": '"', "decimal": "."},
+            sniff_dialect(file_path),
+        )
+
+        csv_data_manager = CSVDataManager()
+        list(csv_data_manager.read_file_in_chunks(file_path, 1))
+        self.assertEqual(["time", "name", "value"], csv_data_manager.columns)
+        self.assertEqual(["a,b", "c"], csv_data_manager.raw_data["name"].tolist())
+        self.assertEqual([1.5, 2.5], csv_data_manager.raw_data["value"].tolist())
+
+        file_path = create_csv_file(
+            self.temp_dir.name,
+            "european.csv",
+            "Zeit;Wärme\n0;1,5\n1;2,5\n".encode("cp1252"),
+        )
+        csv_data_manager.read_header(file_path)
+        self.assertEqual(["Zeit", "Wärme"], csv_data_manager.columns)
+        self.assertEqual(",", csv_data_manager.dialect["decimal"])
+        list(csv_data_manager.read_file_in_chunks(file_path, 1))
+        self.assertEqual([1.5, 2.5], csv_data_manager.raw_data["Wärme"].tolist())
+
+        # A given dialect is used instead of detecting it
+        dialect: dict[str, str] = {**DEFAULT_DIALECT, "encoding": "cp1252"}
+        csv_data_manager.read_header(file_path, dialect)
+        self.assertEqual(dialect, csv_data_manager.dialect)
+
+        # Only the complete lines of a truncated sample are analysed
+        file_path = create_csv_file(
+            self.temp_dir.name, "long.csv", b"a;b\n" + b"1;2\n" * 100 + b"1;2;3;4;5"
+        )
+        self.assertEqual(";", sniff_dialect(file_path, 100)["delimiter"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+""" Unit test for the FontFitter class. """
+
+import unittest
+from unittest.mock import MagicMock, patch
+from utils.font_fitter import FontFitter, get_fitted_font_size
+
+
+class TestFontFitter(unittest.TestCase):
+    """
+    Test class for testing the FontFitter class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.font_fitter = FontFitter(max_fonts=2)
+
+    def test_get_fitted_font_size(self) -> None:
+        """
+        Testing the font size fitted to the width of a widget and the length of its text.
+        """
+        self.assertEqual(get_fitted_font_size(10, 200, 12, 2), 12)
+        self.assertEqual(get_fitted_font_size(100, 200, 12, 2), 3)
+        self.assertEqual(get_fitted_font_size(1000, 200, 12, 2), 2)
+        self.assertEqual(get_fitted_font_size(0, 200, 12, 2), 12)
+
+    @patch("utils.font_fitter.ctk.CTkFont")
+    def test_get_font(self, mock_font: MagicMock) -> None:
+        """
+        Testing the least recently used cache of the fonts of the FontFitter.
+        """
+        mock_font.side_effect = lambda **kwargs: MagicMock(**kwargs)
+
+        font = self.font_fitter.get_font("Arial", 12)
+        self.assertIs(self.font_fitter.get_font("Arial", 12), font)
+        self.assertEqual(mock_font.call_count, 1)
+
+        # The least recently used font is evicted
+        self.font_fitter.get_font("Arial", 10)
+        self.font_fitter.get_font("Arial", 12)
+        self.font_fitter.get_font("Arial", 8)
+        self.assertIs(self.font_fitter.get_font("Arial", 12), font)
+        self.font_fitter.get_font("Arial", 10)
+        self.assertEqual(mock_font.call_count, 4)
+
+    def test_request_fit(self) -> None:
+        """
+        Testing that the fitting of several widgets is scheduled in one callback.
+        """
+        widgets: list[MagicMock] = [MagicMock() for _ in range(3)]
+        for widget in widgets:
+            widget.after.return_value = "after#1"
+
+        with self.font_fitter.batch():
+            for widget in widgets:
+                self.font_fitter.request_fit(widget, 12, 2)
+
+            self.assertFalse(any(widget.after.called for widget in widgets))
+
+        self.assertEqual(sum(widget.after.call_count for widget in widgets), 1)
+
+        # Further requests are fitted with the scheduled callback
+        self.font_fitter.request_fit(widgets[0], 12, 2)
+        self.assertEqual(sum(widget.after.call_count for widget in widgets), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
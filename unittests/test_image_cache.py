@@ -0,0 +1,28 @@
+""" Unit test for the image cache. """
+
+import unittest
+from utils.image_cache import get_image, load_image
+
+
+class TestImageCache(unittest.TestCase):
+    """
+    Test class for testing the image cache.
+    """
+
+    def test_get_image(self) -> None:
+        """
+        Testing that every image file is decoded once and shared per size.
+        """
+        image = get_image("resources/Images/plus.png", (15, 15))
+
+        self.assertIs(get_image("resources/Images/plus.png", (15, 15)), image)
+        self.assertIsNot(get_image("resources/Images/plus.png", (20, 20)), image)
+        self.assertIs(
+            get_image("resources/Images/plus.png", (20, 20)).cget("light_image"),
+            load_image("resources/Images/plus.png"),
+        )
+        self.assertEqual(image.cget("size"), (15, 15))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+""" Unit test for the decimation of signals to the resolution of the plot canvas. """
+
+import unittest
+import numpy as np
+from utils.level_of_detail import (
+    DecimatedSignal,
+    MinMaxPyramid,
+    get_stem_points,
+    get_visible_sample_slice,
+    get_visible_slice,
+    minmax_decimate,
+)
+
+
+class TestLevelOfDetail(unittest.TestCase):
+    """
+    Test class for testing the decimation of signals.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.x = np.arange(1000, dtype=np.float64) / 10
+        self.y = np.sin(np.arange(1000) / 7)
+
+    def test_get_visible_slice(self) -> None:
+        """
+        Testing the slice of the samples within an x-range.
+        """
+        self.assertEqual(get_visible_slice(self.x, 10, 20), slice(99, 202))
+        self.assertEqual(get_visible_slice(self.x, -5, 200), slice(0, 1000))
+        self.assertEqual(get_visible_slice(self.x, 10.05, 10.08), slice(100, 102))
+
+        # The sample numbers give the same slices without creating them
+        sample_numbers = np.arange(1000)
+        for x_min, x_max in ((10, 20), (-5, 2000), (10.5, 10.8), (-np.inf, np.inf)):
+            self.assertEqual(
+                get_visible_sample_slice(1000, x_min, x_max),
+                get_visible_slice(sample_numbers, x_min, x_max),
+            )
+
+    def test_minmax_decimate(self) -> None:
+        """
+        Testing the reduction of a signal to the minimum and maximum of each bin.
+        """
+        x, y = minmax_decimate(self.x, self.y, 30)
+
+        self.assertLessEqual(len(x), 2 * 30)
+        self.assertEqual(y.min(), self.y.min())
+        self.assertEqual(y.max(), self.y.max())
+        # The points keep the order of the samples
+        self.assertTrue((np.diff(x) >= 0).all())
+        self.assertTrue(np.isin(x, self.x).all())
+
+        # The last 13 samples, which do not fill a bin of 34 samples, are a bin of their own
+        x, _ = minmax_decimate(self.x[:-1], self.y[:-1], 30)
+        self.assertEqual(len(x), 2 * 30)
+        self.assertGreaterEqual(x[-1], self.x[986])
+
+        # Signals with at most two samples per bin are not decimated
+        x, _ = minmax_decimate(self.x[:60], self.y[:60], 30)
+        self.assertEqual(len(x), 60)
+
+    def test_minmax_decimate_spike(self) -> None:
+        """
+        Testing that a single spike survives the decimation.
+        """
+        y = np.zeros(1_000_000, dtype=np.float32)
+        y[123_457] = 5.0
+
+        _, decimated_y = minmax_decimate(np.arange(len(y)), y, 100)
+
+        self.assertEqual(len(decimated_y), 200)
+        self.assertEqual(decimated_y.max(), 5.0)
+
+    def test_get_stem_points(self) -> None:
+        """
+        Testing the points of the stems drawn as a single line.
+        """
+        x, y = get_stem_points(np.array([1.0, 2.0]), np.array([5.0, -3.0]))
+
+        np.testing.assert_array_equal(x, [1.0, 1.0, np.nan, 2.0, 2.0, np.nan])
+        np.testing.assert_array_equal(y, [0.0, 5.0, np.nan, 0.0, -3.0, np.nan])
+
+    def test_min_max_pyramid(self) -> None:
+        """
+        Testing the extrema of ranges of samples found by a MinMaxPyramid.
+        """
+        rng = np.random.default_rng(0)
+        y = rng.standard_normal(10_000)
+        pyramid = MinMaxPyramid.build(y)
+
+        self.assertEqual(pyramid.top_level, 13)
+        min_indices, max_indices = pyramid.get_level(MinMaxPyramid.BASE_LEVEL)
+        self.assertEqual(len(min_indices), 10_000 // 32)
+        self.assertEqual(y[min_indices[3]], y[96:128].min())
+        self.assertEqual(y[max_indices[3]], y[96:128].max())
+
+        for start, stop in rng.integers(0, 10_000, size=(50, 2)):
+            start, stop = min(start, stop), max(start, stop) + 1
+            with self.subTest(start=start, stop=stop):
+                indices = pyramid.get_extrema(y, start, stop)
+                self.assertEqual(y[indices].min(), y[start:stop].min())
+                self.assertEqual(y[indices].max(), y[start:stop].max())
+
+                indices = pyramid.get_indices(y, start, stop, 20)
+                # Up to two points per bin and the bins before and after the whole blocks
+                self.assertLessEqual(len(indices), 2 * 20 + 4)
+                self.assertTrue((np.diff(indices) >= 0).all())
+                self.assertEqual(y[indices].min(), y[start:stop].min())
+                self.assertEqual(y[indices].max(), y[start:stop].max())
+
+        # Signals shorter than the lowest level have no levels
+        pyramid = MinMaxPyramid.build(y[:20])
+        self.assertEqual(pyramid.indices.shape, (2, 0))
+        np.testing.assert_array_equal(pyramid.get_indices(y, 0, 20, 100), range(20))
+
+    def test_decimated_signal(self) -> None:
+        """
+        Testing the points of a DecimatedSignal within x-ranges.
+        """
+        signal = DecimatedSignal(self.x, self.y)
+
+        self.assertEqual(len(signal), 1000)
+        self.assertEqual(signal.x_range, (0.0, 99.9))
+
+        x, _ = signal.get_points(0, 99.9, 50)
+        self.assertLessEqual(len(x), 100)
+
+        # Zooming in shows all samples of the x-range
+        x, y = signal.get_points(10, 12, 50)
+        np.testing.assert_array_equal(x, self.x[99:122])
+        np.testing.assert_array_equal(y, self.y[99:122])
+
+        # A pyramid gives the same extrema without reading all samples
+        pyramid_signal = DecimatedSignal(self.x, self.y, MinMaxPyramid.build(self.y))
+        x, y = pyramid_signal.get_points(0, 99.9, 10)
+        self.assertLessEqual(len(x), 2 * 10 + 4)
+        self.assertEqual((y.min(), y.max()), (self.y.min(), self.y.max()))
+
+        # Without ascending x values the sample numbers are used
+        signal = DecimatedSignal(self.x[::-1], self.y)
+        self.assertEqual(signal.x_range, (0, 999))
+        signal = DecimatedSignal(None, self.y)
+        self.assertEqual(signal.x_range, (0, 999))
+        x, y = signal.get_points(100, 120, 50)
+        np.testing.assert_array_equal(x, range(99, 122))
+        np.testing.assert_array_equal(y, self.y[99:122])
+        x, y = signal.get_points(0, 999, 10)
+        self.assertLessEqual(len(x), 20)
+        np.testing.assert_array_equal(y, self.y[x])
+        pyramid_signal = DecimatedSignal(None, self.y, MinMaxPyramid.build(self.y))
+        x, y = pyramid_signal.get_points(0, 999, 10)
+        self.assertEqual((y.min(), y.max()), (self.y.min(), self.y.max()))
+        np.testing.assert_array_equal(y, self.y[x])
+
+        # Datetimes are used by their integer values
+        times = np.datetime64("2024-01-01") + np.arange(1000).astype("timedelta64[s]")
+        signal = DecimatedSignal(times, self.y)
+        self.assertEqual(
+            signal.x_range, (times.view(np.int64)[0], times.view(np.int64)[-1])
+        )
+        x, y = signal.get_points(
+            times.view(np.int64)[100], times.view(np.int64)[120], 50
+        )
+        np.testing.assert_array_equal(x, times.view(np.int64)[99:122])
+        np.testing.assert_array_equal(y, self.y[99:122])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+""" Unit test for the NotificationDispatcher class. """
+
+import threading
+import unittest
+from utils.observer_publisher import (
+    FileStatePublisher,
+    NotificationDispatcher,
+    ProgressStatePublisher,
+    SimpleObserver,
+    SimplePublisher,
+    notification_dispatcher,
+)
+from unittests.helpers import FakeRoot
+
+
+class RecordingObserver(SimpleObserver):
+    """
+    Observer which records the state of the publishers it got notified by.
+    """
+
+    def __init__(self) -> None:
+        self.updates: list = []
+
+    def update(self, simple_publisher: SimplePublisher) -> None:
+        if isinstance(simple_publisher, ProgressStatePublisher):
+            self.updates.append(simple_publisher.value)
+        elif isinstance(simple_publisher, FileStatePublisher):
+            self.updates.append(simple_publisher.is_open)
+
+
+class TestNotificationDispatcher(unittest.TestCase):
+    """
+    Test class for testing the NotificationDispatcher class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.root = FakeRoot()
+        notification_dispatcher.bind(self.root)
+        self.observer = RecordingObserver()
+
+    def tearDown(self) -> None:
+        # Deinitialize after each test
+        notification_dispatcher.unbind()
+
+    def run_in_thread(self, function) -> None:
+        """
+        Run a function in a worker thread and wait for it.
+        """
+        thread = threading.Thread(target=function)
+        thread.start()
+        thread.join()
+
+    def test_deliver_on_main_loop(self) -> None:
+        """
+        Testing that notifications of worker threads are delivered on the main loop with their state.
+        """
+        file_state_publisher = FileStatePublisher()
+        file_state_publisher.attach(self.observer)
+
+        # The file status is reset right after the notification
+        self.run_in_thread(lambda: file_state_publisher.set_is_open(True))
+        self.assertEqual([], self.observer.updates)
+        self.assertFalse(file_state_publisher.is_open)
+
+        self.root.run_frame()
+        self.assertEqual([True], self.observer.updates)
+        # Without notifications no frame is scheduled
+        self.assertEqual([], self.root.callbacks)
+
+        # The main thread is notified immediately
+        file_state_publisher.set_is_open(True)
+        self.assertEqual([True, True], self.observer.updates)
+
+        snapshot = file_state_publisher.snapshot()
+        self.assertEqual(file_state_publisher, snapshot)
+        self.assertNotEqual(FileStatePublisher(), snapshot)
+
+    def test_coalesce_progress(self) -> None:
+        """
+        Testing that a burst of progress updates reaches the observers at most once per frame.
+        """
+        progress_state_publisher = ProgressStatePublisher()
+        progress_state_publisher.mode = "determinate"
+        progress_state_publisher.attach(self.observer)
+
+        def read_file() -> None:
+            progress_state_publisher.set_value(ProgressStatePublisher.START_PROGRESSBAR)
+            for value in range(1, 100):
+                progress_state_publisher.set_value(float(value))
+
+        self.run_in_thread(read_file)
+        # A single frame delivers the burst
+        self.assertEqual(1, len(self.root.callbacks))
+        self.root.run_frame()
+        self.assertEqual([0.0, 99.0], self.observer.updates)
+
+        self.run_in_thread(
+            lambda: progress_state_publisher.set_value(
+                ProgressStatePublisher.STOP_PROGRESSBAR
+            )
+        )
+        self.root.run_frame()
+        self.assertEqual([0.0, 99.0, 100.0], self.observer.updates)
+
+    def test_unbound(self) -> None:
+        """
+        Testing that notifications are delivered immediately without a Tk root.
+        """
+        dispatcher = NotificationDispatcher()
+        self.assertTrue(dispatcher.is_immediate())
+
+        notification_dispatcher.unbind()
+        progress_state_publisher = ProgressStatePublisher()
+        progress_state_publisher.attach(self.observer)
+        self.run_in_thread(lambda: progress_state_publisher.set_value(50.0))
+        self.assertEqual([50.0], self.observer.updates)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+""" Unit test for the RedrawScheduler class. """
+
+import unittest
+from functools import partial
+from utils.redraw_scheduler import RedrawScheduler
+from unittests.helpers import FakeRoot
+
+
+class TestRedrawScheduler(unittest.TestCase):
+    """
+    Test class for testing the RedrawScheduler class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.root = FakeRoot()
+        self.calls: list[str] = []
+        self.redraw_scheduler = RedrawScheduler(
+            self.root, lambda: self.calls.append("render")
+        )
+
+    def test_coalesce_requests(self) -> None:
+        """
+        Testing that a burst of requests runs each task once and renders once.
+        """
+        update_traces = partial(self.calls.append, "update_traces")
+
+        for _ in range(50):
+            self.redraw_scheduler.request(update_traces)
+
+        self.assertTrue(self.redraw_scheduler.is_scheduled)
+        self.assertEqual([], self.calls)
+        self.assertEqual(1, len(self.root.callbacks))
+
+        self.root.run_frame()
+        self.assertEqual(["update_traces", "render"], self.calls)
+        self.assertFalse(self.redraw_scheduler.is_scheduled)
+
+        # The next request schedules the next frame
+        self.redraw_scheduler.request()
+        self.root.run_frame()
+        self.assertEqual(["update_traces", "render", "render"], self.calls)
+
+    def test_order_of_tasks(self) -> None:
+        """
+        Testing that the tasks run in the order of their last request.
+        """
+        reset_traces = partial(self.calls.append, "reset_traces")
+        update_traces = partial(self.calls.append, "update_traces")
+
+        self.redraw_scheduler.request(update_traces)
+        self.redraw_scheduler.request(reset_traces, update_traces)
+        self.root.run_frame()
+
+        self.assertEqual(["reset_traces", "update_traces", "render"], self.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+""" Unit test for the SafeThreadQueue class. """
+
+import math
+import threading
+import unittest
+from concurrent.futures import CancelledError
+from utils.threads import CancellationToken, SafeThreadQueue, TaskType
+
+
+class TestSafeThreadQueue(unittest.TestCase):
+    """
+    Test class for testing the SafeThreadQueue class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.thread_queue = SafeThreadQueue(max_io_workers=2)
+
+    def tearDown(self) -> None:
+        # Deinitialize after each test
+        self.thread_queue.stop_worker()
+
+    def test_serial_tasks(self) -> None:
+        """
+        Testing the sequential execution of the serial tasks with their functions before and after them.
+        """
+        calls: list[str] = []
+
+        for index in range(3):
+            task = self.thread_queue.add_task(
+                calls.append,
+                args=(f"task_{index}",),
+                before_thread=lambda index=index: calls.append(f"before_{index}"),
+                after_thread=lambda index=index: calls.append(f"after_{index}"),
+            )
+        task.result(timeout=5)
+
+        self.assertEqual(
+            [
+                f"{step}_{index}"
+                for index in range(3)
+                for step in ("before", "task", "after")
+            ],
+            calls,
+        )
+
+    def test_io_tasks(self) -> None:
+        """
+        Testing the concurrent execution of I/O-bound tasks beside the serial tasks.
+        """
+        blocking_task_started = threading.Event()
+        release_blocking_task = threading.Event()
+
+        def blocking_task() -> None:
+            blocking_task_started.set()
+            release_blocking_task.wait(5)
+
+        # A blocking I/O task does not delay the serial tasks
+        io_task = self.thread_queue.add_task(blocking_task, task_type=TaskType.IO)
+        blocking_task_started.wait(5)
+        serial_task = self.thread_queue.add_task(lambda: "done")
+        self.assertEqual("done", serial_task.result(timeout=5))
+        self.assertFalse(io_task.done())
+        release_blocking_task.set()
+        io_task.result(timeout=5)
+
+    def test_dependencies(self) -> None:
+        """
+        Testing that tasks start after their dependencies and are cancelled if a dependency failed.
+        """
+        calls: list[str] = []
+        release_first_task = threading.Event()
+
+        first_task = self.thread_queue.add_task(
+            lambda: release_first_task.wait(5) and calls.append("first"),
+            task_type=TaskType.IO,
+        )
+        second_task = self.thread_queue.add_task(
+            calls.append, args=("second",), depends_on=(first_task,)
+        )
+        self.assertFalse(second_task.done())
+        release_first_task.set()
+        second_task.result(timeout=5)
+        self.assertEqual(["first", "second"], calls)
+
+        with self.assertLogs("utils.threads", "ERROR") as logs:
+            failing_task = self.thread_queue.add_task(math.sqrt, args=(-1,))
+            dependent_task = self.thread_queue.add_task(
+                calls.append, args=("dependent",), depends_on=(failing_task,)
+            )
+            # The exception is raised by the result of the task and logged
+            with self.assertRaises(ValueError):
+                failing_task.result(timeout=5)
+        self.assertIn("ValueError", logs.output[0])
+        with self.assertRaises(CancelledError):
+            dependent_task.result(timeout=5)
+        self.assertNotIn("dependent", calls)
+
+    def test_superseding_tasks(self) -> None:
+        """
+        Testing that a newer task with the same key cancels the pending and the running older ones.
+        """
+        running_task_started = threading.Event()
+        chunks_read: list[int] = []
+
+        def read_chunks(cancellation_token: CancellationToken) -> None:
+            running_task_started.set()
+            for chunk in range(500):
+                if cancellation_token.is_cancelled:
+                    return
+                chunks_read.append(chunk)
+                threading.Event().wait(0.01)
+
+        cancellation_token = CancellationToken()
+        running_task = self.thread_queue.add_task(
+            read_chunks,
+            args=(cancellation_token,),
+            key="read_file",
+            cancellation_token=cancellation_token,
+        )
+        running_task_started.wait(5)
+
+        pending_task = self.thread_queue.add_task(lambda: "pending", key="read_file")
+        latest_task = self.thread_queue.add_task(lambda: "latest", key="read_file")
+
+        self.assertEqual("latest", latest_task.result(timeout=5))
+        self.assertIsNone(running_task.result(timeout=5))
+        self.assertLess(len(chunks_read), 500)
+        self.assertTrue(pending_task.cancelled())
+
+        # Tasks with other keys are independent
+        other_task = self.thread_queue.add_task(lambda: "other", key="other")
+        self.assertEqual("other", other_task.result(timeout=5))
+        self.assertFalse(latest_task.cancelled())
+
+
+if __name__ == "__main__":
+    unittest.main()
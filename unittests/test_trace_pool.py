@@ -0,0 +1,93 @@
+""" Unit test for the Trace and TracePool classes. """
+
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from utils.level_of_detail import DecimatedSignal
+from utils.trace_pool import Trace, TracePool
+
+
+class TestTracePool(unittest.TestCase):
+    """
+    Test class for testing the Trace and TracePool classes.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.axes = Figure().add_subplot()
+        self.signal = DecimatedSignal(
+            np.arange(10000, dtype=np.float64), np.sin(np.arange(10000) / 7)
+        )
+
+    def create_trace(self, plot_type: str = "Plot") -> Trace:
+        """
+        Create a trace of the signal with a new line.
+
+        Args:
+            plot_type (str, optional): The plot type. Defaults to "Plot".
+
+        Returns:
+            Trace: The trace.
+        """
+        (line,) = self.axes.plot([], [])
+        return Trace(self.signal, line, plot_type)
+
+    def test_decimate(self) -> None:
+        """
+        Testing that the points are only decimated again for another view.
+        """
+        trace = self.create_trace()
+
+        self.assertTrue(trace.decimate(0, 9999, 100))
+        x_data = trace.line.get_xdata()
+        self.assertLessEqual(len(x_data), 2 * 100 + 2)
+        self.assertTrue(trace.covers(0, 9999))
+        self.assertFalse(trace.covers(-1, 9999))
+
+        self.assertFalse(trace.decimate(0, 9999, 100))
+        self.assertIs(x_data, trace.line.get_xdata())
+
+        self.assertTrue(trace.decimate(0, 9999, 50))
+        self.assertTrue(trace.decimate(100, 200, 50))
+
+    def test_decimate_stems(self) -> None:
+        """
+        Testing that the points of a stem trace are drawn as stems.
+        """
+        trace = self.create_trace("Stem")
+        trace.decimate(0, 9999, 100)
+
+        y_data = trace.line.get_ydata()
+        self.assertTrue(np.all(y_data[0::3] == 0.0))
+        self.assertTrue(np.all(np.isnan(y_data[2::3])))
+
+    def test_get_least_recently_used(self) -> None:
+        """
+        Testing that the hidden traces are evicted least recently used first.
+        """
+        traces = {key: self.create_trace() for key in "abcd"}
+        for trace in traces.values():
+            trace.decimate(0, 9999, 100)
+        trace_pool = TracePool(max_bytes=2 * traces["a"].nbytes)
+        for key, trace in traces.items():
+            trace_pool.add(key, trace)
+
+        self.assertIs(traces["a"], trace_pool.get("a"))
+        self.assertIsNone(trace_pool.get("e"))
+        self.assertEqual(["b", "c", "d", "a"], list(trace_pool))
+
+        # The visible trace "b" is kept and the hidden traces are evicted until two are left
+        for key in "acd":
+            traces[key].line.set_visible(False)
+        trace_pool.evict()
+
+        self.assertEqual(["b", "d", "a"], list(trace_pool))
+        self.assertNotIn(traces["c"].line, self.axes.lines)
+
+        trace_pool.clear()
+        self.assertEqual(0, len(trace_pool))
+        self.assertEqual([], list(self.axes.lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+""" Unit test for the GroupStringFilter class. """
+
+import unittest
+from unittest.mock import patch
+from utils.tree_view_manager import GroupStringFilter, MeasurementType, NGramIndex
+
+
+class TestGroupStringFilter(unittest.TestCase):
+    """
+    Test class for testing the GroupStringFilter class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        self.filter_system = GroupStringFilter()
+        self.filter_system.add_entries(
+            [
+                "Names::first",
+                "Names::second",
+                "Names::third",
+                "Ages::fourth",
+                "Ages::fifth",
+                "Figures::second",
+                "Figures::forth",
+                "Figures::seventh",
+            ],
+            [
+                "non_constant",
+                "zero",
+                "non_constant",
+                "zero",
+                "non_constant",
+                "zero",
+                "non_constant",
+                "non_constant",
+            ],
+            "::",
+        )
+
+    def test_n_gram_index(self) -> None:
+        """
+        Testing the substring search of the NGramIndex.
+        """
+        n_gram_index = NGramIndex()
+        n_gram_index.build(
+            ["Motor_Temp_Left", "Motor_Speed", "Pump_Temp", "Temperature", "tmp"]
+        )
+
+        self.assertEqual(len(n_gram_index), 5)
+        self.assertEqual(list(n_gram_index.search("temp")), [0, 2, 3])
+        self.assertEqual(list(n_gram_index.search("_TEMP_")), [0])
+        self.assertEqual(list(n_gram_index.search("m")), [0, 1, 2, 3, 4])
+        self.assertEqual(list(n_gram_index.search("temp motor")), [0])
+        self.assertEqual(list(n_gram_index.search("  ")), [0, 1, 2, 3, 4])
+        self.assertEqual(list(n_gram_index.search("pmet")), [])
+        # All n-grams occur, but not in this order
+        self.assertEqual(list(n_gram_index.search("mp_temp_")), [])
+
+    def test_filter_by_substring(self) -> None:
+        """
+        Testing the filtering of the GroupStringFilter by substrings of the strings.
+        """
+        self.filter_system.set_search_term("Th")
+        self.assertEqual(
+            self.filter_system.filter(),
+            [
+                ("Names", "third", "non_constant"),
+                ("Ages", "fourth", "zero"),
+                ("Ages", "fifth", "non_constant"),
+                ("Figures", "forth", "non_constant"),
+                ("Figures", "seventh", "non_constant"),
+            ],
+        )
+
+        self.filter_system.set_filter(MeasurementType.ZERO)
+        self.assertEqual(self.filter_system.filter(), [("Ages", "fourth", "zero")])
+
+        # Every word of the search term must be contained
+        self.filter_system.set_filter(MeasurementType.ALL)
+        self.filter_system.set_search_term("th ou")
+        self.assertEqual(self.filter_system.filter(), [("Ages", "fourth", "zero")])
+
+        # Equal strings in different groups are both found
+        self.filter_system.set_filter(MeasurementType.ALL)
+        self.filter_system.set_search_term("sec")
+        self.assertEqual(
+            self.filter_system.filter(),
+            [("Names", "second", "zero"), ("Figures", "second", "zero")],
+        )
+
+    def test_incremental_search(self) -> None:
+        """
+        Testing that the GroupStringFilter narrows or reuses the results of previous search terms.
+        """
+        self.filter_system.set_search_term("o")
+        self.assertEqual(len(self.filter_system.filter()), 4)
+
+        with patch.object(
+            NGramIndex, "search", autospec=True, side_effect=NGramIndex.search
+        ) as mock_search:
+            # The extended search term narrows the previous result
+            self.filter_system.set_search_term("ond")
+            self.filter_system.filter()
+            self.filter_system.set_search_term("ond z")
+            self.assertEqual(self.filter_system.filter(), [])
+            self.filter_system.set_search_term("ond s")
+            self.assertEqual(
+                self.filter_system.filter(),
+                [("Names", "second", "zero"), ("Figures", "second", "zero")],
+            )
+
+            # Deleting characters returns the cached result
+            self.filter_system.set_search_term("o")
+            self.assertEqual(len(self.filter_system.filter()), 4)
+
+            # A single short word is looked up directly
+            self.assertEqual(mock_search.call_count, 1)
+
+        # The cache is limited and cleared with new entries
+        self.filter_system.max_cached_searches = 2
+        for term in ("f", "fi", "fif"):
+            self.filter_system.set_search_term(term)
+            self.filter_system.filter()
+        self.assertEqual(
+            list(self.filter_system.search_cache),
+            [("Substring", "fi"), ("Substring", "fif")],
+        )
+        self.filter_system.add_entries(["Names::first"], ["zero"], "::")
+        self.assertEqual(len(self.filter_system.search_cache), 0)
+
+    def test_fuzzy_search(self) -> None:
+        """
+        Testing the ranked fuzzy search of the NGramIndex.
+        """
+        n_gram_index = NGramIndex()
+        n_gram_index.build(["Pump_Temp_Rear", "Motor", "Motor_Temp", "Fan", "motor"])
+
+        # Word starts and consecutive characters rank first, equal scores by their id
+        self.assertEqual(n_gram_index.fuzzy_search("mtr"), [1, 2, 4, 0])
+        self.assertEqual(n_gram_index.fuzzy_search("motor temp"), [2])
+        self.assertEqual(n_gram_index.fuzzy_search("mtr", limit=2), [1, 2])
+        self.assertEqual(n_gram_index.fuzzy_search("", limit=2), [0, 1])
+        self.assertEqual(n_gram_index.fuzzy_search("rmt"), [])
+
+        # Missing characters are tolerated up to the maximum number of typos
+        self.assertEqual(n_gram_index.fuzzy_search("motxr"), [])
+        self.assertEqual(n_gram_index.fuzzy_search("motxr", max_typos=1), [1, 2, 4])
+        self.assertEqual(n_gram_index.fuzzy_search("moxxr", max_typos=1), [])
+
+        # A word start of the first character is only preferred if the rest of the query matches after it
+        n_gram_index.build(["xab_a", "x_ab"])
+        self.assertEqual(n_gram_index.fuzzy_search("ab"), [1, 0])
+
+    def test_filter_by_fuzzy(self) -> None:
+        """
+        Testing the fuzzy filtering of the GroupStringFilter by the substrings.
+        """
+        self.filter_system.set_mode("Fuzzy")
+        self.filter_system.set_search_term("sv")
+
+        self.assertEqual(
+            self.filter_system.filter(),
+            [("Figures", "seventh", "non_constant")],
+        )
+
+        # A search term of four characters may contain a typo
+        self.filter_system.set_search_term("fith")
+        self.assertEqual(
+            self.filter_system.filter(),
+            [
+                ("Ages", "fifth", "non_constant"),
+                ("Names", "first", "non_constant"),
+                ("Figures", "forth", "non_constant"),
+                ("Ages", "fourth", "zero"),
+            ],
+        )
+
+        self.filter_system.set_filter(MeasurementType.ZERO)
+        self.assertEqual(self.filter_system.filter(), [("Ages", "fourth", "zero")])
+
+        # Only the strings of the filter type are ranked, so the limit does not cut them off
+        self.filter_system.fuzzy_limit = 1
+        self.filter_system.search_cache.clear()
+        self.assertEqual(self.filter_system.filter(), [("Ages", "fourth", "zero")])
+
+        self.filter_system.set_filter(MeasurementType.ALL)
+        self.assertEqual(
+            self.filter_system.filter(), [("Ages", "fifth", "non_constant")]
+        )
+
+    def test_filter_by_group(self) -> None:
+        """
+        Testing the filtering of the GroupStringFilter by the group names.
+        """
+        self.filter_system.set_mode("Group")
+        self.filter_system.set_search_term("es")
+
+        self.assertEqual(
+            self.filter_system.filter(),
+            [
+                ("Names", "first", "non_constant"),
+                ("Names", "second", "zero"),
+                ("Names", "third", "non_constant"),
+                ("Ages", "fourth", "zero"),
+                ("Ages", "fifth", "non_constant"),
+                ("Figures", "second", "zero"),
+                ("Figures", "forth", "non_constant"),
+                ("Figures", "seventh", "non_constant"),
+            ],
+        )
+
+        self.filter_system.set_search_term("gur")
+        self.assertEqual(len(self.filter_system.filter()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
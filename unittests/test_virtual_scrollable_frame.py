@@ -0,0 +1,280 @@
+""" Unit test for the VirtualScrollableFrame class. """
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+import unittest
+from unittest.mock import patch
+import customtkinter as ctk
+from utils.virtual_scrollable_frame import VirtualScrollableFrame, get_visible_rows
+
+
+class FakeWidget:
+    """
+    A widget which records how it is bound and placed, so no display is needed.
+    """
+
+    def __init__(self, row_type: str) -> None:
+        self.row_type: str = row_type
+        self.data: Any = None
+        self.nr_of_binds: int = 0
+        self.nr_of_places: int = 0
+        self.y: int | None = None
+
+    def bind(self, *_: Any, **__: Any) -> None:
+        """
+        Ignore the mouse wheel bindings.
+        """
+
+    def place(self, y: int, **_: Any) -> None:
+        """
+        Record the position of the widget.
+        """
+        self.y = y
+        self.nr_of_places += 1
+
+    def place_forget(self) -> None:
+        """
+        Record that the widget is hidden.
+        """
+        self.y = None
+
+
+class TestVirtualScrollableFrame(unittest.TestCase):
+    """
+    Test class for testing the VirtualScrollableFrame class.
+    """
+
+    def setUp(self) -> None:
+        # Initialize before each test
+        with patch.object(ctk.CTkFrame, "__init__", return_value=None), patch(
+            "utils.virtual_scrollable_frame.ctk"
+        ):
+            self.frame = VirtualScrollableFrame(None, row_height=10, overscan=0)
+        # 3 rows fit in the viewport
+        self.frame.viewport.winfo_height.return_value = 30
+        self.widget_scaling: float = 1.0
+        scaling_patcher = patch.object(
+            VirtualScrollableFrame,
+            "_get_widget_scaling",
+            lambda _: self.widget_scaling,
+        )
+        scaling_patcher.start()
+        self.addCleanup(scaling_patcher.stop)
+
+        self.created_widgets: list[FakeWidget] = []
+        # The widgets bound within the current batch update and the layout passes after them
+        self.batched_widgets: list[FakeWidget] | None = None
+        self.layout_passes: list[list[FakeWidget]] = []
+        self.frame.batch_update = self.batch_update
+        for row_type in ("label", "button"):
+            self.frame.register_row_type(
+                row_type,
+                lambda row_type=row_type: self.create_widget(row_type),
+                self.bind_widget,
+            )
+
+    def create_widget(self, row_type: str) -> FakeWidget:
+        """
+        Create a fake widget of a row type.
+        """
+        widget: FakeWidget = FakeWidget(row_type)
+        self.created_widgets.append(widget)
+
+        return widget
+
+    def bind_widget(self, widget: FakeWidget, data: Any) -> None:
+        """
+        Show the data of a row in a fake widget, deferring its layout to the batch update.
+        """
+        widget.data = data
+        widget.nr_of_binds += 1
+
+        if self.batched_widgets is None:
+            self.layout_passes.append([widget])
+        else:
+            self.batched_widgets.append(widget)
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """
+        Lay out all widgets bound within this context in one pass after its end.
+        """
+        self.batched_widgets = []
+        try:
+            yield
+        finally:
+            if self.batched_widgets:
+                self.layout_passes.append(self.batched_widgets)
+            self.batched_widgets = None
+
+    def visible_data(self) -> list[tuple[str, Any]]:
+        """
+        Get the row types and data shown by the placed widgets from top to bottom.
+        """
+        widgets: list[FakeWidget] = sorted(
+            (widget for widget in self.created_widgets if widget.y is not None),
+            key=lambda widget: widget.y,
+        )
+
+        return [(widget.row_type, widget.data) for widget in widgets]
+
+    def test_get_visible_rows(self) -> None:
+        """
+        Testing the rows within the viewport and the overscan of the VirtualScrollableFrame.
+        """
+        # The first rows, without overscan above them
+        self.assertEqual(get_visible_rows(0, 100, 28, 10_000, 2), range(0, 6))
+
+        # A partially visible row at the top and the bottom
+        self.assertEqual(get_visible_rows(14, 100, 28, 10_000), range(0, 5))
+        self.assertEqual(get_visible_rows(280, 100, 28, 10_000, 2), range(8, 16))
+
+        # The number of rows does not depend on the number of all rows
+        self.assertEqual(
+            len(get_visible_rows(28 * 9_000, 100, 28, 10_000, 2)),
+            len(get_visible_rows(28 * 90, 100, 28, 1_000, 2)),
+        )
+
+        # The last rows and fewer rows than fit in the viewport
+        self.assertEqual(
+            get_visible_rows(28 * 9_997, 100, 28, 10_000, 2), range(9_995, 10_000)
+        )
+        self.assertEqual(get_visible_rows(0, 100, 28, 2, 2), range(0, 2))
+        self.assertEqual(get_visible_rows(0, 100, 28, 0, 2), range(0, 0))
+
+    def test_pool_per_row_type(self) -> None:
+        """
+        Testing that the VirtualScrollableFrame takes the widgets of a row from the pool of its type.
+        """
+        self.frame.set_rows([("label", 0), ("button", 1), ("label", 2)])
+        self.assertEqual(
+            [("label", 0), ("button", 1), ("label", 2)], self.visible_data()
+        )
+        self.assertEqual(3, len(self.created_widgets))
+
+        # The rows change their type, the released widgets are reused for the rows of their type
+        self.frame.set_rows([("button", 0), ("label", 1), ("button", 2)])
+        self.assertEqual(
+            [("button", 0), ("label", 1), ("button", 2)], self.visible_data()
+        )
+        # Only the second button is new, the labels left in the pool are not shown
+        self.assertEqual(4, len(self.created_widgets))
+        self.assertEqual(1, len(self.frame.free_widgets["label"]))
+        self.assertEqual([], self.frame.free_widgets["button"])
+
+        # Every widget keeps the row type it was created for
+        for widget in self.created_widgets:
+            self.assertEqual(widget.row_type, self.frame.get_row_type(widget))
+            self.assertFalse(hasattr(widget, "_virtual_row_type"))
+
+    def test_scroll(self) -> None:
+        """
+        Testing that the VirtualScrollableFrame rebinds its widgets to the rows on scrolling.
+        """
+        self.frame.set_rows([("label", index) for index in range(1_000)])
+        self.assertEqual(
+            [("label", 0), ("label", 1), ("label", 2)], self.visible_data()
+        )
+        widgets: list[FakeWidget] = list(self.created_widgets)
+
+        # Scroll by one row, the widget of the row that left the viewport shows the new row
+        self.frame.yview("scroll", 1, "units")
+        self.assertEqual(
+            [("label", 1), ("label", 2), ("label", 3)], self.visible_data()
+        )
+        self.assertEqual(widgets, self.created_widgets)
+
+        # Scroll by pages and to the end, no widget is created
+        self.frame.yview("scroll", 2, "pages")
+        self.assertEqual(
+            [("label", 7), ("label", 8), ("label", 9)], self.visible_data()
+        )
+        self.frame.yview_moveto(1.0)
+        self.assertEqual(
+            [("label", 997), ("label", 998), ("label", 999)], self.visible_data()
+        )
+        self.assertEqual(widgets, self.created_widgets)
+
+    def test_unchanged_rows(self) -> None:
+        """
+        Testing that the VirtualScrollableFrame does not bind or place the widgets of unchanged rows again.
+        """
+        self.frame.set_rows([("label", index) for index in range(10)])
+        self.assertEqual(
+            [1, 1, 1], [widget.nr_of_binds for widget in self.created_widgets]
+        )
+        self.assertEqual(
+            [1, 1, 1], [widget.nr_of_places for widget in self.created_widgets]
+        )
+
+        # Equal rows at the same position
+        self.frame.set_rows(
+            [("label", index) for index in range(10)], keep_position=True
+        )
+        self.frame.render()
+        self.assertEqual(
+            [1, 1, 1], [widget.nr_of_binds for widget in self.created_widgets]
+        )
+        self.assertEqual(
+            [1, 1, 1], [widget.nr_of_places for widget in self.created_widgets]
+        )
+
+        # Only the widget of the changed row is bound again, none is placed again
+        rows: list[tuple[str, Any]] = [("label", index) for index in range(10)]
+        rows[1] = ("label", "changed")
+        self.frame.set_rows(rows, keep_position=True)
+        self.assertEqual(
+            [("label", 0), ("label", "changed"), ("label", 2)], self.visible_data()
+        )
+        self.assertEqual(
+            [1, 2, 1], [widget.nr_of_binds for widget in self.created_widgets]
+        )
+        self.assertEqual(
+            [1, 1, 1], [widget.nr_of_places for widget in self.created_widgets]
+        )
+
+    def test_batch_update(self) -> None:
+        """
+        Testing that the VirtualScrollableFrame binds all widgets of an update in one batch update.
+        """
+        self.frame.set_rows([("label", index) for index in range(1_000)])
+        self.assertEqual([self.created_widgets], self.layout_passes)
+
+        # Scrolling by a page rebinds every widget in a single layout pass
+        self.layout_passes.clear()
+        self.frame.yview("scroll", 1, "pages")
+        self.assertEqual(1, len(self.layout_passes))
+        self.assertCountEqual(self.created_widgets, self.layout_passes[0])
+
+        # Nothing changed, no layout pass
+        self.layout_passes.clear()
+        self.frame.render()
+        self.assertEqual([], self.layout_passes)
+
+    def test_widget_scaling(self) -> None:
+        """
+        Testing that the VirtualScrollableFrame measures its viewport in the unscaled pixels of the rows.
+        """
+        # 3 rows of 10 unscaled pixels fit in 45 pixels on the screen
+        self.widget_scaling = 1.5
+        self.frame.viewport.winfo_height.return_value = 45
+        self.frame.set_rows([("label", index) for index in range(1_000)])
+        self.assertEqual(30, self.frame.viewport_height)
+        self.assertEqual(
+            [("label", 0), ("label", 1), ("label", 2)], self.visible_data()
+        )
+
+        # The last row can be scrolled completely into view
+        self.frame.yview_moveto(1.0)
+        self.assertEqual(1_000 * 10 - 30, self.frame.max_offset)
+        self.assertEqual(
+            [("label", 997), ("label", 998), ("label", 999)], self.visible_data()
+        )
+        self.assertEqual(
+            [0, 10, 20], sorted(widget.y for widget in self.created_widgets)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
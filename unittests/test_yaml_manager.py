@@ -104,7 +104,42 @@ class TestYAMLManager(unittest.TestCase):
         """
         Testing the updating file paths.
         """
-        # TODO
+        yaml_manager = YAMLManager("file_paths.yaml", 2)
+        dialect: dict[str, str] = {"delimiter": ",", "decimal": "."}
+
+        with self.assertRaises(ValueError, msg="Invalid file path!"):
+            yaml_manager.update_file_paths(None, {})
+
+        file_paths = yaml_manager.update_file_paths("a.csv", {}, dialect)
+        self.assertEqual(
+            [{"file_path": "a.csv", "dialect": dialect}], list(file_paths.values())
+        )
+
+        # Entries of older versions without a dialect are still recognized
+        file_paths = yaml_manager.update_file_paths("b.csv", {"0": "b.csv", **file_paths})
+        self.assertEqual(
+            [{"file_path": "a.csv", "dialect": dialect}, {"file_path": "b.csv"}],
+            list(file_paths.values()),
+        )
+
+        # Reopening a file keeps its dialect and moves it to the end
+        file_paths = yaml_manager.update_file_paths("a.csv", file_paths)
+        self.assertEqual(
+            [{"file_path": "b.csv"}, {"file_path": "a.csv", "dialect": dialect}],
+            list(file_paths.values()),
+        )
+
+        file_paths = yaml_manager.update_file_paths("c.csv", file_paths)
+        self.assertEqual(
+            ["a.csv", "c.csv"],
+            [yaml_manager.get_entry_file_path(entry) for entry in file_paths.values()],
+        )
+
+        with patch.object(YAMLManager, "open_file", return_value=file_paths):
+            self.assertEqual(["a.csv", "c.csv"], yaml_manager.get_file_paths())
+            self.assertEqual(dialect, yaml_manager.get_file_dialect("a.csv"))
+            self.assertIsNone(yaml_manager.get_file_dialect("c.csv"))
+            self.assertIsNone(yaml_manager.get_file_dialect("d.csv"))
 
     def test_dump_yaml_file(self) -> None:
         """
@@ -0,0 +1,220 @@
+""" Defines the BlitManager class which redraws only the changed artists of a matplotlib figure,
+    on top of a cached background of the static artists like the axes, grid and labels. """
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.transforms import BboxBase
+
+
+class BlitManager:
+    """
+    Class for redrawing the artists of a figure by blitting.
+
+    A full draw of the canvas renders the static artists only and the region of the blitted
+    artists is kept as the background. The layers, e.g. the traces of a plot, are drawn on the
+    background one after another and a copy of the region is kept after each layer, so adding
+    a layer only draws this layer and removing a layer restores the copy below it and draws
+    the layers above it again. The overlays, e.g. a crosshair or a legend, are drawn on top
+    of the layers with every update.
+    """
+
+    __slots__ = (
+        "__canvas",
+        "__bbox",
+        "__max_snapshots",
+        "__layers",
+        "__overlays",
+        "__snapshots",
+        "__is_static",
+    )
+
+    def __init__(
+        self, canvas: FigureCanvasBase, bbox: BboxBase, max_snapshots: int = 16
+    ) -> None:
+        """
+        Initializes the BlitManager.
+
+        Args:
+            canvas (FigureCanvasBase): The canvas of the figure, which must support blitting.
+            bbox (BboxBase): The region of the blitted artists, e.g. the bbox of the axes.
+            max_snapshots (int, optional): The maximum number of copies kept below the topmost layers,
+                                            besides the background. Defaults to 16.
+        """
+        self.__canvas: FigureCanvasBase = canvas
+        self.__bbox: BboxBase = bbox
+        self.__max_snapshots: int = max_snapshots
+
+        self.__layers: list[Artist] = []
+        self.__overlays: list[Artist] = []
+        # The copy of the region below each layer and the one with all layers as the last copy,
+        # empty until the next full draw
+        self.__snapshots: list[Any | None] = []
+        self.__is_static: bool = False
+
+        self.__canvas.mpl_connect("draw_event", self.on_draw)
+
+    @property
+    def layers(self) -> list[Artist]:
+        """
+        Get the layers.
+
+        Returns:
+            list[Artist]: The layers, from the bottom to the top.
+        """
+        return list(self.__layers)
+
+    def add_layers(self, artists: list[Artist]) -> None:
+        """
+        Add artists on top of the layers and draw only them. The canvas shows them with the next update.
+
+        Args:
+            artists (list[Artist]): The artists to add.
+        """
+        for artist in artists:
+            artist.set_animated(True)
+            self.__layers.append(artist)
+
+            if self.__snapshots:
+                self.__snapshots.append(None)
+
+        if self.__snapshots and artists:
+            self.__draw_layers(len(self.__layers) - len(artists))
+
+    def remove_layers(self, artists: list[Artist]) -> None:
+        """
+        Remove artists from the layers and draw only the layers above the lowest removed one again.
+        The canvas shows the result with the next update.
+
+        Args:
+            artists (list[Artist]): The artists to remove, they are not removed from the figure.
+        """
+        lowest_index: int | None = None
+
+        for artist in artists:
+            index: int = self.__layers.index(artist)
+            self.__layers.pop(index)
+            artist.set_animated(False)
+
+            if self.__snapshots:
+                # The copy with the removed layer is not valid anymore
+                self.__snapshots.pop(index + 1)
+                lowest_index = (
+                    index if lowest_index is None else min(lowest_index, index)
+                )
+
+        if lowest_index is not None:
+            self.__draw_layers(lowest_index)
+
+    def add_overlay(self, artist: Artist) -> None:
+        """
+        Add an artist which is drawn on top of the layers with every update.
+
+        Args:
+            artist (Artist): The artist to add.
+        """
+        artist.set_animated(True)
+        self.__overlays.append(artist)
+
+    def remove_overlay(self, artist: Artist) -> None:
+        """
+        Remove an overlay.
+
+        Args:
+            artist (Artist): The artist to remove, it is not removed from the figure.
+        """
+        self.__overlays.remove(artist)
+        artist.set_animated(False)
+
+    def invalidate(self) -> None:
+        """
+        Discard the background and the copies, e.g. if the axes changed, so the next update draws
+        the canvas fully.
+        """
+        self.__snapshots = []
+
+    def update(self) -> None:
+        """
+        Show the layers and draw the overlays on top of them, or request a full draw
+        if there is no valid background.
+        """
+        if not self.__snapshots:
+            self.__canvas.draw_idle()
+            return
+
+        self.__canvas.restore_region(self.__snapshots[-1])
+        self.__draw_overlays()
+        self.__canvas.blit(self.__bbox)
+
+    @contextmanager
+    def static(self) -> Iterator[None]:
+        """
+        Draw the layers and overlays like static artists within this context, e.g. to save the figure,
+        as figures are saved without the animated artists. The canvas is drawn fully with the next update.
+
+        Yields:
+            Iterator[None]: The context of the static artists.
+        """
+        artists: list[Artist] = self.__layers + self.__overlays
+        for artist in artists:
+            artist.set_animated(False)
+        self.__is_static = True
+        try:
+            yield
+        finally:
+            for artist in artists:
+                artist.set_animated(True)
+            self.__is_static = False
+            self.invalidate()
+
+    def on_draw(self, _=None) -> None:
+        """
+        Keep the background after a full draw and draw the layers and the overlays on top of it.
+        The canvas shows them with the full draw.
+        """
+        if self.__is_static:
+            # The artists were drawn already and are part of the region
+            return
+
+        self.__snapshots = [self.__canvas.copy_from_bbox(self.__bbox)]
+        self.__snapshots.extend(None for _ in self.__layers)
+
+        self.__draw_layers(0)
+        self.__draw_overlays()
+
+    def __draw_layers(self, index: int) -> None:
+        """
+        Draw the layers from an index on top of the nearest copy below it and keep the copies
+        of the topmost layers.
+
+        Args:
+            index (int): The index of the lowest layer to draw.
+        """
+        start: int = next(
+            position
+            for position in range(index, -1, -1)
+            if self.__snapshots[position] is not None
+        )
+        self.__canvas.restore_region(self.__snapshots[start])
+
+        # The background and the copies of the topmost layers are kept
+        oldest_snapshot: int = len(self.__layers) - self.__max_snapshots
+        for position in range(start, len(self.__layers)):
+            self.__canvas.figure.draw_artist(self.__layers[position])
+            self.__snapshots[position + 1] = (
+                self.__canvas.copy_from_bbox(self.__bbox)
+                if position + 1 >= oldest_snapshot
+                else None
+            )
+
+        for position in range(1, max(oldest_snapshot, 1)):
+            self.__snapshots[position] = None
+
+    def __draw_overlays(self) -> None:
+        """
+        Draw the overlays on top of the layers.
+        """
+        for artist in self.__overlays:
+            self.__canvas.figure.draw_artist(artist)
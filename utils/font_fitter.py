@@ -0,0 +1,163 @@
+""" Defines the FontFitter class which fits the font size of widgets to their width,
+    sharing the font objects and resolving all pending widgets in one scheduled callback. """
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Literal
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=4096)
+def get_fitted_font_size(
+    text_length: int, width: int, max_size: int, min_size: int
+) -> int:
+    """
+    Get the font size for a text to fit into a width.
+
+    Args:
+        text_length (int): The number of characters of the text.
+        width (int): The width of the widget in pixels.
+        max_size (int): The font size if the text fits.
+        min_size (int): The smallest font size.
+
+    Returns:
+        int: The fitted font size.
+    """
+    if text_length == 0:
+        return max_size
+
+    return max(min_size, min(int((width / text_length) * 1.5), max_size))
+
+
+class FontFitter:
+    """
+    Class for fitting the font size of widgets to their width.
+
+    The fonts are kept in a least recently used cache per (family, size, weight), so widgets with
+    the same fitted size share a single `CTkFont`. Fitting is requested per widget and done for all
+    requested widgets in one callback, once their width is known after the layout.
+    """
+
+    __slots__ = (
+        "__fonts",
+        "__max_fonts",
+        "__pending_widgets",
+        "__delay",
+        "__batch_depth",
+        "__after_id",
+    )
+
+    def __init__(self, max_fonts: int = 64, delay: int = 35) -> None:
+        """
+        Initializes the FontFitter.
+
+        Args:
+            max_fonts (int, optional): The maximum number of cached fonts. Defaults to 64.
+            delay (int, optional): The delay in milliseconds before the widgets are fitted. Defaults to 35.
+        """
+        self.__fonts: OrderedDict[tuple[str, int, str], ctk.CTkFont] = OrderedDict()
+        self.__max_fonts: int = max_fonts
+        # The widgets to fit with their maximum and minimum font size
+        self.__pending_widgets: dict[Any, tuple[int, int]] = {}
+        self.__delay: int = delay
+        self.__batch_depth: int = 0
+        self.__after_id: str | None = None
+
+    def get_font(
+        self, family: str, size: int, weight: Literal["normal", "bold"] = "normal"
+    ) -> ctk.CTkFont:
+        """
+        Get a shared font, which is created on its first use.
+
+        Args:
+            family (str): The font family.
+            size (int): The font size.
+            weight (Literal["normal", "bold"], optional): The font weight. Defaults to "normal".
+
+        Returns:
+            ctk.CTkFont: The font.
+        """
+        key: tuple[str, int, str] = (family, size, weight)
+        font: ctk.CTkFont | None = self.__fonts.get(key)
+
+        if font is None:
+            font = ctk.CTkFont(family=family, size=size, weight=weight)
+            self.__fonts[key] = font
+            # Widgets using an evicted font keep it, it is only not shared anymore
+            if len(self.__fonts) > self.__max_fonts:
+                self.__fonts.popitem(last=False)
+        else:
+            self.__fonts.move_to_end(key)
+
+        return font
+
+    def request_fit(self, widget: Any, max_size: int, min_size: int) -> None:
+        """
+        Fit the font size of a widget to its width and text with the next callback.
+
+        Args:
+            widget (Any): The widget with a text and a `CTkFont`.
+            max_size (int): The font size if the text fits.
+            min_size (int): The smallest font size.
+        """
+        self.__pending_widgets[widget] = (max_size, min_size)
+
+        if self.__batch_depth == 0:
+            self.__schedule(widget)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Schedule the fitting of the widgets requested within this context not before its end.
+
+        Yields:
+            Iterator[None]: The context of the batch.
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__pending_widgets:
+                self.__schedule(next(iter(self.__pending_widgets)))
+
+    def fit_pending_widgets(self) -> None:
+        """
+        Fit the font size of all requested widgets.
+        """
+        self.__after_id = None
+        pending_widgets: dict[Any, tuple[int, int]] = self.__pending_widgets
+        self.__pending_widgets = {}
+
+        for widget, (max_size, min_size) in pending_widgets.items():
+            if not widget.winfo_exists():
+                continue
+
+            current_font: ctk.CTkFont | tuple = widget.cget("font")
+            if not isinstance(current_font, ctk.CTkFont):
+                continue
+
+            font_size: int = get_fitted_font_size(
+                len(widget.cget("text")), widget.winfo_width(), max_size, min_size
+            )
+            font: ctk.CTkFont = self.get_font(
+                current_font.cget("family"), font_size, current_font.cget("weight")
+            )
+
+            if font is not current_font:
+                widget.configure(font=font)
+
+    def __schedule(self, widget: Any) -> None:
+        """
+        Schedule the fitting of the requested widgets, unless it is scheduled already.
+
+        Args:
+            widget (Any): A widget to schedule the callback with.
+        """
+        if self.__after_id is None:
+            self.__after_id = widget.after(self.__delay, self.fit_pending_widgets)
+
+
+font_fitter = FontFitter()
@@ -0,0 +1,38 @@
+""" Defines functions to load the images of the widgets once and share them between the widgets. """
+
+from functools import lru_cache
+from PIL import Image
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=None)
+def load_image(path: str) -> Image.Image:
+    """
+    Decode an image file on its first use.
+
+    Args:
+        path (str): The image file path.
+
+    Returns:
+        Image.Image: The decoded image.
+    """
+    with Image.open(path) as image:
+        image.load()
+
+    return image
+
+
+@lru_cache(maxsize=None)
+def get_image(path: str, size: tuple[int, int]) -> ctk.CTkImage:
+    """
+    Get the image of a widget, which is created on its first use and shared by all widgets
+    showing the same image file in the same size.
+
+    Args:
+        path (str): The image file path.
+        size (tuple[int, int]): The width and height of the image.
+
+    Returns:
+        ctk.CTkImage: The image.
+    """
+    return ctk.CTkImage(light_image=load_image(path), size=tuple(size))
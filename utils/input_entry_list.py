@@ -78,8 +78,7 @@ class InputEntryList(ctk.CTkEntry):
         """
         if self.cget("state") == "normal" or self.cget("state") == "readonly":
             self.configure(state="readonly")
-            file_dict = self.file_manager.open_file()
-            newest_files = list(file_dict.values())[-self.max_elements :]
+            newest_files = self.file_manager.get_file_paths()[-self.max_elements :]
 
             nr_files = (
                 self.max_elements
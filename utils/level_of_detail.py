@@ -0,0 +1,478 @@
+""" Defines the functions and the MinMaxPyramid and DecimatedSignal classes which reduce a signal
+    to the points visible at the resolution of the plot canvas, by keeping the minimum and maximum per pixel. """
+
+import numpy as np
+
+
+def get_visible_slice(x: np.ndarray, x_min: float, x_max: float) -> slice:
+    """
+    Get the slice of the samples within an x-range, including the neighboring sample on both sides,
+    so a line continues to the edges of the plot.
+
+    Args:
+        x (np.ndarray): The ascending x values of the samples.
+        x_min (float): The lower limit of the x-range.
+        x_max (float): The upper limit of the x-range.
+
+    Returns:
+        slice: The slice of the samples.
+    """
+    start: int = int(np.searchsorted(x, x_min, side="left"))
+    stop: int = int(np.searchsorted(x, x_max, side="right"))
+
+    return slice(max(start - 1, 0), min(stop + 1, len(x)))
+
+
+def get_visible_sample_slice(nr_of_samples: int, x_min: float, x_max: float) -> slice:
+    """
+    Get the slice of the samples within an x-range of sample numbers, see `get_visible_slice`.
+    The sample numbers are not created, so the slice does not depend on the number of samples.
+
+    Args:
+        nr_of_samples (int): The number of samples.
+        x_min (float): The lower limit of the x-range.
+        x_max (float): The upper limit of the x-range.
+
+    Returns:
+        slice: The slice of the samples.
+    """
+    start: int = int(np.clip(np.ceil(x_min), 0, nr_of_samples))
+    stop: int = int(np.clip(np.floor(x_max) + 1, 0, nr_of_samples))
+
+    return slice(max(start - 1, 0), min(stop + 1, nr_of_samples))
+
+
+def get_minmax_indices(y: np.ndarray, nr_of_bins: int) -> np.ndarray:
+    """
+    Get the indices of the minimum and the maximum of each bin, in the order of their occurrence.
+
+    The samples are split into bins of the same number of samples, so for evenly sampled signals
+    each bin corresponds to a pixel column of the plot. A bin containing NaN values keeps a NaN
+    value, so gaps of the signal stay visible.
+
+    Args:
+        y (np.ndarray): The values of the samples.
+        nr_of_bins (int): The maximum number of bins, e.g. the width of the plot in pixels.
+
+    Returns:
+        np.ndarray: The indices of at most two samples per bin, all indices if there are not more samples.
+    """
+    nr_of_samples: int = len(y)
+    if nr_of_samples <= 2 * nr_of_bins:
+        return np.arange(nr_of_samples)
+
+    bin_size: int = -(-nr_of_samples // nr_of_bins)
+    nr_of_full_bins: int = nr_of_samples // bin_size
+
+    full_bins: np.ndarray = y[: nr_of_full_bins * bin_size].reshape(
+        nr_of_full_bins, bin_size
+    )
+    min_indices: np.ndarray = full_bins.argmin(axis=1)
+    max_indices: np.ndarray = full_bins.argmax(axis=1)
+
+    # The last samples, which do not fill a bin, are a bin of their own
+    if nr_of_full_bins * bin_size < nr_of_samples:
+        last_bin: np.ndarray = y[nr_of_full_bins * bin_size :]
+        min_indices = np.append(min_indices, last_bin.argmin())
+        max_indices = np.append(max_indices, last_bin.argmax())
+
+    offsets: np.ndarray = np.arange(len(min_indices)) * bin_size
+
+    return interleave(min_indices + offsets, max_indices + offsets)
+
+
+def interleave(min_indices: np.ndarray, max_indices: np.ndarray) -> np.ndarray:
+    """
+    Merge the indices of the minimum and the maximum of each bin, in the order of their occurrence.
+
+    Args:
+        min_indices (np.ndarray): The index of the minimum of each bin.
+        max_indices (np.ndarray): The index of the maximum of each bin.
+
+    Returns:
+        np.ndarray: The two indices of each bin, bin by bin.
+    """
+    return np.column_stack(
+        (np.minimum(min_indices, max_indices), np.maximum(min_indices, max_indices))
+    ).ravel()
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, nr_of_bins: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a signal to the minimum and the maximum of each bin, see `get_minmax_indices`.
+    A line through the remaining points covers the same pixels as one through all samples.
+
+    Args:
+        x (np.ndarray): The x values of the samples.
+        y (np.ndarray): The y values of the samples.
+        nr_of_bins (int): The maximum number of bins, e.g. the width of the plot in pixels.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The x and y values of at most two points per bin.
+    """
+    if len(y) <= 2 * nr_of_bins:
+        return x, y
+
+    indices: np.ndarray = get_minmax_indices(y, nr_of_bins)
+
+    return x[indices], y[indices]
+
+
+def get_stem_points(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the points of a single line drawing a stem from the baseline 0 to every point,
+    the stems are separated by NaN values.
+
+    Args:
+        x (np.ndarray): The x values of the points.
+        y (np.ndarray): The y values of the points.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The x and y values of the baseline point, the point
+                                        and the separator of each stem.
+    """
+    stem_x: np.ndarray = np.full((len(x), 3), np.nan)
+    stem_y: np.ndarray = np.full((len(y), 3), np.nan)
+    stem_x[:, 0] = stem_x[:, 1] = x
+    stem_y[:, 0] = 0.0
+    stem_y[:, 1] = y
+
+    return stem_x.ravel(), stem_y.ravel()
+
+
+class MinMaxPyramid:
+    """
+    Class for the minima and maxima of a signal at several resolutions.
+
+    Level k holds the indices of the minimum and the maximum of every block of 2^k samples,
+    for k from `BASE_LEVEL` up to the level with a single block. Every level is built from the
+    level below, so the signal is read once, and all levels together hold an eighth as many
+    indices as there are samples.
+
+    The extrema of any range of samples are found in O(log n) blocks, so a range is decimated
+    to the resolution of the plot in O(pixels + log n), independently of the number of samples.
+    """
+
+    # The smallest block has 32 samples, smaller blocks are decimated from the samples
+    BASE_LEVEL: int = 5
+
+    __slots__ = "__indices", "__nr_of_samples"
+
+    def __init__(self, indices: np.ndarray, nr_of_samples: int) -> None:
+        """
+        Initializes the MinMaxPyramid.
+
+        Args:
+            indices (np.ndarray): The indices of the minima and the maxima of all levels,
+                                    as built by `build`, e.g. memory-mapped from the cache.
+            nr_of_samples (int): The number of samples of the signal.
+        """
+        self.__indices: np.ndarray = indices
+        self.__nr_of_samples: int = nr_of_samples
+
+    @classmethod
+    def build(cls, y: np.ndarray) -> "MinMaxPyramid":
+        """
+        Build the pyramid of a signal.
+
+        Args:
+            y (np.ndarray): The values of the samples.
+
+        Returns:
+            MinMaxPyramid: The pyramid of the signal.
+        """
+        block_size: int = 1 << cls.BASE_LEVEL
+        nr_of_blocks: int = len(y) // block_size
+
+        blocks: np.ndarray = y[: nr_of_blocks * block_size].reshape(
+            nr_of_blocks, block_size
+        )
+        offsets: np.ndarray = np.arange(nr_of_blocks) * block_size
+        min_indices: np.ndarray = blocks.argmin(axis=1) + offsets
+        max_indices: np.ndarray = blocks.argmax(axis=1) + offsets
+        min_values: np.ndarray = y[min_indices]
+        max_values: np.ndarray = y[max_indices]
+
+        levels: list[tuple[np.ndarray, np.ndarray]] = []
+        while len(min_indices):
+            levels.append((min_indices, max_indices))
+
+            # Every block of the next level joins two blocks, a NaN value is kept like by argmin
+            nr_of_pairs: int = len(min_indices) // 2
+            take_second_min: np.ndarray = (
+                min_values[1 : 2 * nr_of_pairs : 2]
+                < min_values[0 : 2 * nr_of_pairs : 2]
+            )
+            take_second_max: np.ndarray = (
+                max_values[1 : 2 * nr_of_pairs : 2]
+                > max_values[0 : 2 * nr_of_pairs : 2]
+            )
+            if y.dtype.kind == "f":
+                take_second_min |= np.isnan(min_values[1 : 2 * nr_of_pairs : 2])
+                take_second_max |= np.isnan(max_values[1 : 2 * nr_of_pairs : 2])
+
+            pair_offsets: np.ndarray = np.arange(nr_of_pairs) * 2
+            min_positions: np.ndarray = pair_offsets + take_second_min
+            max_positions: np.ndarray = pair_offsets + take_second_max
+            min_indices, min_values = (
+                min_indices[min_positions],
+                min_values[min_positions],
+            )
+            max_indices, max_values = (
+                max_indices[max_positions],
+                max_values[max_positions],
+            )
+
+        index_dtype: type = np.int32 if len(y) < 2**31 else np.int64
+        indices: np.ndarray = np.zeros((2, 0), dtype=index_dtype)
+        if levels:
+            indices = np.stack(
+                (
+                    np.concatenate([level[0] for level in levels]),
+                    np.concatenate([level[1] for level in levels]),
+                )
+            ).astype(index_dtype)
+
+        return cls(indices, len(y))
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        Get the indices of the minima and the maxima of all levels, e.g. to store them.
+
+        Returns:
+            np.ndarray: The indices of the minima in the first row and of the maxima in the second row,
+                        level by level from the lowest level.
+        """
+        return self.__indices
+
+    @property
+    def top_level(self) -> int:
+        """
+        Get the highest level.
+
+        Returns:
+            int: The highest level, which has a single block, or `BASE_LEVEL` - 1 without any level.
+        """
+        return max(self.__nr_of_samples.bit_length() - 1, self.BASE_LEVEL - 1)
+
+    def get_level(self, level: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the indices of the minimum and the maximum of every block of a level.
+
+        Args:
+            level (int): The level, from `BASE_LEVEL` to `top_level`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The indices of the minima and of the maxima.
+        """
+        offset: int = sum(
+            self.__nr_of_samples >> lower_level
+            for lower_level in range(self.BASE_LEVEL, level)
+        )
+        nr_of_blocks: int = self.__nr_of_samples >> level
+
+        return (
+            self.__indices[0, offset : offset + nr_of_blocks],
+            self.__indices[1, offset : offset + nr_of_blocks],
+        )
+
+    def get_indices(
+        self, y: np.ndarray, start: int, stop: int, nr_of_bins: int
+    ) -> np.ndarray:
+        """
+        Get the indices of the minimum and the maximum of each bin of a range of samples,
+        in the order of their occurrence.
+
+        The bins are the blocks of the lowest level with at least as many samples per block
+        as samples per bin. The samples before the first and after the last whole block
+        are a bin each.
+
+        Args:
+            y (np.ndarray): The values of the samples.
+            start (int): The index of the first sample of the range.
+            stop (int): The index after the last sample of the range.
+            nr_of_bins (int): The maximum number of bins, e.g. the width of the plot in pixels.
+
+        Returns:
+            np.ndarray: The indices of at most two samples per bin.
+        """
+        start, stop = int(start), int(stop)
+        samples_per_bin: int = -(-(stop - start) // max(nr_of_bins, 1))
+        level: int = min((samples_per_bin - 1).bit_length(), self.top_level)
+
+        block_size: int = 1 << level
+        first_block: int = -(-start // block_size)
+        last_block: int = stop // block_size
+
+        if level < self.BASE_LEVEL or first_block >= last_block:
+            return start + get_minmax_indices(y[start:stop], nr_of_bins)
+
+        min_indices, max_indices = self.get_level(level)
+        indices: list[np.ndarray] = [
+            interleave(
+                min_indices[first_block:last_block], max_indices[first_block:last_block]
+            )
+        ]
+
+        if start < first_block * block_size:
+            indices.insert(0, self.get_extrema(y, start, first_block * block_size))
+        if last_block * block_size < stop:
+            indices.append(self.get_extrema(y, last_block * block_size, stop))
+
+        return np.concatenate(indices)
+
+    def get_extrema(self, y: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """
+        Get the indices of the minimum and the maximum of a range of samples, in the order of their
+        occurrence. The range is covered by the largest blocks fitting into it, only the samples
+        outside of the blocks of the lowest level are read.
+
+        Args:
+            y (np.ndarray): The values of the samples.
+            start (int): The index of the first sample of the range.
+            stop (int): The index after the last sample of the range.
+
+        Returns:
+            np.ndarray: The indices of the minimum and the maximum.
+        """
+        candidates: list[int] = []
+        position: int = int(start)
+        stop = int(stop)
+
+        while position < stop:
+            level: int = min(
+                (position & -position).bit_length() - 1 if position else self.top_level,
+                (stop - position).bit_length() - 1,
+                self.top_level,
+            )
+
+            if level < self.BASE_LEVEL:
+                # The samples up to the next block of the lowest level
+                block_end: int = min(
+                    ((position >> self.BASE_LEVEL) + 1) << self.BASE_LEVEL, stop
+                )
+                candidates.extend(
+                    (position + get_minmax_indices(y[position:block_end], 1)).tolist()
+                )
+                position = block_end
+            else:
+                min_indices, max_indices = self.get_level(level)
+                candidates.extend(
+                    (
+                        int(min_indices[position >> level]),
+                        int(max_indices[position >> level]),
+                    )
+                )
+                position += 1 << level
+
+        candidate_indices: np.ndarray = np.array(candidates)
+        candidate_values: np.ndarray = y[candidate_indices]
+
+        return interleave(
+            candidate_indices[[candidate_values.argmin()]],
+            candidate_indices[[candidate_values.argmax()]],
+        )
+
+
+class DecimatedSignal:
+    """
+    Class for getting the points of a signal to plot at the resolution of the plot canvas.
+
+    The full resolution values are kept, e.g. memory-mapped columns, and every x-range is decimated
+    from them again, so zooming in reveals the details hidden at a lower resolution. With a pyramid
+    of the values, an x-range is decimated from the pyramid instead of reading all of its samples.
+    Without x values, the sample numbers of the visible points are calculated from their indices.
+    """
+
+    __slots__ = "__x", "__y", "__pyramid"
+
+    def __init__(
+        self,
+        x: np.ndarray | None,
+        y: np.ndarray,
+        pyramid: MinMaxPyramid | None = None,
+    ) -> None:
+        """
+        Initializes the DecimatedSignal.
+
+        Args:
+            x (np.ndarray | None): The x values of the samples. Without numeric, ascending x values
+                                    the sample numbers are used instead. Datetimes are used
+                                    as integers in their unit since the epoch.
+            y (np.ndarray): The y values of the samples.
+            pyramid (MinMaxPyramid | None, optional): The pyramid of the y values. Defaults to None.
+        """
+        if x is not None and np.issubdtype(x.dtype, np.datetime64):
+            x = x.view(np.int64)
+
+        if x is not None and (
+            len(x) != len(y)
+            or not np.issubdtype(x.dtype, np.number)
+            or (len(x) > 1 and (x[1:] < x[:-1]).any())
+        ):
+            x = None
+
+        self.__x: np.ndarray | None = x
+        self.__y: np.ndarray = y
+        self.__pyramid: MinMaxPyramid | None = pyramid
+
+    def __len__(self) -> int:
+        return len(self.__y)
+
+    @property
+    def x_range(self) -> tuple[float, float]:
+        """
+        Get the x-range of the signal.
+
+        Returns:
+            tuple[float, float]: The first and the last x value.
+        """
+        if len(self.__y) == 0:
+            return 0.0, 0.0
+        if self.__x is None:
+            return 0, len(self.__y) - 1
+
+        return self.__x[0], self.__x[-1]
+
+    def get_points(
+        self, x_min: float, x_max: float, nr_of_bins: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the points of the signal within an x-range, see `get_minmax_indices`
+        and `MinMaxPyramid.get_indices`.
+
+        Args:
+            x_min (float): The lower limit of the x-range.
+            x_max (float): The upper limit of the x-range.
+            nr_of_bins (int): The maximum number of bins, e.g. the width of the plot in pixels.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The x and y values of at most two points per bin.
+        """
+        if self.__x is None:
+            visible_slice: slice = get_visible_sample_slice(len(self.__y), x_min, x_max)
+        else:
+            visible_slice = get_visible_slice(self.__x, x_min, x_max)
+
+        if self.__pyramid is None:
+            if self.__x is not None:
+                return minmax_decimate(
+                    self.__x[visible_slice], self.__y[visible_slice], nr_of_bins
+                )
+
+            indices: np.ndarray = visible_slice.start + get_minmax_indices(
+                self.__y[visible_slice], nr_of_bins
+            )
+        else:
+            indices = self.__pyramid.get_indices(
+                self.__y, visible_slice.start, visible_slice.stop, nr_of_bins
+            )
+
+        # The indices are the sample numbers
+        if self.__x is None:
+            return indices, self.__y[indices]
+
+        return self.__x[indices], self.__y[indices]
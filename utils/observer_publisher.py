@@ -1,7 +1,11 @@
 """Defines all subscriptable publisher classes and the observer interface."""
 
 from __future__ import annotations
+import copy
+import threading
+import tkinter as tk
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Literal
 
 
@@ -15,6 +19,27 @@ class SimplePublisher:
         Create an empty observer list.
         """
         self._observers: list[SimpleObserver] = []
+        # The publisher itself, shared with its snapshots
+        self._origin: SimplePublisher = self
+
+    def __eq__(self, other: object) -> bool:
+        """
+        A snapshot of a publisher is equal to the publisher.
+        """
+        return isinstance(other, SimplePublisher) and self._origin is other._origin
+
+    def __hash__(self) -> int:
+        return id(self._origin)
+
+    def snapshot(self) -> SimplePublisher:
+        """
+        Copy the current state of the publisher, which is equal to the publisher and
+        shares its observers.
+
+        Returns:
+            SimplePublisher: The snapshot of the publisher.
+        """
+        return copy.copy(self)
 
     def attach(self, observer: SimpleObserver) -> None:
         """
@@ -36,14 +61,33 @@ class SimplePublisher:
         if observer in self._observers:
             self._observers.remove(observer)
 
-    def notify(self, modifier: SimpleObserver | None = None) -> None:
+    def notify(
+        self, modifier: SimpleObserver | None = None, coalesce: bool = False
+    ) -> None:
         """
         Notify all registered observers, except the one that might have triggered the update.
 
+        Notifications from other threads than the Tk main thread are delivered on the main loop
+        with a snapshot of the current state, see `NotificationDispatcher`.
+
         Args:
             modifier (SimpleObserver | None, optional): Observer that triggered the update. Defaults to None.
+            coalesce (bool, optional): Indicator if the notification may be replaced by a following one
+                                        before it got delivered. Defaults to False.
+        """
+        if notification_dispatcher.is_immediate():
+            self.deliver(modifier)
+        else:
+            notification_dispatcher.post(self.snapshot(), modifier, coalesce)
+
+    def deliver(self, modifier: SimpleObserver | None = None) -> None:
         """
-        for observer in self._observers:
+        Call all registered observers in the current thread, except the one that might have triggered the update.
+
+        Args:
+            modifier (SimpleObserver | None, optional): Observer that triggered the update. Defaults to None.
+        """
+        for observer in list(self._observers):
             if observer != modifier:
                 observer.update(self)
 
@@ -63,6 +107,140 @@ class SimpleObserver(ABC):
         """
 
 
+class NotificationDispatcher:
+    """
+    Delivers the notifications of the publishers from other threads on the Tk main loop.
+
+    The notifications are queued and delivered once per frame by a callback scheduled with `after`,
+    which is only scheduled when a notification is queued, so an idle main loop is not woken up.
+    A coalescing notification replaces the previous one in the queue, if it is a coalescing
+    notification of the same publisher, so a burst of e.g. progress updates reaches the observers
+    at most once per frame. Until a Tk root is bound, all notifications are delivered immediately.
+    """
+
+    FRAME_INTERVAL: int = 16  # In milliseconds, about 60 Hz
+
+    __slots__ = (
+        "__root",
+        "__main_thread",
+        "__notifications",
+        "__lock",
+        "__is_frame_scheduled",
+    )
+
+    def __init__(self) -> None:
+        self.__root: tk.Misc | None = None
+        self.__main_thread: threading.Thread = threading.main_thread()
+        # The pending notifications as (snapshot of the publisher, modifier, coalesce)
+        self.__notifications: deque[
+            tuple[SimplePublisher, SimpleObserver | None, bool]
+        ] = deque()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__is_frame_scheduled: bool = False
+
+    def bind(self, root: tk.Misc) -> None:
+        """
+        Deliver the notifications on the main loop of a Tk root. Must be called from the main thread.
+
+        Args:
+            root (tk.Misc): The Tk root.
+        """
+        self.__root = root
+        self.__main_thread = threading.current_thread()
+        with self.__lock:
+            self.__is_frame_scheduled = False
+
+    def unbind(self) -> None:
+        """
+        Deliver the pending notifications and all following ones immediately.
+        """
+        self.__root = None
+        self.flush()
+
+    def is_immediate(self) -> bool:
+        """
+        Check if a notification of the current thread is delivered immediately.
+
+        Returns:
+            bool: True if no Tk root is bound or the current thread is the main thread, False otherwise.
+        """
+        return (
+            self.__root is None or threading.current_thread() is self.__main_thread
+        )
+
+    def post(
+        self,
+        snapshot: SimplePublisher,
+        modifier: SimpleObserver | None = None,
+        coalesce: bool = False,
+    ) -> None:
+        """
+        Queue a notification. Can be called from any thread.
+
+        Args:
+            snapshot (SimplePublisher): The snapshot of the publisher to deliver.
+            modifier (SimpleObserver | None, optional): Observer that triggered the update. Defaults to None.
+            coalesce (bool, optional): Indicator if the notification may be replaced by a following one.
+                                        Defaults to False.
+        """
+        with self.__lock:
+            if coalesce and self.__notifications:
+                last_snapshot, last_modifier, last_coalesce = self.__notifications[-1]
+                if last_coalesce and last_snapshot == snapshot and last_modifier is modifier:
+                    self.__notifications[-1] = (snapshot, modifier, coalesce)
+                    return
+
+            self.__notifications.append((snapshot, modifier, coalesce))
+            # The first notification of a frame schedules its delivery
+            schedule_frame: bool = not self.__is_frame_scheduled
+            self.__is_frame_scheduled = True
+
+        if schedule_frame:
+            self.__schedule_frame()
+
+    def flush(self) -> None:
+        """
+        Deliver all pending notifications in the current thread.
+        """
+        with self.__lock:
+            notifications = list(self.__notifications)
+            self.__notifications.clear()
+
+        for snapshot, modifier, _ in notifications:
+            snapshot.deliver(modifier)
+
+    def __schedule_frame(self) -> None:
+        """
+        Schedule the delivery of the queued notifications on the main loop.
+        """
+        root: tk.Misc | None = self.__root
+        if root is None:
+            self.flush()
+            return
+
+        try:
+            root.after(self.FRAME_INTERVAL, self.__deliver_frame)
+        except (tk.TclError, RuntimeError) as exc:
+            # The root got destroyed or its main loop is not running yet,
+            # the next notification schedules the frame again
+            with self.__lock:
+                self.__is_frame_scheduled = False
+            if isinstance(exc, tk.TclError):
+                self.__root = None
+
+    def __deliver_frame(self) -> None:
+        """
+        Deliver the notifications of a frame, the next notification schedules the next frame.
+        """
+        with self.__lock:
+            self.__is_frame_scheduled = False
+
+        self.flush()
+
+
+notification_dispatcher = NotificationDispatcher()
+
+
 class SidebarStatePublisher(SimplePublisher):
     """
     Monitor the visibility of the sidebar.
@@ -155,7 +333,15 @@ class ProgressStatePublisher(SimplePublisher):
             modifier (SimpleObserver | None, optional): Observer that triggered the update. Defaults to None.
         """
         self._value = value
-        self.notify(modifier)
+        # Only the values between the start and the stop of the progressbar can be skipped
+        self.notify(
+            modifier,
+            coalesce=value
+            not in (
+                ProgressStatePublisher.START_PROGRESSBAR,
+                ProgressStatePublisher.STOP_PROGRESSBAR,
+            ),
+        )
 
 
 progress_state_publisher = ProgressStatePublisher()
@@ -166,12 +352,13 @@ class FileStatePublisher(SimplePublisher):
     Monitor the file size.
     """
 
-    __slots__ = ("_file_size", "_is_open")
+    __slots__ = ("_file_size", "_memory_saved", "_is_open")
 
     def __init__(self) -> None:
         SimplePublisher.__init__(self)
 
         self._file_size: str
+        self._memory_saved: str = ""
         self._is_open: bool = False
 
     @property
@@ -194,6 +381,26 @@ class FileStatePublisher(SimplePublisher):
         """
         self._file_size = file_size
 
+    @property
+    def memory_saved(self) -> str:
+        """
+        Get the memory saved by shrinking the dtypes of the file data.
+
+        Returns:
+            str: The saved memory, empty if the dtypes are not shrunk.
+        """
+        return self._memory_saved
+
+    @memory_saved.setter
+    def memory_saved(self, memory_saved: str) -> None:
+        """
+        Set the memory saved by shrinking the dtypes of the file data.
+
+        Args:
+            memory_saved (str): The saved memory to set, empty if the dtypes are not shrunk.
+        """
+        self._memory_saved = memory_saved
+
     @property
     def is_open(self) -> bool:
         """
@@ -224,6 +431,85 @@ class FileStatePublisher(SimplePublisher):
 file_state_publisher = FileStatePublisher()
 
 
+class HeaderStatePublisher(SimplePublisher):
+    """
+    Monitor the classification of the headers.
+    """
+
+    __slots__ = ("_is_classified",)
+
+    def __init__(self) -> None:
+        SimplePublisher.__init__(self)
+
+        self._is_classified: bool = False
+
+    @property
+    def is_classified(self) -> bool:
+        """
+        Get the classification status of the headers.
+
+        Returns:
+            bool: The classification status of the headers.
+        """
+        return self._is_classified
+
+    def set_is_classified(
+        self, is_classified: bool, modifier: SimpleObserver | None = None
+    ) -> None:
+        """
+        Set the classification status of the headers.
+
+        Args:
+            is_classified (bool): The classification status to set.
+            modifier (SimpleObserver | None, optional): Observer that triggered the update. Defaults to None.
+        """
+        self._is_classified = is_classified
+        self.notify(modifier)
+
+
+header_state_publisher = HeaderStatePublisher()
+
+
+class HeaderSelectionPublisher(SimplePublisher):
+    """
+    Monitor the selection of the headers to plot.
+    """
+
+    __slots__ = ("_selected_columns",)
+
+    def __init__(self) -> None:
+        SimplePublisher.__init__(self)
+
+        self._selected_columns: tuple[str, ...] = ()
+
+    @property
+    def selected_columns(self) -> tuple[str, ...]:
+        """
+        Get the columns of the selected headers.
+
+        Returns:
+            tuple[str, ...]: The columns of the selected headers in the order of the header list.
+        """
+        return self._selected_columns
+
+    def set_selected_columns(
+        self, selected_columns: tuple[str, ...], modifier: SimpleObserver | None = None
+    ) -> None:
+        """
+        Set the columns of the selected headers, the observers are only notified about a changed selection.
+
+        Args:
+            selected_columns (tuple[str, ...]): The columns of the selected headers.
+            modifier (SimpleObserver | None, optional): Observer that triggered the update. Defaults to None.
+        """
+        if selected_columns != self._selected_columns:
+            self._selected_columns = selected_columns
+            self.notify(modifier)
+
+
+header_selection_publisher = HeaderSelectionPublisher()
+
+
 class NewSettingsPublisher(SimplePublisher):
     """
     Monitor if new settings were saved.
@@ -0,0 +1,90 @@
+""" Defines the RedrawScheduler class which coalesces the redraw requests of a canvas
+    on the Tk main loop, so a burst of requests costs a single render. """
+
+import tkinter as tk
+from collections.abc import Callable
+from utils.observer_publisher import NotificationDispatcher
+
+
+class RedrawScheduler:
+    """
+    Class for scheduling the redraws of a canvas on the Tk main loop.
+
+    The first request of a frame schedules the render with `after`. The tasks of the following
+    requests are collected until then and run once each before the render, in the order of their
+    last request, so e.g. 50 toggled headers update the traces once and render once, and a storm
+    of resize events resizes the figure at most once per frame.
+    """
+
+    FRAME_INTERVAL: int = NotificationDispatcher.FRAME_INTERVAL
+
+    __slots__ = "__widget", "__render", "__interval", "__tasks", "__is_scheduled"
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        render: Callable[[], None],
+        interval: int = FRAME_INTERVAL,
+    ) -> None:
+        """
+        Initializes the RedrawScheduler.
+
+        Args:
+            widget (tk.Misc): The widget whose main loop runs the render.
+            render (Callable[[], None]): The function rendering the canvas, e.g. calling `draw_idle`.
+            interval (int, optional): The time in milliseconds requests are collected before the render.
+                                        Defaults to FRAME_INTERVAL.
+        """
+        self.__widget: tk.Misc = widget
+        self.__render: Callable[[], None] = render
+        self.__interval: int = interval
+
+        # A dict as an ordered set of the pending tasks
+        self.__tasks: dict[Callable[[], None], None] = {}
+        self.__is_scheduled: bool = False
+
+    @property
+    def is_scheduled(self) -> bool:
+        """
+        Get the indicator if a render is pending.
+
+        Returns:
+            bool: True if a render is pending, False otherwise.
+        """
+        return self.__is_scheduled
+
+    def request(self, *tasks: Callable[[], None]) -> None:
+        """
+        Request a render and the tasks to run before it. A task requested again
+        while it is pending runs once, after the tasks requested in between.
+
+        Args:
+            *tasks (Callable[[], None]): The tasks, e.g. updating the artists of the canvas.
+        """
+        for task in tasks:
+            self.__tasks.pop(task, None)
+            self.__tasks[task] = None
+
+        if self.__is_scheduled:
+            return
+
+        try:
+            self.__widget.after(self.__interval, self.flush)
+        except tk.TclError:  # The widget got destroyed
+            self.__tasks.clear()
+            return
+
+        self.__is_scheduled = True
+
+    def flush(self) -> None:
+        """
+        Run the pending tasks and render the canvas.
+        """
+        tasks: list[Callable[[], None]] = list(self.__tasks)
+        self.__tasks.clear()
+        self.__is_scheduled = False
+
+        for task in tasks:
+            task()
+
+        self.__render()
@@ -1,11 +1,14 @@
 """ Defines a SelectButton class with a custom layout and functionalities.
     This button is similar to a normal button but stays selected or deselected. """
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from tkinter import Widget
 from typing import Any
-from PIL import Image
 import customtkinter as ctk
+from utils.font_fitter import font_fitter
 from utils.helper_functions import find_root
+from utils.image_cache import get_image
 
 
 class SelectButton(ctk.CTkButton):
@@ -38,6 +41,7 @@ class SelectButton(ctk.CTkButton):
         hover: bool = True,
         compound: str = "left",
         anchor: str = "w",
+        toggle_command: Callable[[bool], None] | None = None,
         **kwargs
     ) -> None:
         super().__init__(
@@ -59,13 +63,7 @@ class SelectButton(ctk.CTkButton):
             text=text,
             font=font,
             textvariable=textvariable,
-            image=ctk.CTkImage(
-                light_image=Image.open("resources/Images/minus.png"),
-                size=(
-                    15,
-                    15,
-                ),
-            ),
+            image=get_image("resources/Images/minus.png", (15, 15)),
             state="OFF",
             hover=hover,
             command=self._toggle_button,
@@ -80,52 +78,79 @@ class SelectButton(ctk.CTkButton):
         self.text: str = text
         self.font_size: int = font.cget("size")
         self.min_font_size: int = min_font_size
+        # Called with the new selection after the user toggled the button
+        self.toggle_command: Callable[[bool], None] | None = toggle_command
+
+    @property
+    def is_selected(self) -> bool:
+        """
+        Get the selection of this button.
+
+        Returns:
+            bool: True if the button is selected.
+        """
+        return self.cget("state") == "ON"
+
+    def set_selected(self, selected: bool) -> None:
+        """
+        Select or deselect this button without calling the toggle command,
+        e.g. when the button gets reused for another header.
+
+        Args:
+            selected (bool): True to select the button.
+        """
+        if selected != self.is_selected:
+            self._set_selection(selected)
 
     def _toggle_button(self) -> None:
         """
         Check the current state of this button and toggle it.
         """
-        if self.cget("state") == "OFF":
-            self.configure(
-                image=ctk.CTkImage(
-                    light_image=Image.open("resources/Images/plus.png"),
-                    size=(
-                        15,
-                        15,
-                    ),
-                )
-            )
+        self._set_selection(not self.is_selected)
+
+        if self.toggle_command is not None:
+            self.toggle_command(self.is_selected)
+
+    def _set_selection(self, selected: bool) -> None:
+        """
+        Change the image, color and state of this button to its selection.
+
+        Args:
+            selected (bool): True to select the button.
+        """
+        if selected:
+            self.configure(image=get_image("resources/Images/plus.png", (15, 15)))
             self.configure(fg_color=self.fg_color_off)
             self.configure(state="ON")
         else:
-            self.configure(
-                image=ctk.CTkImage(
-                    light_image=Image.open("resources/Images/minus.png"),
-                    size=(
-                        15,
-                        15,
-                    ),
-                )
-            )
+            self.configure(image=get_image("resources/Images/minus.png", (15, 15)))
             self.configure(fg_color=self.fg_color)
             self.configure(state="OFF")
 
     def _adjust_font_size(self) -> None:
         """
-        Trigger the event of toggling the sidebar.
+        Fit the font size to the width of this button and its text.
+        The fitting of all buttons whose text changed is done in one callback.
         """
-        button_width: int = self.winfo_width()
-        new_font_size: int = max(
-            self.min_font_size,
-            min(int((button_width / len(self.text)) * 1.5), self.font_size),
-        )
-        self.configure(font=ctk.CTkFont(size=new_font_size))
+        font_fitter.request_fit(self, self.font_size, self.min_font_size)
+
+    @staticmethod
+    @contextmanager
+    def batch_update() -> Iterator[None]:
+        """
+        Defer the font size adjustment of every button whose text changes within this context,
+        so it is done once for all of them after the end.
+
+        Yields:
+            Iterator[None]: The context of the batch update.
+        """
+        with font_fitter.batch():
+            yield
 
     def configure(self, require_redraw=False, **kwargs) -> None:
-        if "text" in kwargs:
+        if "text" in kwargs and kwargs["text"] != self.text:
             self.text = kwargs["text"]
-            self.update_idletasks()
-            self.root.after(35, self._adjust_font_size)
+            self._adjust_font_size()
         super().configure(require_redraw, **kwargs)
 
 
@@ -1,147 +1,301 @@
 """ Defines all thread classes. """
 
 from collections.abc import Callable
-from threading import Thread
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from threading import Event, Lock, Thread
 from typing import Any
+import logging
 import queue
 
+logger: logging.Logger = logging.getLogger(__name__)
 
-class SafeThread(Thread):
+
+class CancellationToken:
     """
-    This class allows safe multi-threading by running a function in a background thread,
-    while also executing functions before the thread starts and after it finishes.
-    It includes a mechanism to check if the thread is currently running.
+    A token to cancel a running task cooperatively. The task checks the token at points
+    where it can stop safely, e.g. between the chunks of a file.
     """
 
+    __slots__ = ("__event",)
+
+    def __init__(self) -> None:
+        self.__event: Event = Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Get the cancellation status.
+
+        Returns:
+            bool: True if the task should stop, False otherwise.
+        """
+        return self.__event.is_set()
+
+    def cancel(self) -> None:
+        """
+        Request the task to stop.
+        """
+        self.__event.set()
+
+
+class TaskType:
+    """
+    The lanes a task of the SafeThreadQueue can be dispatched to.
+
+    SERIAL: Run one after another by the worker thread, in the order the tasks got ready.
+    IO: Run concurrently in a thread pool, e.g. exporting a file while the next one is opened.
+    """
+
+    SERIAL: str = "serial"
+    IO: str = "io"
+
+
+class SafeTask:
+    """
+    A task of the SafeThreadQueue with the functions to execute before and after it.
+    """
+
+    __slots__ = (
+        "target",
+        "args",
+        "before_thread",
+        "after_thread",
+        "task_type",
+        "depends_on",
+        "cancellation_token",
+        "future",
+    )
+
     def __init__(
         self,
-        *thread_args: Any,
-        target: Callable[..., Any] | None = None,
+        target: Callable[..., Any],
         args: tuple[Any, ...] = (),
         before_thread: Callable[[], None] | None = None,
         after_thread: Callable[[], None] | None = None,
-        **thread_kwargs: Any
+        task_type: str = TaskType.SERIAL,
+        depends_on: tuple[Future, ...] = (),
+        cancellation_token: CancellationToken | None = None,
     ) -> None:
         """
-        Initializes the SafeThread object.
+        Initializes the SafeTask object.
 
         Args:
-            target (Callable[..., Any] | None, optional): The function to run in the thread. Defaults to None.
+            target (Callable[..., Any]): The function to be executed.
             args (tuple[Any, ...], optional): The arguments to pass to the target function. Defaults to ().
-            before_thread (Callable[[], None] | None, optional):  A function to execute before the thread starts. Defaults to None.
-            after_thread (Callable[[], None] | None, optional): A function to execute after the thread finishes. Defaults to None.
+            before_thread (Callable[[], None] | None, optional): A function to execute before the target. Defaults to None.
+            after_thread (Callable[[], None] | None, optional): A function to execute after the target. Defaults to None.
+            task_type (str, optional): The lane of the task, see `TaskType`. Defaults to TaskType.SERIAL.
+            depends_on (tuple[Future, ...], optional): The tasks to finish before this task starts. Defaults to ().
+            cancellation_token (CancellationToken | None, optional): The token to stop the task while it is running.
+                                                                    Defaults to None.
         """
-        super().__init__(*thread_args, **thread_kwargs)
-
-        self.daemon = True  # To automatically terminate thread when program exits
-
-        # The function to be run in the thread
-        self.target: Callable[..., Any] | None = target
-        # Arguments for the target function
+        self.target: Callable[..., Any] = target
         self.args: tuple[Any, ...] = args
-
-        # Function to execute before the thread starts
         self.before_thread: Callable[[], None] | None = before_thread
-
-        # Function to execute after the thread finishes
         self.after_thread: Callable[[], None] | None = after_thread
+        self.task_type: str = task_type
+        self.depends_on: tuple[Future, ...] = depends_on
+        self.cancellation_token: CancellationToken = (
+            cancellation_token or CancellationToken()
+        )
 
-        # Flag to indicate if the thread is currently running
-        self._is_running: bool = False
-
-    def run(self) -> None:
-        """
-        Overrides the run method of Thread. Executes the before_thread function (if provided),
-        then runs the target function with the specified arguments, and finally executes the
-        after_thread function (if provided). Updates the internal _is_running flag accordingly
-        """
-        self._is_running = True  # Mark the thread as running
-
-        # Execute the before_thread function if provided
-        if self.before_thread:
-            self.before_thread()
-
-        # Run the actual target function
-        if self.target:
-            self.target(*self.args)
-
-        # Execute the after_thread function if provided
-        if self.after_thread:
-            self.after_thread()
-
-        self._is_running = False  # Mark the thread as finished
+        # The result of the target function
+        self.future: Future = Future()
 
-    def is_running(self) -> bool:
+    def cancel(self) -> None:
         """
-        Checks if the thread is currently running
-
-        Returns:
-            bool: True if the thread is running, False otherwise.
+        Cancel the task. A pending task does not start at all, a running task is requested
+        to stop through its cancellation token.
         """
-        return self._is_running  # Return the running state of the thread
+        self.future.cancel()
+        self.cancellation_token.cancel()
 
 
 class SafeThreadQueue:
     """
-    SafeThreadQueue manages a queue of SafeThread objects that are executed sequentially
-    by a worker thread. Each SafeThread can have a function that is executed before the
-    thread starts and after it finishes.
+    SafeThreadQueue schedules tasks on two lanes, see `TaskType`. Serial tasks are executed
+    sequentially by a worker thread and I/O-bound tasks concurrently by a thread pool. Each task can have a function that is executed before
+    the task starts and after it finishes and can depend on other tasks.
+
+    A task added with a key supersedes the previous task with the same key, which is cancelled
+    if it is still pending or requested to stop through its cancellation token if it is running.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_io_workers: int = 4) -> None:
         """
         Initializes the SafeThreadQueue with a task queue and starts a worker thread.
+        The thread pool is started on demand.
+
+        Args:
+            max_io_workers (int, optional): The maximum number of threads for I/O-bound tasks. Defaults to 4.
         """
-        self.task_queue: queue.Queue = queue.Queue()  # Queue to hold SafeThread objects
+        self.task_queue: queue.Queue = queue.Queue()  # Queue to hold the serial tasks
         self.worker_thread = Thread(target=self.worker, daemon=True)  # Worker thread
         self.worker_thread.start()  # Start the worker thread
 
+        self.max_io_workers: int = max_io_workers
+        self.io_executor: ThreadPoolExecutor | None = None
+        self.lock: Lock = Lock()
+
+        # The latest task of each key
+        self.keyed_tasks: dict[str, SafeTask] = {}
+
     def worker(self) -> None:
         """
         The worker function that runs in the worker thread. It continuously fetches
-        and executes SafeThread tasks from the queue.
+        and executes the serial tasks from the queue.
         """
         while True:
-            task = self.task_queue.get()  # Get a SafeThread task from the queue
+            task = self.task_queue.get()  # Get a serial task from the queue
 
             if task is None:  # Sentinel value to stop the worker
                 break
 
-            task.start()  # Start the SafeThread
-            task.join()  # Wait for the SafeThread to finish
+            self.run_task(task)  # Run the task in the worker thread itself
             self.task_queue.task_done()  # Mark the task as done
 
+    def run_task(self, task: SafeTask) -> None:
+        """
+        Execute the before_thread function, the target function and the after_thread function of a task
+        in the current thread.
+
+        Args:
+            task (SafeTask): The task to execute.
+        """
+        if not task.future.set_running_or_notify_cancel():  # The task got cancelled
+            return
+        if task.cancellation_token.is_cancelled:  # The task got superseded before it started
+            task.future.set_exception(CancelledError())
+            return
+
+        try:
+            if task.before_thread:
+                task.before_thread()
+
+            try:
+                result: Any = task.target(*task.args)
+            finally:
+                # The after_thread function also runs after a failure, e.g. to stop the progressbar
+                if task.after_thread:
+                    task.after_thread()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Most futures are not read, so an unexpected error is logged as well
+            logger.exception(
+                "Task %s failed", getattr(task.target, "__qualname__", task.target)
+            )
+            # Raised again by the result of the future, the tasks depending on it are cancelled
+            task.future.set_exception(exc)
+        else:
+            task.future.set_result(result)
+
+    def get_io_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool for I/O-bound tasks.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool.
+        """
+        with self.lock:
+            if self.io_executor is None:
+                self.io_executor = ThreadPoolExecutor(
+                    self.max_io_workers, thread_name_prefix="SafeThreadQueue"
+                )
+            return self.io_executor
+
     def add_task(
         self,
         target: Callable[..., Any],
         args: tuple[Any, ...] = (),
         before_thread: Callable[[], None] | None = None,
         after_thread: Callable[[], None] | None = None,
-    ) -> None:
+        task_type: str = TaskType.SERIAL,
+        depends_on: tuple[Future, ...] = (),
+        key: str | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> Future:
         """
-        Adds a new SafeThread task to the queue.
+        Adds a new task to its lane as soon as all the tasks it depends on are finished.
+        If one of them failed or got cancelled, the task is cancelled as well.
+
+        The latest task wins: a previous task with the same key is cancelled.
 
         Args:
-            target (Callable[..., Any]): The function to be executed by the SafeThread
+            target (Callable[..., Any]): The function to be executed by the task.
             args (tuple[Any, ...], optional): The arguments to pass to the target function. Defaults to ().
             before_thread (Callable[[], None] | None, optional):  A function to execute before the thread starts. Defaults to None.
             after_thread (Callable[[], None] | None, optional): A function to execute after the thread finishes. Defaults to None.
+            task_type (str, optional): The lane of the task, see `TaskType`. Defaults to TaskType.SERIAL.
+            depends_on (tuple[Future, ...], optional): The tasks to finish before this task starts. Defaults to ().
+            key (str | None, optional): The key of the task, a newer task with the same key supersedes it.
+                                        Defaults to None.
+            cancellation_token (CancellationToken | None, optional): The token the target checks to stop
+                                                                    while it is running. Defaults to None.
+
+        Returns:
+            Future: The result of the target function.
         """
-        task = SafeThread(
-            target=target,
-            args=args,
-            before_thread=before_thread,
-            after_thread=after_thread,
+        task = SafeTask(
+            target,
+            args,
+            before_thread,
+            after_thread,
+            task_type,
+            depends_on,
+            cancellation_token,
         )
-        self.task_queue.put(task)  # Add the SafeThread task to the queue
+
+        if key is not None:
+            with self.lock:
+                superseded_task: SafeTask | None = self.keyed_tasks.get(key)
+                self.keyed_tasks[key] = task
+            if superseded_task is not None:
+                superseded_task.cancel()
+
+        # The number of unfinished dependencies, the task is dispatched by the last one to finish
+        nr_of_pending: list[int] = [len(depends_on)]
+
+        def dependency_done(_: Future | None = None) -> None:
+            with self.lock:
+                nr_of_pending[0] -= 1
+                is_ready: bool = nr_of_pending[0] <= 0
+            if is_ready:
+                self.dispatch_task(task)
+
+        if not depends_on:
+            self.dispatch_task(task)
+        for dependency in depends_on:
+            dependency.add_done_callback(dependency_done)
+
+        return task.future
+
+    def dispatch_task(self, task: SafeTask) -> None:
+        """
+        Dispatch a task, whose dependencies are finished, to its lane.
+
+        Args:
+            task (SafeTask): The task to dispatch.
+        """
+        if any(
+            dependency.cancelled() or dependency.exception() is not None
+            for dependency in task.depends_on
+        ):
+            task.future.cancel()
+            task.future.set_running_or_notify_cancel()
+        elif task.task_type == TaskType.SERIAL:
+            self.task_queue.put(task)  # Add the task to the queue
+        else:
+            self.get_io_executor().submit(self.run_task, task)
 
     def stop_worker(self) -> None:
         """
         Stops the worker thread by adding a sentinel value (None) to the queue.
-        This tells the worker to stop processing tasks.
+        This tells the worker to stop processing tasks. Pending tasks of the thread pool are cancelled.
         """
         self.task_queue.put(None)  # Add sentinel to stop the worker
         self.worker_thread.join()  # Wait for the worker thread to finish
 
+        if self.io_executor is not None:
+            self.io_executor.shutdown(wait=False, cancel_futures=True)
+
 
 safe_thread_queue = SafeThreadQueue()
@@ -0,0 +1,164 @@
+""" Defines the Trace and TracePool classes which keep the artists of the plotted signals
+    with their decimated points, so a trace shown again reuses them instead of plotting it again. """
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+import numpy as np
+from matplotlib.lines import Line2D
+from utils.level_of_detail import DecimatedSignal, get_stem_points
+
+
+class Trace:
+    """
+    Class for a signal plotted as a line, which shows the decimated points of the signal.
+
+    The line keeps the points of its last decimation, which are only decimated again
+    for another x-range or resolution.
+    """
+
+    __slots__ = "signal", "line", "plot_type", "view"
+
+    def __init__(self, signal: DecimatedSignal, line: Line2D, plot_type: str) -> None:
+        """
+        Initializes the Trace.
+
+        Args:
+            signal (DecimatedSignal): The plotted signal.
+            line (Line2D): The line showing the signal, which has no data yet.
+            plot_type (str): The plot type of the line, see `PlotConfig.Widgets.PLOT_TYPES`.
+        """
+        self.signal: DecimatedSignal = signal
+        self.line: Line2D = line
+        self.plot_type: str = plot_type
+        # The x-range and number of bins of the points of the line
+        self.view: tuple[float, float, int] | None = None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the memory of the points, the data of the line and its cached path.
+
+        Returns:
+            int: The number of bytes.
+        """
+        x, y = self.line.get_data(orig=False)
+        return 2 * (np.asarray(x).nbytes + np.asarray(y).nbytes)
+
+    def covers(self, x_min: float, x_max: float) -> bool:
+        """
+        Check if the points of the line were decimated for an x-range including another one.
+
+        Args:
+            x_min (float): The lower limit of the x-range.
+            x_max (float): The upper limit of the x-range.
+
+        Returns:
+            bool: True if the points include the x-range, False otherwise.
+        """
+        return self.view is not None and self.view[0] <= x_min and x_max <= self.view[1]
+
+    def decimate(self, x_min: float, x_max: float, nr_of_bins: int) -> bool:
+        """
+        Show the points of the signal within an x-range at a resolution, if the line does not show them yet.
+        The arrays of the line are replaced by `set_data`, the line itself is kept.
+
+        Args:
+            x_min (float): The lower limit of the x-range.
+            x_max (float): The upper limit of the x-range.
+            nr_of_bins (int): The number of bins, e.g. the width of the plot in pixels.
+
+        Returns:
+            bool: True if the points changed, False otherwise.
+        """
+        view: tuple[float, float, int] = (float(x_min), float(x_max), nr_of_bins)
+        if view == self.view:
+            return False
+
+        x, y = self.signal.get_points(x_min, x_max, nr_of_bins)
+        if self.plot_type == "Stem":
+            x, y = get_stem_points(x, y)
+
+        self.line.set_data(x, y)
+        self.view = view
+
+        return True
+
+
+class TracePool:
+    """
+    Class for keeping the traces while they are hidden.
+
+    The traces are kept in a least recently used cache, the hidden traces are removed from
+    their axes, least recently used first, once their points exceed the maximum memory.
+    """
+
+    __slots__ = "__traces", "__max_bytes"
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initializes the TracePool.
+
+        Args:
+            max_bytes (int): The maximum memory of the points of the hidden traces in bytes.
+        """
+        self.__traces: OrderedDict[Hashable, Trace] = OrderedDict()
+        self.__max_bytes: int = max_bytes
+
+    def __len__(self) -> int:
+        return len(self.__traces)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.__traces)
+
+    def get(self, key: Hashable) -> Trace | None:
+        """
+        Get a kept trace and mark it as recently used.
+
+        Args:
+            key (Hashable): The key of the trace, e.g. (file path, column, plot type).
+
+        Returns:
+            Trace | None: The trace or None if it is not kept.
+        """
+        trace: Trace | None = self.__traces.get(key)
+        if trace is not None:
+            self.__traces.move_to_end(key)
+
+        return trace
+
+    def add(self, key: Hashable, trace: Trace) -> None:
+        """
+        Keep a trace as the most recently used one.
+
+        Args:
+            key (Hashable): The key of the trace, e.g. (file path, column, plot type).
+            trace (Trace): The trace.
+        """
+        self.__traces[key] = trace
+        self.__traces.move_to_end(key)
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used hidden traces from the pool and their axes,
+        until the hidden traces are within the maximum memory.
+        """
+        hidden_keys: list[Hashable] = [
+            key for key, trace in self.__traces.items() if not trace.line.get_visible()
+        ]
+        hidden_bytes: int = sum(self.__traces[key].nbytes for key in hidden_keys)
+
+        for key in hidden_keys:
+            if hidden_bytes <= self.__max_bytes:
+                break
+
+            trace: Trace = self.__traces.pop(key)
+            hidden_bytes -= trace.nbytes
+            trace.line.remove()
+
+    def clear(self) -> None:
+        """
+        Remove all traces from the pool and their axes, e.g. if the data of the signals is replaced.
+        """
+        for trace in self.__traces.values():
+            trace.line.remove()
+        self.__traces.clear()
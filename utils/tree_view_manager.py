@@ -1,4 +1,18 @@
+""" Defines the GroupStringFilter class which filters the headers of a CSV file, grouped by their
+    group name, by a search term and by their measurement type. """
+
 from collections import defaultdict, OrderedDict
+import heapq
+import numpy as np
+
+# Scores of a fuzzy match, similar to fzf
+SCORE_MATCH: int = 16
+BONUS_BOUNDARY: int = 8
+BONUS_CONSECUTIVE: int = 4
+PENALTY_GAP: int = 1
+PENALTY_TYPO: int = 24
+BOUNDARY_CHARS: str = " _-./:()[]"
+NO_MATCH: int = np.iinfo(np.int64).min
 
 
 class MeasurementType:
@@ -13,60 +27,346 @@ class MeasurementType:
     NON_ZERO = "non_zero"
 
 
-class TrieNode:
+def fuzzy_scores(
+    query: str, char_matrix: np.ndarray, boundaries: np.ndarray, max_typos: int = 0
+) -> np.ndarray:
     """
-    Class representing a node in the Trie. Each node contains a dictionary of children nodes,
-    a flag indicating if it is the end of a word, and a list of strings that pass through this node.
+    Scores how well texts match a query whose characters occur in the texts in the same order,
+    but not necessarily next to each other. Each character is matched at its next occurrence.
+    The first one is matched both at its first occurrence at the start of a word and at its
+    first occurrence at all, and the better match is kept, so a word start is preferred
+    without losing texts which match only from an earlier occurrence. Characters at the start
+    of a word and consecutive characters score higher, gaps between them score lower. Up to
+    `max_typos` characters of the query may be missing in a text, each lowering the score.
+    All texts are scored at once.
+
+    Args:
+        query (str): The lowercased search term without whitespaces.
+        char_matrix (np.ndarray): The unicode code points of the lowercased texts, one text per row
+                                    padded with zeros.
+        boundaries (np.ndarray): Indicator per character of the texts if it starts a word.
+        max_typos (int, optional): The maximum number of characters of the query not found. Defaults to 0.
+
+    Returns:
+        np.ndarray: The score of each text or `NO_MATCH` if it does not match.
     """
+    if not query:
+        return np.zeros(len(char_matrix), dtype=np.int64)
+
+    first_matches: np.ndarray = char_matrix == ord(query[0])
+    first_indices: np.ndarray = first_matches.argmax(axis=1)
+    boundary_matches: np.ndarray = first_matches & boundaries
+    boundary_indices: np.ndarray = np.where(
+        boundary_matches.any(axis=1), boundary_matches.argmax(axis=1), first_indices
+    )
 
-    def __init__(self):
-        self.children: dict[str, TrieNode] = {}
-        self.is_end_of_word: bool = False
-        self.strings: list[tuple[str, str]] = []
+    best_scores: np.ndarray = np.full(len(char_matrix), NO_MATCH, dtype=np.int64)
+    for start_indices in (boundary_indices, first_indices):
+        scores, typos = align_query(query, char_matrix, boundaries, start_indices)
+        scores[typos > max_typos] = NO_MATCH
+        best_scores = np.maximum(best_scores, scores)
+
+        if np.array_equal(boundary_indices, first_indices):
+            break
 
+    return best_scores
 
-class Trie:
+
+def align_query(
+    query: str,
+    char_matrix: np.ndarray,
+    boundaries: np.ndarray,
+    start_indices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Trie (prefix tree) for efficient prefix-based searches.
-    Supports insertion of strings and searching for strings by prefix.
+    Match the characters of a query at their next occurrence in the texts, starting with
+    the first character at given indices, see `fuzzy_scores`.
+
+    Args:
+        query (str): The lowercased search term without whitespaces, not empty.
+        char_matrix (np.ndarray): The unicode code points of the lowercased texts, one text per row
+                                    padded with zeros.
+        boundaries (np.ndarray): Indicator per character of the texts if it starts a word.
+        start_indices (np.ndarray): The index of the first character of the query in each text,
+                                    ignored if the text does not contain it.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The score and the number of characters not found of each text.
     """
+    nr_of_texts, width = char_matrix.shape
+    rows: np.ndarray = np.arange(nr_of_texts)
+    columns: np.ndarray = np.arange(width)
+
+    scores: np.ndarray = np.zeros(nr_of_texts, dtype=np.int64)
+    typos: np.ndarray = np.zeros(nr_of_texts, dtype=np.int64)
+    positions: np.ndarray = np.zeros(nr_of_texts, dtype=np.int64)
+    previous_indices: np.ndarray = np.full(nr_of_texts, -1, dtype=np.int64)
+
+    for char_index, char in enumerate(query):
+        matches: np.ndarray = (char_matrix == ord(char)) & (
+            columns >= positions[:, None]
+        )
+        found: np.ndarray = matches.any(axis=1)
+        indices: np.ndarray = matches.argmax(axis=1)
 
-    def __init__(self):
-        self.root: TrieNode = TrieNode()
+        boundary_bonus: int = BONUS_BOUNDARY
+        if char_index == 0:
+            indices = start_indices
+            # A match at the start of a word counts more for the first character
+            boundary_bonus *= 2
+
+        gaps: np.ndarray = indices - previous_indices - 1
+        has_previous: np.ndarray = found & (previous_indices >= 0)
+
+        scores += np.where(found, SCORE_MATCH, -PENALTY_TYPO)
+        scores += (found & boundaries[rows, indices]) * boundary_bonus
+        scores += (has_previous & (gaps == 0)) * BONUS_CONSECUTIVE
+        scores -= (has_previous & (gaps > 0)) * PENALTY_GAP * np.minimum(gaps, 8)
+        typos += ~found
+
+        previous_indices = np.where(found, indices, previous_indices)
+        positions = np.where(found, indices + 1, positions)
+
+    return scores, typos
+
+
+class NGramIndex:
+    """
+    Index for substring searches.
+
+    Every key is split into all its substrings of up to `n` characters, the n-grams, and each
+    n-gram keeps the ascending array of the integer ids of the keys containing it. A search term
+    of up to `n` characters is answered by a single lookup, a longer one by intersecting the
+    arrays of its n-grams and checking the few remaining keys.
+    """
 
-    def insert(self, word: str, original_string: tuple[str, str]) -> None:
+    __slots__ = "__n", "__keys", "__key_array", "__postings", "__char_matrix"
+
+    def __init__(self, n: int = 3) -> None:
+        self.__n: int = n
+        self.__keys: list[str] = []
+        # The keys as a NumPy array, to check many of them at once
+        self.__key_array: np.ndarray = np.array([], dtype=str)
+        self.__postings: dict[str, np.ndarray] = {}
+        # The code points of the keys and their word starts for fuzzy searches, created on demand
+        self.__char_matrix: tuple[np.ndarray, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    @property
+    def n(self) -> int:
+        """
+        Get the maximum length of the n-grams.
+
+        Returns:
+            int: The maximum number of characters of an n-gram.
+        """
+        return self.__n
+
+    def build(self, keys: list[str]) -> None:
         """
-        Inserts a word into the Trie. Each node along the path of the word
-        stores the original string associated with the word.
+        Builds the index from a list of keys. The id of a key is its index in the list.
 
         Args:
-            word (str): The word that will be inserted into the trie.
-            original_string (tuple[str, str]): The group name and the substring.
+            keys (list[str]): The keys.
         """
-        node: TrieNode = self.root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-            node.strings.append(original_string)
-        node.is_end_of_word = True
+        self.__keys = [key.lower() for key in keys]
+        self.__key_array = np.array(self.__keys, dtype=str)
+        self.__char_matrix = None
+
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for key_id, key in enumerate(self.__keys):
+            for n_gram in {
+                key[start : start + length]
+                for length in range(1, self.__n + 1)
+                for start in range(len(key) - length + 1)
+            }:
+                postings[n_gram].append(key_id)
+
+        self.__postings = {
+            n_gram: np.array(key_ids, dtype=np.int32)
+            for n_gram, key_ids in postings.items()
+        }
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        Searches for the ids of the keys that contain every whitespace separated token of the query.
+
+        Args:
+            query (str): The search term.
+
+        Returns:
+            np.ndarray: The ascending ids of the matched keys.
+        """
+        tokens: list[str] = query.lower().split()
+        if not tokens:
+            return np.arange(len(self.__keys), dtype=np.int32)
+
+        key_ids: np.ndarray = self.search_token(tokens[0])
+        for token in tokens[1:]:
+            if key_ids.size == 0:
+                break
+            key_ids = np.intersect1d(
+                key_ids, self.search_token(token), assume_unique=True
+            )
+
+        return key_ids
 
-    def search_prefix(self, prefix: str) -> list[tuple[str, str]]:
+    def refine(self, key_ids: np.ndarray, query: str) -> np.ndarray:
         """
-        Searches for all strings in the Trie that match the given prefix.
+        Narrows the ids of a previous search to the keys that contain every token of the query.
+        This is faster than a new search, if the query extends the one of the previous search.
 
         Args:
-            prefix (str): The search term.
+            key_ids (np.ndarray): The ascending ids of a previous search.
+            query (str): The search term.
 
         Returns:
-            list[tuple[str, str]]: List of original strings associated with the matched prefix
+            np.ndarray: The ascending ids of the matched keys.
         """
-        node: TrieNode = self.root
-        for char in prefix:
-            if char not in node.children:
-                return []
-            node = node.children[char]
-        return node.strings
+        for token in query.lower().split():
+            key_ids = self.contains(key_ids, token)
+
+        return key_ids
+
+    def fuzzy_search(
+        self,
+        query: str,
+        limit: int = 100,
+        max_typos: int = 0,
+        key_ids: np.ndarray | None = None,
+    ) -> list[int]:
+        """
+        Searches for the ids of the keys matching the query fuzzily, see `fuzzy_scores`,
+        ranked by their score.
+
+        Only keys containing enough different characters of the query are scored,
+        found by the postings of the single characters. The best keys are kept in a
+        heap of `limit` keys instead of sorting all of them.
+
+        Args:
+            query (str): The search term, its whitespaces are ignored.
+            limit (int, optional): The maximum number of returned ids. Defaults to 100.
+            max_typos (int, optional): The maximum number of characters of the query
+                                        not found in a key. Defaults to 0.
+            key_ids (np.ndarray | None, optional): The ascending ids of the keys to search, e.g. of
+                                                    the keys of a filter, None for all keys.
+                                                    Defaults to None.
+
+        Returns:
+            list[int]: The ids of the best matched keys, the best first and equal scores by their id.
+        """
+        query = "".join(query.lower().split())
+        if not query:
+            if key_ids is None:
+                return list(range(min(limit, len(self.__keys))))
+            return key_ids[:limit].tolist()
+
+        chars: set[str] = set(query)
+        char_postings: list[np.ndarray] = [
+            self.__postings[char] for char in chars if char in self.__postings
+        ]
+        if len(char_postings) < len(chars) - max_typos:
+            return []
+
+        # The number of different characters of the query contained in each key
+        char_counts: np.ndarray = np.bincount(
+            np.concatenate(char_postings), minlength=len(self.__keys)
+        )
+        candidates: np.ndarray = np.flatnonzero(char_counts >= len(chars) - max_typos)
+        if key_ids is not None:
+            # Filtered before ranking, so the filter does not cut the best keys to fewer than the limit
+            candidates = np.intersect1d(candidates, key_ids, assume_unique=True)
+
+        char_matrix, boundaries = self.get_char_matrix()
+        scores: np.ndarray = fuzzy_scores(
+            query, char_matrix[candidates], boundaries[candidates], max_typos
+        )
+        is_match: np.ndarray = scores != NO_MATCH
+
+        best_matches: list[tuple[int, int]] = heapq.nlargest(
+            limit,
+            zip(scores[is_match].tolist(), (-candidates[is_match]).tolist()),
+        )
+
+        return [-key_id for _, key_id in best_matches]
+
+    def get_char_matrix(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the unicode code points of the keys, one key per row padded with zeros,
+        and the indicator per character if it starts a word.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The code points and the word starts.
+        """
+        if self.__char_matrix is None:
+            char_matrix: np.ndarray = (
+                self.__key_array.view(np.uint32).reshape(len(self.__keys), -1)
+                if len(self.__keys)
+                else np.zeros((0, 0), dtype=np.uint32)
+            )
+
+            boundaries: np.ndarray = np.ones(char_matrix.shape, dtype=bool)
+            boundaries[:, 1:] = np.isin(
+                char_matrix[:, :-1], [ord(char) for char in BOUNDARY_CHARS]
+            )
+            self.__char_matrix = (char_matrix, boundaries)
+
+        return self.__char_matrix
+
+    def search_token(self, token: str) -> np.ndarray:
+        """
+        Searches for the ids of the keys that contain a token.
+
+        Args:
+            token (str): The lowercased token without whitespaces.
+
+        Returns:
+            np.ndarray: The ascending ids of the matched keys.
+        """
+        n_grams: list[str] = (
+            [token]
+            if len(token) <= self.__n
+            else [
+                token[start : start + self.__n]
+                for start in range(len(token) - self.__n + 1)
+            ]
+        )
+
+        postings: list[np.ndarray] = []
+        for n_gram in n_grams:
+            if n_gram not in self.__postings:
+                return np.empty(0, dtype=np.int32)
+            postings.append(self.__postings[n_gram])
+
+        # Intersecting the shortest arrays first keeps the intermediate results small
+        postings.sort(key=len)
+        key_ids: np.ndarray = postings[0]
+        for n_gram_ids in postings[1:]:
+            key_ids = np.intersect1d(key_ids, n_gram_ids, assume_unique=True)
+
+        if len(token) <= self.__n:
+            return key_ids
+
+        # The n-grams may occur in a key, but not next to each other
+        return self.contains(key_ids, token)
+
+    def contains(self, key_ids: np.ndarray, token: str) -> np.ndarray:
+        """
+        Checks which of the keys contain a token.
+
+        Args:
+            key_ids (np.ndarray): The ascending ids of the keys to check.
+            token (str): The lowercased token without whitespaces.
+
+        Returns:
+            np.ndarray: The ascending ids of the keys containing the token.
+        """
+        if key_ids.size == 0:
+            return key_ids
+
+        return key_ids[np.char.find(self.__key_array[key_ids], token) >= 0]
 
 
 class GroupStringFilter:
@@ -76,18 +376,32 @@ class GroupStringFilter:
     """
 
     def __init__(self):
-        self.groups: defaultdict[str, list[tuple[str, any]]] = defaultdict(
+        self.entries: list[tuple[str, str, any]] = (
+            []
+        )  # List to store the (group, string, type) tuple of every entry, its index is its id
+        self.groups: defaultdict[str, list[int]] = defaultdict(
             list
-        )  # Dictionary to store groups and their corresponding (string, type) tuples
+        )  # Dictionary to store groups and the ids of their entries
         self.display_order: OrderedDict[str:None] = (
             OrderedDict()  # List to maintain the order of group names for display
         )
         self.current_mode: str = (
-            "Substring"  # Current filtering mode: "Substring" or "Group"
+            "Substring"  # Current filtering mode: "Substring", "Group" or "Fuzzy"
         )
         self.search_term: str = ""  # Current search term for filtering
         self.filter_type: str = MeasurementType.ALL  # Current filter
-        self.trie: Trie = Trie()  # Trie for efficient substring searches
+        self.substring_index: NGramIndex = (
+            NGramIndex()
+        )  # Index for efficient substring searches
+        self.group_index: NGramIndex = (
+            NGramIndex()
+        )  # Index for efficient group name searches
+        self.search_cache: OrderedDict[tuple[str, str], np.ndarray] = (
+            OrderedDict()
+        )  # Least recently used cache of the matched ids of the recent (mode, search term)
+        self.max_cached_searches: int = 32  # Maximum number of cached searches
+        self.fuzzy_limit: int = 100  # Maximum number of strings found by a fuzzy search
+        self.max_typos: int = 2  # Maximum number of typos of a fuzzy search term
 
     def add_entries(
         self,
@@ -106,10 +420,10 @@ class GroupStringFilter:
             sub_header_first (bool, optional): Indicator if the root or the leaf comes first in the texts.
                                                 Defaults to True.
         """
+        self.entries = []
         self.groups.clear()
         self.display_order.clear()
-
-        self.trie = Trie()
+        self.search_cache.clear()
 
         for entry, filter_type in zip(entries, types):
             if sub_header_first:
@@ -121,8 +435,11 @@ class GroupStringFilter:
 
             self.display_order[group_name] = None
 
-            self.groups[group_name].append((substring, filter_type))
-            self.trie.insert(substring.lower(), (group_name, substring))
+            self.groups[group_name].append(len(self.entries))
+            self.entries.append((group_name, substring, filter_type))
+
+        self.substring_index.build([substring for _, substring, _ in self.entries])
+        self.group_index.build(list(self.display_order))
 
     def set_mode(self, mode: str) -> None:
         """
@@ -149,9 +466,58 @@ class GroupStringFilter:
         """
         if self.current_mode == "Substring":
             return self.filter_by_substring()
+        elif self.current_mode == "Fuzzy":
+            return self.filter_by_fuzzy()
         else:
             return self.filter_by_group()
 
+    def search(self, index: NGramIndex) -> np.ndarray:
+        """
+        Searches the current search term in the index of the current mode.
+
+        The matched ids of recent searches are cached, so deleting characters returns the result
+        of the shorter search term again. A search term extending a cached one only narrows
+        the cached result instead of searching the whole index.
+
+        Args:
+            index (NGramIndex): The index of the current mode.
+
+        Returns:
+            np.ndarray: The ascending ids of the matched entries or groups.
+        """
+        key: tuple[str, str] = (self.current_mode, self.search_term)
+        if key in self.search_cache:
+            self.search_cache.move_to_end(key)
+            return self.search_cache[key]
+
+        # A single word of up to n characters is looked up in the index directly
+        words: list[str] = self.search_term.split()
+        is_lookup: bool = len(words) == 1 and len(words[0]) <= index.n
+
+        # Every word of a shorter search term is contained in one of the extended search term
+        previous_terms: list[str] = [
+            term
+            for mode, term in self.search_cache
+            if not is_lookup
+            and mode == self.current_mode
+            and term.strip()
+            and self.search_term.startswith(term)
+        ]
+        if previous_terms:
+            previous_term: str = max(previous_terms, key=len)
+            matching_ids = index.refine(
+                self.search_cache[(self.current_mode, previous_term)],
+                self.search_term,
+            )
+        else:
+            matching_ids = index.search(self.search_term)
+
+        self.search_cache[key] = matching_ids
+        while len(self.search_cache) > self.max_cached_searches:
+            self.search_cache.popitem(last=False)
+
+        return matching_ids
+
     def filter_by_type(
         self, items: list[tuple[str, str, any]]
     ) -> list[tuple[str, str, any]]:
@@ -169,37 +535,76 @@ class GroupStringFilter:
 
     def filter_by_substring(self) -> list[tuple[str, str, any]]:
         """
-        Filters the strings by the current search term using the Trie.
+        Filters the strings containing every word of the current search term using the substring index.
         Further filters the results by the current filter type.
         """
         if not self.search_term:
             all_items = [
-                (group, s, m)
-                for group in list(self.display_order.keys())
-                for s, m in self.groups[group]
+                self.entries[entry_id]
+                for group in self.display_order
+                for entry_id in self.groups[group]
             ]
             return self.filter_by_type(all_items)
 
-        matching_strings = self.trie.search_prefix(self.search_term)
-        all_items = [
-            (group, s, m)
-            for group, s in matching_strings
-            for _, m in self.groups[group]
-            if s == _
-        ]
+        # The ids are in the order of the entries
+        matching_ids = self.search(self.substring_index)
+        all_items = [self.entries[entry_id] for entry_id in matching_ids.tolist()]
 
         return self.filter_by_type(all_items)
 
+    def filter_by_fuzzy(self) -> list[tuple[str, str, any]]:
+        """
+        Filters the best strings of the current filter type matching the current search term
+        fuzzily, ranked by their score. Search terms of at least four characters per typo may
+        contain typos.
+        """
+        if not self.search_term.strip():
+            return self.filter_by_substring()
+
+        # The best strings depend on the filter type, as only the strings of the type are ranked
+        key = (f"{self.current_mode}:{self.filter_type}", self.search_term)
+        if key in self.search_cache:
+            self.search_cache.move_to_end(key)
+        else:
+            key_ids = None
+            if self.filter_type != MeasurementType.ALL:
+                key_ids = np.array(
+                    [
+                        entry_id
+                        for entry_id, entry in enumerate(self.entries)
+                        if self.filter_by_type([entry])
+                    ],
+                    dtype=np.int64,
+                )
+
+            self.search_cache[key] = np.array(
+                self.substring_index.fuzzy_search(
+                    self.search_term,
+                    self.fuzzy_limit,
+                    min(self.max_typos, len(self.search_term.strip()) // 4),
+                    key_ids,
+                ),
+                dtype=np.int32,
+            )
+            while len(self.search_cache) > self.max_cached_searches:
+                self.search_cache.popitem(last=False)
+
+        return [self.entries[entry_id] for entry_id in self.search_cache[key].tolist()]
+
     def filter_by_group(self) -> list[tuple[str, str, any]]:
         """
-        Filters the groups by the current search term.
+        Filters the groups containing every word of the current search term using the group index.
         Further filters the results by the current filter type.
         """
+        group_names = list(self.display_order)
+
         result = []
-        for group in list(self.display_order.keys()):
-            if self.search_term in group.lower():
-                items = [(group, s, m) for s, m in self.groups[group]]
-                result.extend(self.filter_by_type(items))
+        for group_id in self.search(self.group_index).tolist():
+            items = [
+                self.entries[entry_id]
+                for entry_id in self.groups[group_names[group_id]]
+            ]
+            result.extend(self.filter_by_type(items))
         return result
 
     def display(self) -> None:
@@ -228,59 +633,61 @@ class GroupStringFilter:
         print("-----------")
 
 
-# Example usage
-test = [
-    "Names::first",
-    "Names::second",
-    "Names::third",
-    "Ages::fourth",
-    "Ages::fifth",
-    "Figures::second",
-    "Figures::forth",
-    "Figures::seventh",
-]
-measurements = [
-    "non_constant",
-    "zero",
-    "non_constant",
-    "zero",
-    "non_constant",
-    "zero",
-    "non_constant",
-    "non_constant",
-]
-
-filter_system = GroupStringFilter()
-filter_system.add_entries(test, measurements, "::")
-
-# Initial display
-filter_system.display()
-
-# Set mode and search term, then display
-# filter_system.set_mode("Group")
-filter_system.set_search_term("f")
-filter_system.display()
-
-# Set measurement filter to non-constant and display
-filter_system.set_filter(MeasurementType.NON_CONSTANT)
-filter_system.display()
-
-# Change search term and display
-filter_system.set_search_term("fi")
-filter_system.display()
-
-# Change measurement filter to zero and display
-filter_system.set_filter(MeasurementType.ZERO)
-filter_system.display()
-
-# Change back to all and display
-filter_system.set_filter(MeasurementType.ALL)
-filter_system.display()
-
-# Change to group mode and set search term to "fi"
-filter_system.set_mode("Group")
-filter_system.set_search_term("fi")
-filter_system.display()
+if __name__ == "__main__":
+    # Example usage
+    test = [
+        "Names::first",
+        "Names::second",
+        "Names::third",
+        "Ages::fourth",
+        "Ages::fifth",
+        "Figures::second",
+        "Figures::forth",
+        "Figures::seventh",
+    ]
+    measurements = [
+        "non_constant",
+        "zero",
+        "non_constant",
+        "zero",
+        "non_constant",
+        "zero",
+        "non_constant",
+        "non_constant",
+    ]
+
+    filter_system = GroupStringFilter()
+    filter_system.add_entries(test, measurements, "::")
+
+    # Initial display
+    filter_system.display()
+
+    # Set mode and search term, then display
+    # filter_system.set_mode("Group")
+    filter_system.set_search_term("f")
+    filter_system.display()
+
+    # Set measurement filter to non-constant and display
+    filter_system.set_filter(MeasurementType.NON_CONSTANT)
+    filter_system.display()
+
+    # Change search term and display
+    filter_system.set_search_term("fi")
+    filter_system.display()
+
+    # Change measurement filter to zero and display
+    filter_system.set_filter(MeasurementType.ZERO)
+    filter_system.display()
+
+    # Change back to all and display
+    filter_system.set_filter(MeasurementType.ALL)
+    filter_system.display()
+
+    # Change to group mode and set search term to "fi"
+    filter_system.set_mode("Group")
+    filter_system.set_search_term("fi")
+    filter_system.display()
+
 
 
 import customtkinter as ctk
@@ -0,0 +1,312 @@
+""" Defines a VirtualScrollableFrame class, a scrollable list of rows which only creates
+    as many widgets as fit in its viewport and rebinds them to the rows on scrolling. """
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from math import ceil
+from typing import Any
+import customtkinter as ctk
+
+
+def get_visible_rows(
+    offset: int,
+    viewport_height: int,
+    row_height: int,
+    nr_of_rows: int,
+    overscan: int = 0,
+) -> range:
+    """
+    Get the indices of the rows within the viewport and the overscan.
+
+    Args:
+        offset (int): The scroll position in pixels.
+        viewport_height (int): The height of the viewport in pixels.
+        row_height (int): The height of a row in pixels.
+        nr_of_rows (int): The number of rows.
+        overscan (int, optional): The number of rows above and below the viewport. Defaults to 0.
+
+    Returns:
+        range: The indices of the rows.
+    """
+    first_row: int = max(offset // row_height - overscan, 0)
+    last_row: int = min(
+        ceil((offset + viewport_height) / row_height) + overscan, nr_of_rows
+    )
+
+    return range(first_row, max(last_row, first_row))
+
+
+class VirtualScrollableFrame(ctk.CTkFrame):
+    """
+    Functionality and layout of the VirtualScrollableFrame.
+
+    Every row has a type and data and is `row_height` pixels high. For each row type a function
+    creating a widget in the viewport and a function binding a widget to the data of a row are
+    registered. Only the rows in the viewport plus an overscan above and below it get a widget,
+    which are taken from a pool per row type, so the number of widgets does not depend on the
+    number of rows.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        row_height: int = 28,
+        overscan: int = 2,
+        row_padx: int = 0,
+        batch_update: Callable[[], AbstractContextManager] = nullcontext,
+        label_text: str = "",
+        label_font: tuple | ctk.CTkFont | None = None,
+        label_anchor: str = "center",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(master, **kwargs)
+
+        self.row_height: int = row_height
+        self.overscan: int = overscan
+        # Wraps the binding of all widgets of an update, e.g. to defer their layout
+        self.batch_update: Callable[[], AbstractContextManager] = batch_update
+
+        # The rows as (row type, data)
+        self.rows: list[tuple[str, Any]] = []
+        # The scroll position in pixels
+        self.offset: int = 0
+
+        self.widget_factories: dict[str, Callable[[], ctk.CTkBaseClass]] = {}
+        self.bind_functions: dict[str, Callable[[Any, Any], None]] = {}
+        self.free_widgets: dict[str, list[ctk.CTkBaseClass]] = {}
+        # The row type each widget of the pools was created for
+        self.widget_row_types: dict[ctk.CTkBaseClass, str] = {}
+        # The widget of each visible row index
+        self.visible_widgets: dict[int, ctk.CTkBaseClass] = {}
+        # The row each widget shows and its y position, so unchanged widgets are not touched
+        self.bound_rows: dict[ctk.CTkBaseClass, tuple[str, Any]] = {}
+        self.placed_widgets: dict[ctk.CTkBaseClass, int] = {}
+
+        if label_text:
+            self.label: ctk.CTkLabel = ctk.CTkLabel(
+                self, text=label_text, font=label_font, anchor=label_anchor
+            )
+            self.label.pack(side="top", fill="x", padx=(7, 7))
+
+        self.scrollbar: ctk.CTkScrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y", pady=(3, 3))
+
+        self.viewport: ctk.CTkFrame = ctk.CTkFrame(self, fg_color="transparent")
+        # Widgets can only be placed with their own height and the full width of the viewport
+        self.viewport.pack(side="left", fill="both", expand=True, padx=row_padx)
+
+        self.viewport.bind("<Configure>", lambda _: self.render())
+        self.bind_mouse_wheel(self.viewport)
+
+    @property
+    def viewport_height(self) -> int:
+        """
+        Get the height of the viewport in the unscaled pixels the rows are placed with.
+
+        Returns:
+            int: The height of the viewport in pixels.
+        """
+        # The widgets are placed in unscaled pixels, but the height is measured on the screen
+        return max(int(self.viewport.winfo_height() / self._get_widget_scaling()), 1)
+
+    @property
+    def max_offset(self) -> int:
+        """
+        Get the maximum scroll position.
+
+        Returns:
+            int: The scroll position in pixels which shows the last row at the bottom.
+        """
+        return max(len(self.rows) * self.row_height - self.viewport_height, 0)
+
+    def register_row_type(
+        self,
+        row_type: str,
+        create_widget: Callable[[], ctk.CTkBaseClass],
+        bind_widget: Callable[[Any, Any], None],
+    ) -> None:
+        """
+        Register a row type.
+
+        Args:
+            row_type (str): The name of the row type.
+            create_widget (Callable[[], ctk.CTkBaseClass]): Creates a widget of the row type in the viewport.
+            bind_widget (Callable[[Any, Any], None]): Shows the data of a row in a widget.
+        """
+        self.widget_factories[row_type] = create_widget
+        self.bind_functions[row_type] = bind_widget
+        self.free_widgets.setdefault(row_type, [])
+
+    def set_rows(
+        self, rows: list[tuple[str, Any]], keep_position: bool = False
+    ) -> None:
+        """
+        Set the rows and show them. Only the widgets whose row changed are bound again.
+
+        Args:
+            rows (list[tuple[str, Any]]): The rows as (row type, data).
+            keep_position (bool, optional): Indicator if the scroll position is kept,
+                                            otherwise the first row is shown. Defaults to False.
+        """
+        if rows == self.rows and (keep_position or self.offset == 0):
+            return
+
+        self.rows = rows
+        if not keep_position:
+            self.offset = 0
+
+        self.render()
+
+    def yview(self, *args: Any) -> None:
+        """
+        Scroll the rows, called by the scrollbar.
+
+        Args:
+            *args (Any): ("moveto", fraction) or ("scroll", number, "units" | "pages").
+        """
+        if not args:
+            return
+
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.rows) * self.row_height)
+        elif args[0] == "scroll":
+            step: int = (
+                self.viewport_height if args[2] == "pages" else self.row_height
+            )
+            self.offset += int(args[1]) * step
+
+        self.render()
+
+    def yview_moveto(self, fraction: float) -> None:
+        """
+        Scroll to a fraction of the rows.
+
+        Args:
+            fraction (float): The fraction of the rows above the viewport.
+        """
+        self.yview("moveto", fraction)
+
+    def render(self) -> None:
+        """
+        Place a widget for every row in the viewport and the overscan and update the scrollbar.
+
+        The widgets are bound to their rows first and placed afterwards in one pass. A widget
+        which already shows its row is not bound again and one at its position is not placed again.
+        """
+        self.offset = min(max(self.offset, 0), self.max_offset)
+
+        visible_rows: range = get_visible_rows(
+            self.offset,
+            self.viewport_height,
+            self.row_height,
+            len(self.rows),
+            self.overscan,
+        )
+
+        # Release the widgets of the rows that left the viewport or changed their type
+        for row_index in list(self.visible_widgets):
+            if (
+                row_index not in visible_rows
+                or self.get_row_type(self.visible_widgets[row_index])
+                != self.rows[row_index][0]
+            ):
+                self.release_widget(self.visible_widgets.pop(row_index))
+
+        with self.batch_update():
+            for row_index in visible_rows:
+                row: tuple[str, Any] = self.rows[row_index]
+
+                widget: ctk.CTkBaseClass | None = self.visible_widgets.get(row_index)
+                if widget is None:
+                    widget = self.get_widget(*row)
+                    self.visible_widgets[row_index] = widget
+
+                if self.bound_rows.get(widget) != row:
+                    self.bind_functions[row[0]](widget, row[1])
+                    self.bound_rows[widget] = row
+
+        for row_index in visible_rows:
+            widget = self.visible_widgets[row_index]
+            y: int = row_index * self.row_height - self.offset
+
+            if self.placed_widgets.get(widget) != y:
+                widget.place(x=0, y=y, relwidth=1.0)
+                self.placed_widgets[widget] = y
+
+        total_height: int = max(len(self.rows) * self.row_height, 1)
+        self.scrollbar.set(
+            self.offset / total_height,
+            min((self.offset + self.viewport_height) / total_height, 1.0),
+        )
+
+    def get_widget(self, row_type: str, data: Any) -> ctk.CTkBaseClass:
+        """
+        Get a free widget of a row type, preferably one which still shows the data,
+        or create a new one.
+
+        Args:
+            row_type (str): The row type.
+            data (Any): The data of the row.
+
+        Returns:
+            ctk.CTkBaseClass: The widget.
+        """
+        free_widgets: list[ctk.CTkBaseClass] = self.free_widgets[row_type]
+        if free_widgets:
+            for index, widget in enumerate(free_widgets):
+                if self.bound_rows.get(widget) == (row_type, data):
+                    return free_widgets.pop(index)
+
+            return free_widgets.pop()
+
+        widget = self.widget_factories[row_type]()
+        self.widget_row_types[widget] = row_type
+        self.bind_mouse_wheel(widget)
+
+        return widget
+
+    def release_widget(self, widget: ctk.CTkBaseClass) -> None:
+        """
+        Hide a widget and return it to the pool of its row type.
+
+        Args:
+            widget (ctk.CTkBaseClass): The widget.
+        """
+        widget.place_forget()
+        self.placed_widgets.pop(widget, None)
+        self.free_widgets[self.get_row_type(widget)].append(widget)
+
+    def get_row_type(self, widget: ctk.CTkBaseClass) -> str:
+        """
+        Get the row type a widget was created for.
+
+        Args:
+            widget (ctk.CTkBaseClass): The widget.
+
+        Returns:
+            str: The row type.
+        """
+        return self.widget_row_types[widget]
+
+    def bind_mouse_wheel(self, widget: Any) -> None:
+        """
+        Scroll the rows with the mouse wheel over a widget.
+
+        Args:
+            widget (Any): The widget.
+        """
+        widget.bind("<MouseWheel>", self.on_mouse_wheel, add="+")
+        widget.bind("<Button-4>", lambda _: self.yview("scroll", -1, "units"), add="+")
+        widget.bind("<Button-5>", lambda _: self.yview("scroll", 1, "units"), add="+")
+
+    def on_mouse_wheel(self, event: Any) -> None:
+        """
+        Scroll the rows by the mouse wheel.
+
+        Args:
+            event (Any): The mouse wheel event.
+        """
+        if event.delta:
+            # Windows reports multiples of 120, macOS small steps
+            units: int = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+            self.yview("scroll", units, "units")
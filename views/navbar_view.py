@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from PIL import Image
 import customtkinter as ctk
 from configurations.navbar_config import NavBarConfig
 from utils.helper_functions import find_root
+from utils.image_cache import get_image
 
 if TYPE_CHECKING:
     from .main_view import MainView
@@ -36,17 +36,13 @@ class NavigationBarView(ctk.CTkFrame):
         """
         Initialize widgets.
         """
-        self.hide_image: ctk.CTkImage = ctk.CTkImage(
-            light_image=Image.open(
-                NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["hide_image"]  # type: ignore
-            ),
-            size=NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["size"], # type: ignore
+        self.hide_image: ctk.CTkImage = get_image(
+            NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["hide_image"],  # type: ignore
+            NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["size"],  # type: ignore
         )
-        self.show_image: ctk.CTkImage = ctk.CTkImage(
-            light_image=Image.open(
-                NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["show_image"] # type: ignore
-            ),
-            size=NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["size"], # type: ignore
+        self.show_image: ctk.CTkImage = get_image(
+            NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["show_image"],  # type: ignore
+            NavBarConfig.Widgets.SIDEBAR_TOGGLE_BUTTON["size"],  # type: ignore
         )
         self.current_image = self.hide_image
 
@@ -68,11 +64,9 @@ class NavigationBarView(ctk.CTkFrame):
             fg_color=NavBarConfig.Widgets.SETTINGS_BUTTON["fg_color"], # type: ignore
             hover_color=NavBarConfig.Widgets.SETTINGS_BUTTON["hover_color"], # type: ignore
             text=NavBarConfig.Widgets.SETTINGS_BUTTON["text"], # type: ignore
-            image=ctk.CTkImage(
-                light_image=Image.open(
-                    NavBarConfig.Widgets.SETTINGS_BUTTON["light_image"] # type: ignore
-                ),
-                size=NavBarConfig.Widgets.SETTINGS_BUTTON["size"], # type: ignore
+            image=get_image(
+                NavBarConfig.Widgets.SETTINGS_BUTTON["light_image"],  # type: ignore
+                NavBarConfig.Widgets.SETTINGS_BUTTON["size"],  # type: ignore
             ),
             anchor=NavBarConfig.Widgets.SETTINGS_BUTTON["anchor"], # type: ignore
         )
@@ -3,12 +3,12 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from tkinter import Canvas
-from PIL import Image
 import customtkinter as ctk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backends._backend_tk import NavigationToolbar2Tk
 from .configurations_view import Config
+from utils.image_cache import get_image
 
 if TYPE_CHECKING:
     from .main_view import MainView
@@ -31,6 +31,117 @@ class PlotView(ctk.CTkFrame):
         self.__initialize_figure()
         self.__create_figure_layout()
 
+    @property
+    def figure(self) -> Figure:
+        """
+        Get the matplotlib figure.
+
+        Returns:
+            Figure: The figure.
+        """
+        return self.__figure
+
+    @property
+    def canvas(self) -> FigureCanvasTkAgg:
+        """
+        Get the canvas of the figure.
+
+        Returns:
+            FigureCanvasTkAgg: The canvas.
+        """
+        return self.__canvas
+
+    @property
+    def nav_toolbar(self) -> NavigationToolbar2Tk:
+        """
+        Get the navigation toolbar of the canvas. It is not shown,
+        but operated by the buttons of the nav toolbar frame.
+
+        Returns:
+            NavigationToolbar2Tk: The nav toolbar.
+        """
+        return self.__nav_toolbar
+
+    @property
+    def plot_types_segmented_button(self) -> ctk.CTkSegmentedButton:
+        """
+        Get the segmented button of the plot types.
+
+        Returns:
+            ctk.CTkSegmentedButton: The plot types segmented button.
+        """
+        return self.__plot_types_segemented_button
+
+    @property
+    def reset_button(self) -> ctk.CTkButton:
+        """
+        Get the button resetting the view.
+
+        Returns:
+            ctk.CTkButton: The reset button.
+        """
+        return self.__reset_button
+
+    @property
+    def back_button(self) -> ctk.CTkButton:
+        """
+        Get the button going back to the previous view.
+
+        Returns:
+            ctk.CTkButton: The back button.
+        """
+        return self.__back_button
+
+    @property
+    def forward_button(self) -> ctk.CTkButton:
+        """
+        Get the button going forward to the next view.
+
+        Returns:
+            ctk.CTkButton: The forward button.
+        """
+        return self.__forward_button
+
+    @property
+    def pan_button(self) -> ctk.CTkButton:
+        """
+        Get the button toggling the pan mode.
+
+        Returns:
+            ctk.CTkButton: The pan button.
+        """
+        return self.__pan_button
+
+    @property
+    def zoom_button(self) -> ctk.CTkButton:
+        """
+        Get the button toggling the zoom mode.
+
+        Returns:
+            ctk.CTkButton: The zoom button.
+        """
+        return self.__zoom_button
+
+    @property
+    def save_button(self) -> ctk.CTkButton:
+        """
+        Get the button saving the figure.
+
+        Returns:
+            ctk.CTkButton: The save button.
+        """
+        return self.__save_button
+
+    @property
+    def legend_button(self) -> ctk.CTkButton:
+        """
+        Get the button toggling the legend.
+
+        Returns:
+            ctk.CTkButton: The legend button.
+        """
+        return self.__legend_button
+
     def __initialize_widgets(self) -> None:
         """
         Initialize widgets.
@@ -78,9 +189,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.RESET_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.RESET_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -95,9 +206,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.BACK_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.BACK_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -112,9 +223,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.FORWARD_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.FORWARD_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -129,9 +240,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.PAN_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.PAN_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -146,9 +257,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.ZOOM_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.ZOOM_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -163,9 +274,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.SAVE_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.SAVE_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -180,9 +291,9 @@ class PlotView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.LEGEND_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.LEGEND_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
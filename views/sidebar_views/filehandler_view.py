@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from PIL import Image
 import customtkinter as ctk
 from configurations.filehandler_config import FileHandlerConfig
 from utils.helper_functions import find_root
+from utils.image_cache import get_image
 from utils.input_entry_list import InputEntryList
 
 if TYPE_CHECKING:
@@ -62,11 +62,9 @@ class FileHandlerView(ctk.CTkFrame):
             fg_color=FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["fg_color"], # type: ignore
             hover_color=FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["hover_color"], # type: ignore
             text=FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["text"], # type: ignore
-            image=ctk.CTkImage(
-                light_image=Image.open(
-                    FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["light_image"] # type: ignore
-                ),
-                size=FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["size"], # type: ignore
+            image=get_image(
+                FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["light_image"],  # type: ignore
+                FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["size"],  # type: ignore
             ),
             anchor=FileHandlerConfig.Widgets.OPEN_FILE_BUTTON["anchor"], # type: ignore
         )
@@ -78,11 +76,9 @@ class FileHandlerView(ctk.CTkFrame):
             fg_color=FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["fg_color"], # type: ignore
             hover_color=FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["hover_color"], # type: ignore
             text=FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["text"], # type: ignore
-            image=ctk.CTkImage(
-                light_image=Image.open(
-                    FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["light_image"] # type: ignore
-                ),
-                size=FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["size"], # type: ignore
+            image=get_image(
+                FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["light_image"],  # type: ignore
+                FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["size"],  # type: ignore
             ),
             anchor=FileHandlerConfig.Widgets.EXPORT_TO_EXCEL_BUTTON["anchor"], # type: ignore
         )
@@ -4,7 +4,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import customtkinter as ctk
 from configurations.header_list_config import HeaderListConfig
+from utils.font_fitter import font_fitter
 from utils.select_button import SelectButton
+from utils.virtual_scrollable_frame import VirtualScrollableFrame
 
 if TYPE_CHECKING:
     from sidebar_view import SidebarView
@@ -52,8 +54,13 @@ class HeaderListView(ctk.CTkFrame):
             )
         )
 
-        self.header_scrollableframe: ctk.CTkScrollableFrame = ctk.CTkScrollableFrame(
+        # Only the visible headers get a widget, so any number of headers can be shown
+        self.header_scrollableframe: VirtualScrollableFrame = VirtualScrollableFrame(
             self,
+            row_height=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME["row_height"],  # type: ignore
+            overscan=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME["overscan"],  # type: ignore
+            row_padx=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME["row_padx"],  # type: ignore
+            batch_update=SelectButton.batch_update,
             label_text=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME["label_text"],  # type: ignore
             label_font=ctk.CTkFont(
                 family=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME["family"],  # type: ignore
@@ -65,12 +72,6 @@ class HeaderListView(ctk.CTkFrame):
             ],
         )
 
-        # Needed so widgets inside use whole width of the scrollable frame
-        self.header_scrollableframe.columnconfigure(
-            HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME["column"],
-            weight=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME["column_weight"],  # type: ignore
-        )
-
     def create_layout(self) -> None:
         """
         Create layout.
@@ -99,7 +100,8 @@ class HeaderListView(ctk.CTkFrame):
             ctk.CTkLabel: A group label.
         """
         label = ctk.CTkLabel(
-            self.header_scrollableframe,
+            self.header_scrollableframe.viewport,
+            height=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["button_height"],  # type: ignore
             anchor=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["label_anchor"],  # type: ignore
             font=ctk.CTkFont(
                 family=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["family"],  # type: ignore
@@ -110,36 +112,29 @@ class HeaderListView(ctk.CTkFrame):
 
         return label
 
-    def manage_label(self, label: ctk.CTkLabel, text: str, index: int) -> None:
+    def manage_label(self, label: ctk.CTkLabel, text: str) -> None:
         """
-        Updates the text and position of a label.
+        Updates the text of a label. It is positioned by the header_scrollableframe.
 
         Args:
-            label (ctk.CTkLabel): The label to update and grid.
+            label (ctk.CTkLabel): The label to update.
             text (str): The text that needs to be updated.
-            index (int): The index of the label in the grid.
         """
         label.configure(text=text)
-        label.grid(
-            row=index,
-            column=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME["column"],
-            sticky=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME_WIDGETS["sticky"],
-            padx=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME_WIDGETS["label_padx"],
-            pady=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME_WIDGETS["label_pady"],
-        )
 
     def add_button_to_header_scrollableframe(self) -> SelectButton:
         """
         Add a button to the header_scrollableframe.
 
         Returns:
-            SelectButton: A group label.
+            SelectButton: A header button.
         """
         button = SelectButton(
-            self.header_scrollableframe,
+            self.header_scrollableframe.viewport,
             height=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["button_height"],  # type: ignore
             corner_radius=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["button_corner_radius"],  # type: ignore
-            font=ctk.CTkFont(
+            # Buttons share their fonts, as many of them have the same size
+            font=font_fitter.get_font(
                 family=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["family"],  # type: ignore
                 size=HeaderListConfig.Widgets.HEADER_SCROLLABLEFRAME_WIDGETS["size"],  # type: ignore
             ),
@@ -147,20 +142,14 @@ class HeaderListView(ctk.CTkFrame):
 
         return button
 
-    def manage_button(self, button: SelectButton, text: str, index: int) -> None:
+    def manage_button(self, button: SelectButton, text: str, selected: bool) -> None:
         """
-        Updates the text and position of a button.
+        Updates the text and selection of a button. It is positioned by the header_scrollableframe.
 
         Args:
-            button (SelectButton): The button to update and grid.
+            button (SelectButton): The button to update.
             text (str): The text that needs to be updated.
-            index (int): The index of the button in the grid.
+            selected (bool): The selection of the header shown by the button.
         """
         button.configure(text=text)
-        button.grid(
-            row=index,
-            column=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME["column"],
-            sticky=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME_WIDGETS["sticky"],
-            padx=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME_WIDGETS["button_padx"],
-            pady=HeaderListConfig.Layout.HEADER_SCROLLABLEFRAME_WIDGETS["button_pady"],
-        )
+        button.set_selected(selected)
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from PIL import Image
 import customtkinter as ctk
 from views.configurations_view import Config
+from utils.image_cache import get_image
 
 if TYPE_CHECKING:
     from sidebar_view import SidebarView
@@ -50,9 +50,9 @@ class PresetFrameView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.OPEN_FILE_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.OPEN_FILE_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
@@ -67,9 +67,9 @@ class PresetFrameView(ctk.CTkFrame):
             fg_color=Config.Colors.TRANSPARENT,
             hover_color=Config.Colors.ONYX_LIGHT,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(Config.ImageFormats.REFRESH_PNG),
-                size=(
+            image=get_image(
+                Config.ImageFormats.REFRESH_PNG,
+                (
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                     Config.Dimensions.ACTION_IMAGE_WIDTH_HEIGHT,
                 ),
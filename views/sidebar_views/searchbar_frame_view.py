@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from PIL import Image
 import customtkinter as ctk
 from views.configurations_view import SearchbarConfig
+from utils.image_cache import get_image
 
 if TYPE_CHECKING:
     from sidebar_view import SidebarView
@@ -63,11 +63,9 @@ class SearchbarFrameView(ctk.CTkFrame):
             fg_color=SearchbarConfig.Colors.TRANSPARENT,
             hover_color=SearchbarConfig.Colors.HOVER,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(
-                    SearchbarConfig.ImageFormats.CLEAR_SEARCH_RESULT_PNG
-                ),
-                size=(
+            image=get_image(
+                SearchbarConfig.ImageFormats.CLEAR_SEARCH_RESULT_PNG,
+                (
                     SearchbarConfig.Dimensions.IMAGE_WIDTH,
                     SearchbarConfig.Dimensions.IMAGE_HEIGHT,
                 ),
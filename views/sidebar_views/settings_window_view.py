@@ -1,10 +1,10 @@
 """ Defines the SettingsWindowView class with the settings toplevel window layout. """
 
 from sys import platform
-from PIL import Image
 import customtkinter as ctk
 from views.configurations_view import SettingsWindowConfig
 from views.configurations_view import HeaderStructureFrameConfig
+from utils.image_cache import get_image
 
 
 class SettingsWindowView(ctk.CTkToplevel):
@@ -268,15 +268,7 @@ class HeaderStructureFrameView(ctk.CTkFrame):
         self.__info_label: ctk.CTkLabel = ctk.CTkLabel(
             self,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(
-                    HeaderStructureFrameConfig.ImageFormats.INFO_PNG
-                ),
-                size=(
-                    30,
-                    30,
-                ),
-            ),
+            image=get_image(HeaderStructureFrameConfig.ImageFormats.INFO_PNG, (30, 30)),
         )
 
         self.__info_box: ctk.CTkTextbox = ctk.CTkTextbox(
@@ -299,13 +291,7 @@ class HeaderStructureFrameView(ctk.CTkFrame):
         self.error_label: ctk.CTkLabel = ctk.CTkLabel(
             self,
             text="",
-            image=ctk.CTkImage(
-                light_image=Image.open(HeaderStructureFrameConfig.ImageFormats.ERROR),
-                size=(
-                    30,
-                    30,
-                ),
-            ),
+            image=get_image(HeaderStructureFrameConfig.ImageFormats.ERROR, (30, 30)),
         )
 
         self.error_box: ctk.CTkTextbox = ctk.CTkTextbox(
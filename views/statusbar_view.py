@@ -15,7 +15,7 @@ class StatusbarView(ctk.CTkFrame):
     Layout of the statusbar.
     """
 
-    __slots__ = "filesize_label", "progressbar", "progress_label"
+    __slots__ = "filesize_label", "memory_saved_label", "progressbar", "progress_label"
 
     def __init__(self, master: MainView) -> None:
         super().__init__(
@@ -44,6 +44,15 @@ class StatusbarView(ctk.CTkFrame):
             ),
         )
 
+        self.memory_saved_label: ctk.CTkLabel = ctk.CTkLabel(
+            self,
+            text=StatusbarConfig.Widgets.MEMORY_SAVED_LABEL["text"], # type: ignore
+            font=ctk.CTkFont(
+                family=StatusbarConfig.Widgets.MEMORY_SAVED_LABEL["family"], # type: ignore
+                size=StatusbarConfig.Widgets.MEMORY_SAVED_LABEL["size"], # type: ignore
+            ),
+        )
+
         self.progressbar: ctk.CTkProgressBar = ctk.CTkProgressBar(
             self, width=StatusbarConfig.Widgets.PROGRESSBAR["width"]
         )
@@ -68,3 +77,8 @@ class StatusbarView(ctk.CTkFrame):
             padx=StatusbarConfig.Layout.FILESIZE_LABEL["padx"],
             pady=StatusbarConfig.Layout.FILESIZE_LABEL["pady"],
         )
+        self.memory_saved_label.pack(
+            side=StatusbarConfig.Layout.MEMORY_SAVED_LABEL["side"],
+            padx=StatusbarConfig.Layout.MEMORY_SAVED_LABEL["padx"],
+            pady=StatusbarConfig.Layout.MEMORY_SAVED_LABEL["pady"],
+        )